@@ -19,18 +19,24 @@ The module is structured into the following submodules:
 
 - [**tools:**][prettypyplot.tools] This module provides utility methods to.
 
-"""
+- [**tex:**][prettypyplot.tex] This module provides methods to precompile
+  the LaTeX strings of figures.
+
+- [**export:**][prettypyplot.export] This module provides methods to save
+  many figures in parallel.
 
-# both are set in style submodule to default value
-MODE = None
-STYLE = None
+- [**cache:**][prettypyplot.cache] This module provides a cache to skip
+  rendering unchanged figures.
 
-# style dictionary
-STYLE_DICT = {}
+- [**pool:**][prettypyplot.pool] This module provides a pool of warm worker
+  processes to create and save figures.
+
+"""
 
 __all__ = [  # noqa: F405
     'update_style',
     'use_style',
+    'style_context',
     'add_contour',
     'text',
     'figtext',
@@ -44,26 +50,165 @@ __all__ = [  # noqa: F405
     'text_color',
 ]
 
-from importlib.metadata import version
-
-from .colors import (
-    categorical_cmap,
-    categorical_color,
-    load_cmaps,
-    load_colors,
-    text_color,
-)
-from .pyplot import (
-    colorbar,
-    grid,
-    imshow,
-    legend,
-    plot,
-    savefig,
-    show,
-)
-from .style import update_style, use_style
-from .texts import add_contour, figtext, text
-from .subplots import hide_empty_axes, label_outer, subplot_labels
-
-__version__ = version('prettypyplot')
+import contextvars
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .colors import (
+        categorical_cmap,
+        categorical_color,
+        load_cmaps,
+        load_colors,
+        text_color,
+    )
+    from .export import asavefig, savefig_async, savefig_many
+    from .pyplot import (
+        colorbar,
+        grid,
+        imshow,
+        legend,
+        plot,
+        savefig,
+        savefig_bytes,
+        show,
+        to_array,
+    )
+    from .style import style_context, update_style, use_style
+    from .texts import add_contour, figtext, text
+    from .subplots import hide_empty_axes, label_outer, subplot_labels
+
+# map of lazily loaded public names to their submodule
+_LAZY_ATTRIBUTES = {
+    'categorical_cmap': 'colors',
+    'categorical_color': 'colors',
+    'load_cmaps': 'colors',
+    'load_colors': 'colors',
+    'text_color': 'colors',
+    'colorbar': 'pyplot',
+    'grid': 'pyplot',
+    'imshow': 'pyplot',
+    'legend': 'pyplot',
+    'plot': 'pyplot',
+    'savefig': 'pyplot',
+    'savefig_bytes': 'pyplot',
+    'to_array': 'pyplot',
+    'show': 'pyplot',
+    'savefig_many': 'export',
+    'savefig_async': 'export',
+    'asavefig': 'export',
+    'update_style': 'style',
+    'use_style': 'style',
+    'style_context': 'style',
+    'add_contour': 'texts',
+    'figtext': 'texts',
+    'text': 'texts',
+    'hide_empty_axes': 'subplots',
+    'label_outer': 'subplots',
+    'subplot_labels': 'subplots',
+}
+_SUBMODULES = frozenset((
+    'cache',
+    'colors',
+    'export',
+    'pool',
+    'pyplot',
+    'style',
+    'subplots',
+    'tex',
+    'texts',
+    'tools',
+))
+
+
+# names of the style state, STYLE and MODE are set in style submodule
+_STATE_NAMES = ('STYLE', 'MODE', 'STYLE_DICT')
+
+# process-wide style state, set by use_style
+_GLOBAL_STATE = {'STYLE': None, 'MODE': None, 'STYLE_DICT': {}}
+
+# style state of the current thread or asyncio task, set by style_context
+_CONTEXT_STATE = contextvars.ContextVar('prettypyplot_state')
+
+
+def _get_state():
+    """Return style state of the current context."""
+    return _CONTEXT_STATE.get(_GLOBAL_STATE)
+
+
+def _copy_state():
+    """Return copy of the style state of the current context."""
+    state = _get_state()
+    return {**state, 'STYLE_DICT': dict(state['STYLE_DICT'])}
+
+
+def _state_property(name):
+    """Return property accessing the style state of the current context."""
+
+    def getter(module):
+        return _get_state()[name]
+
+    def setter(module, value):
+        state = _CONTEXT_STATE.get(None)
+        if state is None:
+            _GLOBAL_STATE[name] = value
+        else:
+            # copy on write, as copied contexts, e.g. of asyncio tasks, share
+            # the state dictionary
+            _CONTEXT_STATE.set({**state, name: value})
+
+    return property(getter, setter)
+
+
+class _PrettypyplotModule(types.ModuleType):
+    """Module exposing the style state of the current context as attributes.
+
+    The attributes `STYLE`, `MODE` and `STYLE_DICT` refer to the state of the
+    current thread or asyncio task within
+    [style_context][prettypyplot.style_context] and to the process-wide state
+    otherwise.
+
+    """
+
+    STYLE = _state_property('STYLE')
+    MODE = _state_property('MODE')
+    STYLE_DICT = _state_property('STYLE_DICT')
+
+
+sys.modules[__name__].__class__ = _PrettypyplotModule
+
+
+def __getattr__(name):
+    """Import submodules and their public functions on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(
+            '.{0}'.format(_LAZY_ATTRIBUTES[name]),
+            __name__,
+        )
+        attr = getattr(module, name)
+    elif name in _SUBMODULES:
+        attr = importlib.import_module('.{0}'.format(name), __name__)
+    elif name == '__version__':
+        from importlib.metadata import version
+
+        attr = version('prettypyplot')
+    else:
+        raise AttributeError(
+            'module {0!r} has no attribute {1!r}'.format(__name__, name),
+        )
+
+    # cache attribute, so __getattr__ is called only once per name
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted({
+        *globals(),
+        *_LAZY_ATTRIBUTES,
+        *_SUBMODULES,
+        *_STATE_NAMES,
+        '__version__',
+    })
@@ -1 +1,34 @@
 """Submodule conataining all colormaps."""
+
+# ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+from os import path as ospath
+
+import numpy as np
+from matplotlib import colors as clr
+
+
+# ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def _load_cmap_data(name):
+    """Load the memory-mapped (N, 3) float32 rgb table stored next to this file.
+
+    The tables are stored as binary `.npy` files, so no Python float objects
+    need to be created when loading them.
+
+    """
+    module_dir = ospath.dirname(__file__)
+    return np.load(
+        ospath.join(module_dir, '{0}.npy'.format(name)),
+        mmap_mode='r',
+    )
+
+
+def _continuous_cmap(name):
+    """Return ListedColormap of the rgb table which is a continuous colormap.
+
+    The colormap is flagged, so that `categorical_cmap` samples it
+    equidistantly instead of taking its colors one by one.
+
+    """
+    cmap = clr.ListedColormap(_load_cmap_data(name), name=name)
+    cmap._pplt_categorical = False
+    return cmap
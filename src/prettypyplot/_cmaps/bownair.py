@@ -9,268 +9,9 @@ All rights reserved.
 """
 
 # ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-from matplotlib import colors as clr
-
-# ~~~ CMAP ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-CM_BOWNAIR_DATA = [
-    [0.16847826, 0.00374452, 0.02178212],
-    [0.17181190, 0.00639699, 0.02866575],
-    [0.17513005, 0.00915857, 0.03622388],
-    [0.17835189, 0.01209317, 0.04460886],
-    [0.18149123, 0.01519230, 0.05300678],
-    [0.18454566, 0.01845916, 0.06139409],
-    [0.18752516, 0.02188758, 0.06975247],
-    [0.19043090, 0.02547730, 0.07810030],
-    [0.19326537, 0.02922647, 0.08644900],
-    [0.19603426, 0.03313045, 0.09479670],
-    [0.19874344, 0.03718384, 0.10314165],
-    [0.20140164, 0.04135723, 0.11147198],
-    [0.20401441, 0.04543721, 0.11978943],
-    [0.20658990, 0.04940739, 0.12808649],
-    [0.20913583, 0.05327400, 0.13635792],
-    [0.21165368, 0.05704406, 0.14462344],
-    [0.21414095, 0.06072351, 0.15291972],
-    [0.21661767, 0.06431004, 0.16119316],
-    [0.21908970, 0.06780640, 0.16944515],
-    [0.22154115, 0.07121747, 0.17776893],
-    [0.22399654, 0.07454044, 0.18608741],
-    [0.22645984, 0.07777702, 0.19440593],
-    [0.22891436, 0.08092686, 0.20282604],
-    [0.23138734, 0.08399108, 0.21124394],
-    [0.23386559, 0.08696780, 0.21974470],
-    [0.23635594, 0.08985689, 0.22831609],
-    [0.23886604, 0.09266043, 0.23693405],
-    [0.24138320, 0.09537084, 0.24569063],
-    [0.24392759, 0.09799814, 0.25447913],
-    [0.24647675, 0.10052424, 0.26346163],
-    [0.24905500, 0.10296712, 0.27248599],
-    [0.25164262, 0.10530464, 0.28171067],
-    [0.25425225, 0.10756775, 0.29098012],
-    [0.25684304, 0.10979324, 0.30030637],
-    [0.25943491, 0.11192620, 0.30981767],
-    [0.26200471, 0.11401447, 0.31942093],
-    [0.26456948, 0.11601477, 0.32920816],
-    [0.26711246, 0.11795986, 0.33911760],
-    [0.26964110, 0.11982647, 0.34920016],
-    [0.27215062, 0.12161994, 0.35944751],
-    [0.27463323, 0.12335218, 0.36983941],
-    [0.27710265, 0.12498463, 0.38045109],
-    [0.27952818, 0.12658196, 0.39116322],
-    [0.28194101, 0.12806128, 0.40213359],
-    [0.28430527, 0.12950072, 0.41321878],
-    [0.28664175, 0.13084297, 0.42452335],
-    [0.28894288, 0.13209437, 0.43603821],
-    [0.29118728, 0.13329898, 0.44768637],
-    [0.29340122, 0.13438170, 0.45959755],
-    [0.29555084, 0.13541350, 0.47165348],
-    [0.29764521, 0.13636304, 0.48390565],
-    [0.29969341, 0.13718949, 0.49642368],
-    [0.30165381, 0.13799049, 0.50904848],
-    [0.30354725, 0.13869788, 0.52189067],
-    [0.30537402, 0.13928980, 0.53498699],
-    [0.30709750, 0.13985321, 0.54820273],
-    [0.30872314, 0.14035574, 0.56159178],
-    [0.31025507, 0.14076542, 0.57520380],
-    [0.31168028, 0.14109708, 0.58901916],
-    [0.31294913, 0.14147273, 0.60287290],
-    [0.31408683, 0.14179774, 0.61690465],
-    [0.31507778, 0.14209124, 0.63109505],
-    [0.31590491, 0.14237784, 0.64541866],
-    [0.31653571, 0.14272962, 0.65979204],
-    [0.31694372, 0.14320067, 0.67416073],
-    [0.31712569, 0.14376866, 0.68856930],
-    [0.31705509, 0.14447833, 0.70297972],
-    [0.31670571, 0.14538501, 0.71733626],
-    [0.31604496, 0.14654386, 0.73159391],
-    [0.31504173, 0.14801985, 0.74568691],
-    [0.31365958, 0.14987715, 0.75955494],
-    [0.31186097, 0.15218175, 0.77312886],
-    [0.30960736, 0.15499729, 0.78633386],
-    [0.30685828, 0.15838061, 0.79909427],
-    [0.30357279, 0.16237860, 0.81133277],
-    [0.29971020, 0.16702454, 0.82297260],
-    [0.29521293, 0.17240093, 0.83385157],
-    [0.28990071, 0.17891028, 0.84336556],
-    [0.28369122, 0.18659022, 0.85130978],
-    [0.27656102, 0.19540533, 0.85747186],
-    [0.26853994, 0.20523601, 0.86169354],
-    [0.25970964, 0.21588941, 0.86390328],
-    [0.25020229, 0.22712327, 0.86413054],
-    [0.24017865, 0.23872048, 0.86241634],
-    [0.22982350, 0.25042893, 0.85897583],
-    [0.21932140, 0.26199220, 0.85418804],
-    [0.20883071, 0.27326674, 0.84831545],
-    [0.19848146, 0.28416040, 0.84160280],
-    [0.18837978, 0.29462091, 0.83426733],
-    [0.17861607, 0.30462327, 0.82649913],
-    [0.16928122, 0.31418531, 0.81837309],
-    [0.16045680, 0.32332466, 0.80997235],
-    [0.15218853, 0.33202900, 0.80151160],
-    [0.14452660, 0.34031900, 0.79308858],
-    [0.13750977, 0.34821959, 0.78478158],
-    [0.13126345, 0.35579807, 0.77643169],
-    [0.12580908, 0.36305944, 0.76816838],
-    [0.12110974, 0.37000406, 0.76016595],
-    [0.11726804, 0.37667907, 0.75230554],
-    [0.11435250, 0.38311888, 0.74451596],
-    [0.11219571, 0.38930454, 0.73707898],
-    [0.11097645, 0.39529548, 0.72971088],
-    [0.11055315, 0.40108763, 0.72257569],
-    [0.11082187, 0.40669198, 0.71573463],
-    [0.11195531, 0.41214785, 0.70894118],
-    [0.11354220, 0.41743736, 0.70254308],
-    [0.11592755, 0.42260560, 0.69613939],
-    [0.11863127, 0.42763475, 0.69011225],
-    [0.12191780, 0.43255636, 0.68415276],
-    [0.12543942, 0.43736526, 0.67850619],
-    [0.12937906, 0.44208246, 0.67295106],
-    [0.13345066, 0.44670623, 0.66768720],
-    [0.13783327, 0.45125314, 0.66250765],
-    [0.14223395, 0.45572272, 0.65762322],
-    [0.14689072, 0.46012925, 0.65278711],
-    [0.15144773, 0.46447196, 0.64827444],
-    [0.15624791, 0.46876372, 0.64375308],
-    [0.16089617, 0.47300375, 0.63954715],
-    [0.16567209, 0.47720123, 0.63538249],
-    [0.17033712, 0.48136141, 0.63143186],
-    [0.17491613, 0.48548826, 0.62766445],
-    [0.17939608, 0.48959017, 0.62404655],
-    [0.18373229, 0.49367664, 0.62056440],
-    [0.18800574, 0.49773781, 0.61723191],
-    [0.19208531, 0.50179715, 0.61400999],
-    [0.19613115, 0.50583204, 0.61092988],
-    [0.19997671, 0.50987111, 0.60794778],
-    [0.20374262, 0.51389761, 0.60508479],
-    [0.20733924, 0.51792814, 0.60231348],
-    [0.21081491, 0.52195732, 0.59963631],
-    [0.21414994, 0.52599018, 0.59704353],
-    [0.21732734, 0.53003145, 0.59452420],
-    [0.22039107, 0.53407597, 0.59207964],
-    [0.22326457, 0.53813789, 0.58968633],
-    [0.22604978, 0.54220268, 0.58735525],
-    [0.22861661, 0.54629273, 0.58505376],
-    [0.23112003, 0.55038471, 0.58280357],
-    [0.23338627, 0.55450801, 0.58056207],
-    [0.23560399, 0.55863372, 0.57835664],
-    [0.23758757, 0.56279294, 0.57614231],
-    [0.23951266, 0.56695877, 0.57394342],
-    [0.24122073, 0.57115774, 0.57171963],
-    [0.24286689, 0.57536618, 0.56949100],
-    [0.24431185, 0.57960726, 0.56722110],
-    [0.24569933, 0.58385906, 0.56492833],
-    [0.24689977, 0.58814300, 0.56257731],
-    [0.24805494, 0.59243749, 0.56018631],
-    [0.24903500, 0.59676373, 0.55771935],
-    [0.24999053, 0.60109885, 0.55519719],
-    [0.25078013, 0.60546559, 0.55258086],
-    [0.25157503, 0.60983799, 0.54989649],
-    [0.25220973, 0.61424225, 0.54709922],
-    [0.25288909, 0.61864743, 0.54422379],
-    [0.25341045, 0.62308513, 0.54121622],
-    [0.25402422, 0.62751778, 0.53812320],
-    [0.25450709, 0.63197978, 0.53488482],
-    [0.25508165, 0.63643811, 0.53154327],
-    [0.25558378, 0.64091800, 0.52805040],
-    [0.25617011, 0.64539654, 0.52443547],
-    [0.25675400, 0.64988715, 0.52066864],
-    [0.25740671, 0.65437983, 0.51675884],
-    [0.25813718, 0.65887380, 0.51269995],
-    [0.25891225, 0.66337443, 0.50847460],
-    [0.25985504, 0.66786438, 0.50410603],
-    [0.26080803, 0.67236699, 0.49954272],
-    [0.26202939, 0.67684530, 0.49484904],
-    [0.26329551, 0.68133200, 0.48995404],
-    [0.26478250, 0.68580210, 0.48489978],
-    [0.26642444, 0.69026558, 0.47965619],
-    [0.26822779, 0.69472155, 0.47421919],
-    [0.27030593, 0.69915389, 0.46861615],
-    [0.27250802, 0.70358450, 0.46278875],
-    [0.27504035, 0.70798358, 0.45679646],
-    [0.27775876, 0.71237166, 0.45058531],
-    [0.28071608, 0.71674106, 0.44416110],
-    [0.28399278, 0.72107947, 0.43754643],
-    [0.28745636, 0.72540576, 0.43068510],
-    [0.29127420, 0.72969476, 0.42362758],
-    [0.29534635, 0.73396010, 0.41633212],
-    [0.29964997, 0.73820467, 0.40877357],
-    [0.30435011, 0.74240201, 0.40101615],
-    [0.30940596, 0.74656049, 0.39296172],
-    [0.31496619, 0.75065599, 0.38464410],
-    [0.32120896, 0.75465585, 0.37616512],
-    [0.32793489, 0.75859090, 0.36735768],
-    [0.33518933, 0.76245002, 0.35822794],
-    [0.34322496, 0.76618214, 0.34898633],
-    [0.35185976, 0.76981469, 0.33945219],
-    [0.36111698, 0.77333705, 0.32962930],
-    [0.37103197, 0.77673486, 0.31954446],
-    [0.38163927, 0.77999210, 0.30924087],
-    [0.39304708, 0.78307553, 0.29886549],
-    [0.40515249, 0.78599344, 0.28834807],
-    [0.41796399, 0.78873045, 0.27775784],
-    [0.43146794, 0.79127335, 0.26719753],
-    [0.44563530, 0.79361115, 0.25678960],
-    [0.46041211, 0.79573720, 0.24668765],
-    [0.47571931, 0.79765059, 0.23707232],
-    [0.49145372, 0.79935723, 0.22814483],
-    [0.50749373, 0.80087025, 0.22011348],
-    [0.52370836, 0.80220923, 0.21317549],
-    [0.53996809, 0.80339856, 0.20749711],
-    [0.55615511, 0.80446514, 0.20319612],
-    [0.57217467, 0.80543474, 0.20034325],
-    [0.58794034, 0.80633629, 0.19889815],
-    [0.60341071, 0.80718821, 0.19883953],
-    [0.61855394, 0.80800923, 0.20005264],
-    [0.63334579, 0.80881669, 0.20240989],
-    [0.64779176, 0.80961993, 0.20576568],
-    [0.66188221, 0.81043249, 0.20997354],
-    [0.67563516, 0.81125940, 0.21489117],
-    [0.68906086, 0.81210732, 0.22038738],
-    [0.70222042, 0.81295992, 0.22655394],
-    [0.71510807, 0.81382898, 0.23319956],
-    [0.72771483, 0.81472820, 0.24012442],
-    [0.74005803, 0.81565892, 0.24726245],
-    [0.75222645, 0.81658565, 0.25490281],
-    [0.76416034, 0.81754594, 0.26262308],
-    [0.77603378, 0.81847840, 0.27049613],
-    [0.78772624, 0.81944448, 0.27806905],
-    [0.79939622, 0.82038474, 0.28545829],
-    [0.81104624, 0.82129923, 0.29266749],
-    [0.82257981, 0.82222894, 0.29963798],
-    [0.83406916, 0.82314639, 0.30641924],
-    [0.84554195, 0.82404135, 0.31302832],
-    [0.85700332, 0.82491271, 0.31946461],
-    [0.86844364, 0.82576570, 0.32572013],
-    [0.87986807, 0.82659942, 0.33179058],
-    [0.89127720, 0.82741498, 0.33766706],
-    [0.90268144, 0.82820927, 0.34333955],
-    [0.91409311, 0.82897834, 0.34879213],
-    [0.92555578, 0.82970402, 0.35400655],
-    [0.93713747, 0.83035643, 0.35895168],
-    [0.94873006, 0.83099215, 0.36344852],
-    [0.96055280, 0.83151793, 0.36730407],
-    [0.97285365, 0.83186306, 0.36941660],
-    [0.97899830, 0.83553127, 0.36291755],
-    [0.97842590, 0.84227753, 0.35935994],
-    [0.97727325, 0.84923911, 0.35679088],
-    [0.97582193, 0.85632577, 0.35413154],
-    [0.97445871, 0.86337424, 0.35096633],
-    [0.97321430, 0.87037492, 0.34722051],
-    [0.97210886, 0.87732343, 0.34281289],
-    [0.97119386, 0.88420255, 0.33763496],
-    [0.97051118, 0.89100047, 0.33155394],
-    [0.97011917, 0.89769918, 0.32440745],
-    [0.97013787, 0.90425598, 0.31597881],
-    [0.97067738, 0.91063403, 0.30600259],
-    [0.97193883, 0.91675960, 0.29413390],
-    [0.97417343, 0.92253802, 0.27996762],
-    [0.97767500, 0.92785315, 0.26308989],
-    [0.98273569, 0.93258022, 0.24317162],
-    [0.98831361, 0.93712240, 0.22071250],
-    [0.99393602, 0.94166378, 0.19545245],
-    [0.99960697, 0.94620448, 0.16604763],
-    [1.00000000, 0.95120448, 0.13604763],
-]
+from prettypyplot._cmaps import _continuous_cmap
 
 
+# ~~~ CMAP ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 def _bownair():
-    return clr.LinearSegmentedColormap.from_list('bownair', CM_BOWNAIR_DATA)
+    return _continuous_cmap('bownair')
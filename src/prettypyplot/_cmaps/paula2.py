@@ -10,268 +10,9 @@ All rights reserved.
 """
 
 # ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-from matplotlib import colors as clr
-
-# ~~~ CMAP ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-CM_PAULA2_DATA = [
-    '#fec21f',
-    '#fec11f',
-    '#fec01f',
-    '#febf1e',
-    '#febf1e',
-    '#fdbe1e',
-    '#fdbd1e',
-    '#fdbc1d',
-    '#fdbb1d',
-    '#fdba1d',
-    '#fdb91d',
-    '#fdb91d',
-    '#fdb81c',
-    '#fcb71c',
-    '#fcb61c',
-    '#fcb51c',
-    '#fcb41c',
-    '#fcb31b',
-    '#fcb21b',
-    '#fcb21b',
-    '#fbb11b',
-    '#fbb01b',
-    '#fbaf1a',
-    '#fbae1a',
-    '#fbad1a',
-    '#fbac1a',
-    '#fbab1a',
-    '#faab19',
-    '#faaa19',
-    '#faa919',
-    '#faa819',
-    '#faa719',
-    '#faa619',
-    '#f9a518',
-    '#f9a418',
-    '#f9a318',
-    '#f9a318',
-    '#f9a218',
-    '#f9a117',
-    '#f9a017',
-    '#f89f17',
-    '#f89e17',
-    '#f89d17',
-    '#f89c17',
-    '#f89b17',
-    '#f89b16',
-    '#f79a16',
-    '#f79916',
-    '#f79816',
-    '#f79716',
-    '#f79616',
-    '#f79515',
-    '#f69415',
-    '#f69315',
-    '#f69215',
-    '#f69215',
-    '#f69115',
-    '#f59015',
-    '#f58f15',
-    '#f58e14',
-    '#f58d14',
-    '#f58c14',
-    '#f58b14',
-    '#f48a14',
-    '#f48914',
-    '#f48814',
-    '#f48714',
-    '#f48713',
-    '#f38613',
-    '#f38513',
-    '#f38413',
-    '#f38313',
-    '#f38213',
-    '#f28113',
-    '#f28013',
-    '#f27f13',
-    '#f27e13',
-    '#f27d12',
-    '#f17c12',
-    '#f17b12',
-    '#f17a12',
-    '#f17912',
-    '#f17812',
-    '#f07712',
-    '#f07612',
-    '#f07512',
-    '#f07412',
-    '#f07312',
-    '#ef7212',
-    '#ef7112',
-    '#ef7012',
-    '#ef6f11',
-    '#ef6e11',
-    '#ee6d11',
-    '#ee6c11',
-    '#ee6b11',
-    '#ee6a11',
-    '#ee6911',
-    '#ed6811',
-    '#ed6711',
-    '#ed6611',
-    '#ed6511',
-    '#ec6411',
-    '#ec6311',
-    '#ec6211',
-    '#ec6111',
-    '#ec6011',
-    '#eb5f11',
-    '#eb5e11',
-    '#eb5d11',
-    '#eb5c11',
-    '#ea5a11',
-    '#ea5911',
-    '#ea5811',
-    '#ea5711',
-    '#e95611',
-    '#e95511',
-    '#e95411',
-    '#e95211',
-    '#e95111',
-    '#e85011',
-    '#e84f11',
-    '#e84e11',
-    '#e84c11',
-    '#e74b11',
-    '#e74a11',
-    '#e74911',
-    '#e74711',
-    '#e64611',
-    '#e64511',
-    '#e64311',
-    '#e64211',
-    '#e54111',
-    '#e53f11',
-    '#e53e11',
-    '#e53c11',
-    '#e43b11',
-    '#e43911',
-    '#e43811',
-    '#e43611',
-    '#e33511',
-    '#e33311',
-    '#e33111',
-    '#e33011',
-    '#e22e11',
-    '#e22c11',
-    '#e22a11',
-    '#e22811',
-    '#e12612',
-    '#e12312',
-    '#e12112',
-    '#e11f12',
-    '#e01c12',
-    '#e01912',
-    '#e01612',
-    '#e01212',
-    '#df0d12',
-    '#df052d',
-    '#dd0638',
-    '#db073e',
-    '#da0842',
-    '#d80a46',
-    '#d60b49',
-    '#d50c4c',
-    '#d30d4e',
-    '#d20e51',
-    '#d00f53',
-    '#cf1055',
-    '#ce1156',
-    '#cc1258',
-    '#cb135a',
-    '#c9145b',
-    '#c8145c',
-    '#c6155e',
-    '#c5165f',
-    '#c31660',
-    '#c21761',
-    '#c01862',
-    '#bf1863',
-    '#bd1964',
-    '#bc1965',
-    '#bb1a66',
-    '#b91a67',
-    '#b81b68',
-    '#b61b69',
-    '#b51c6a',
-    '#b31c6a',
-    '#b21d6b',
-    '#b01d6c',
-    '#af1e6d',
-    '#ad1e6d',
-    '#ac1e6e',
-    '#ab1f6e',
-    '#a91f6f',
-    '#a81f70',
-    '#a62070',
-    '#a52071',
-    '#a32071',
-    '#a22172',
-    '#a02172',
-    '#9f2173',
-    '#9e2273',
-    '#9c2274',
-    '#9b2274',
-    '#992274',
-    '#982375',
-    '#962375',
-    '#952376',
-    '#932376',
-    '#922476',
-    '#912477',
-    '#8f2477',
-    '#8e2477',
-    '#8c2477',
-    '#8b2578',
-    '#892578',
-    '#882578',
-    '#862579',
-    '#852579',
-    '#832579',
-    '#822679',
-    '#80267a',
-    '#7f267a',
-    '#7d267a',
-    '#7c267a',
-    '#7a267a',
-    '#79267a',
-    '#77277b',
-    '#76277b',
-    '#74277b',
-    '#73277b',
-    '#71277b',
-    '#70277b',
-    '#6e277c',
-    '#6d277c',
-    '#6b277c',
-    '#6a277c',
-    '#68277c',
-    '#67277c',
-    '#65287c',
-    '#63287c',
-    '#62287c',
-    '#60287c',
-    '#5e287d',
-    '#5d287d',
-    '#5b287d',
-    '#5a287d',
-    '#58287d',
-    '#56287d',
-    '#55287d',
-    '#53287d',
-    '#51287d',
-    '#4f287d',
-    '#4e287d',
-    '#4c287d',
-    '#4a287d',
-]
+from prettypyplot._cmaps import _continuous_cmap
 
 
+# ~~~ CMAP ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 def _paula2():
-    return clr.LinearSegmentedColormap.from_list('paula2', CM_PAULA2_DATA)
+    return _continuous_cmap('paula2')
@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+# BSD 3-Clause License
+# Copyright (c) 2020-2023, Daniel Nagel
+# All rights reserved.
+"""Benchmarks to track the performance of prettypyplot across releases.
+
+The benchmarks can be executed from the command line and print their results
+as JSON, e.g.
+
+```bash
+python -m prettypyplot.bench startup --repeat 10 > startup.json
+```
+
+All timings are given in seconds. Cold timings are measured in a fresh
+interpreter, warm timings are the median of repeated calls in this process.
+
+"""
+
+# ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+# code template to time a statement in a fresh interpreter
+_TIMER_TEMPLATE = """
+import time
+{setup}
+start = time.perf_counter()
+{stmt}
+print(time.perf_counter() - start)
+"""
+
+
+# ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def startup(repeat=5):
+    """Benchmark the startup cost of prettypyplot.
+
+    Measures the import time of `prettypyplot` and its submodules parsed from
+    `python -X importtime`, the cold and warm duration of `use_style()` for
+    every combination of [Style][prettypyplot.style.Style] and
+    [Mode][prettypyplot.style.Mode], as well as `load_cmaps()` and
+    `load_colors()`.
+
+    Parameters
+    ----------
+    repeat : int, optional
+        Number of repetitions, the median of all runs is reported.
+
+    Returns
+    -------
+    results : dict
+        Dictionary holding all timings in seconds.
+
+    """
+    from prettypyplot import colors as pclr
+    from prettypyplot import style as pstyle
+
+    setup_mpl = 'import matplotlib.pyplot'
+    results = {
+        'import': _importtime('import prettypyplot', repeat=repeat),
+        'import_use_style': _importtime(
+            'from prettypyplot import use_style',
+            repeat=repeat,
+        ),
+        'cold': {
+            'use_style': _time_cold(
+                'import prettypyplot',
+                'prettypyplot.use_style()',
+                repeat=repeat,
+            ),
+            'load_cmaps': _time_cold(
+                '{0}\nfrom prettypyplot import colors'.format(setup_mpl),
+                'colors.load_cmaps()',
+                repeat=repeat,
+            ),
+            'load_colors': _time_cold(
+                '{0}\nfrom prettypyplot import colors'.format(setup_mpl),
+                'colors.load_colors()',
+                repeat=repeat,
+            ),
+        },
+    }
+    with _restore_style():
+        results['warm'] = {
+            'use_style': {
+                '{0}-{1}'.format(style.name, mode.name).lower(): _time_warm(
+                    lambda: pstyle.use_style(style=style, mode=mode),
+                    repeat=repeat,
+                )
+                for style in pstyle.Style
+                for mode in pstyle.Mode
+            },
+            'load_cmaps': _time_warm(pclr.load_cmaps, repeat=repeat),
+            'load_colors': _time_warm(pclr.load_colors, repeat=repeat),
+        }
+    return results
+
+
+def colors(repeat=5):
+    """Benchmark the registration and lookup of the named colors.
+
+    Measures the duration of `load_colors()`, of `use_style()` followed by
+    resolving all `pplt:` colors, and of resolving the colors alone.
+
+    Parameters
+    ----------
+    repeat : int, optional
+        Number of repetitions, the median of all runs is reported.
+
+    Returns
+    -------
+    results : dict
+        Dictionary holding all timings in seconds.
+
+    """
+    from matplotlib import colors as clr
+
+    from prettypyplot import colors as pclr
+    from prettypyplot import style as pstyle
+
+    names = [
+        name for name in clr.get_named_colors_mapping() if name.startswith('pplt:')
+    ]
+
+    def lookup():
+        for name in names:
+            clr.to_rgba(name)
+
+    def use_style_lookup():
+        pstyle.use_style()
+        lookup()
+
+    with _restore_style():
+        pstyle.use_style()
+        return {
+            'load_colors': _time_warm(pclr.load_colors, repeat=repeat),
+            'use_style_lookup': _time_warm(use_style_lookup, repeat=repeat),
+            'lookup': _time_warm(lookup, repeat=repeat),
+        }
+
+
+def latex(repeat=5):
+    """Benchmark rendering a typical figure with LaTeX and with mathtext.
+
+    Measures the duration of the first and of repeated renderings of a figure
+    with several axes, labels and a legend to png, once with `latex=True` and
+    once with `latex='fast'`. If no LaTeX installation is found, the results of
+    `latex=True` are `None`.
+
+    Parameters
+    ----------
+    repeat : int, optional
+        Number of repetitions, the median of all runs is reported.
+
+    Returns
+    -------
+    results : dict
+        Dictionary holding all timings in seconds.
+
+    """
+    import shutil
+
+    from prettypyplot import style as pstyle
+
+    results = {}
+    with _restore_style():
+        for name, latex_option in (('usetex', True), ('mathtext', 'fast')):
+            if latex_option is True and not (
+                shutil.which('latex') and shutil.which('dvipng')
+            ):
+                results[name] = None
+                continue
+
+            pstyle.use_style(latex=latex_option)
+            start = time.perf_counter()
+            _render_figure()
+            results[name] = {
+                'first': time.perf_counter() - start,
+                'warm': _time_warm(_render_figure, repeat=repeat),
+            }
+    return results
+
+
+def profiles(repeat=5):
+    """Benchmark the export profiles of savefig.
+
+    Measures the duration and the file size of saving a figure with dense
+    line plots to png and pdf for each
+    [Profile][prettypyplot.style.Profile].
+
+    Parameters
+    ----------
+    repeat : int, optional
+        Number of repetitions, the median of all runs is reported.
+
+    Returns
+    -------
+    results : dict
+        Dictionary holding the timings in seconds and the sizes in bytes.
+
+    """
+    import numpy as np
+    from matplotlib import pyplot as plt
+
+    from prettypyplot import pyplot as ppyplot
+    from prettypyplot import style as pstyle
+
+    results = {}
+    with _restore_style():
+        pstyle.use_style()
+        fig, axs = plt.subplots(1, 2)
+        rng = np.random.default_rng(42)
+        for ax in axs:
+            ax.plot(np.cumsum(rng.normal(size=(20000, 3)), axis=0))
+            ax.set_xlabel('time $t$ / s')
+        try:
+            for profile in pstyle.Profile:
+                for fmt in ('png', 'pdf'):
+
+                    def save(profile=profile, fmt=fmt):
+                        return ppyplot.savefig_bytes(fig, format=fmt, profile=profile)
+
+                    results['{0}-{1}'.format(profile.name.lower(), fmt)] = {
+                        'time': _time_warm(save, repeat=repeat),
+                        'size': len(save()),
+                    }
+        finally:
+            plt.close(fig)
+    return results
+
+
+def threads(repeat=5, max_threads=None):
+    """Benchmark rendering independent figures on a pool of threads.
+
+    Measures the duration of creating and saving a batch of figures to png
+    with a [RenderPool][prettypyplot.pool.RenderPool] of 1 to `max_threads`
+    threads and the speedup relative to a single thread. A speedup is only
+    expected on free-threaded Python builds, e.g. 3.13t or 3.14t, which is
+    reported by `gil_enabled`.
+
+    Parameters
+    ----------
+    repeat : int, optional
+        Number of repetitions, the median of all runs is reported.
+    max_threads : int, optional
+        Maximal number of threads. Default is the number of CPUs.
+
+    Returns
+    -------
+    results : dict
+        Dictionary holding the timings in seconds and the speedups.
+
+    """
+    from prettypyplot import pool as ppool
+    from prettypyplot import style as pstyle
+
+    if max_threads is None:
+        max_threads = os.cpu_count() or 1
+    n_threads = sorted({
+        *(2**exp for exp in range(max_threads.bit_length())),
+        max_threads,
+    })
+    n_figures = 2 * max_threads
+
+    timings = {}
+    with _restore_style():
+        pstyle.use_style()
+        for n_thread in n_threads:
+            with ppool.RenderPool(n_thread, executor='thread') as render_pool:
+
+                def render(render_pool=render_pool):
+                    for result in render_pool.map(_thread_figure, range(n_figures)):
+                        if result.error is not None:
+                            raise result.error
+
+                timings[n_thread] = _time_warm(render, repeat=repeat)
+
+    return {
+        'gil_enabled': _gil_enabled(),
+        'n_figures': n_figures,
+        'threads': {
+            str(n_thread): {'time': timing, 'speedup': timings[1] / timing}
+            for n_thread, timing in timings.items()
+        },
+    }
+
+
+def _thread_figure(seed):
+    """Create a figure with dense line plots without pyplot."""
+    import numpy as np
+    from matplotlib.figure import Figure
+
+    from prettypyplot import pyplot as ppyplot
+
+    fig = Figure()
+    axs = fig.subplots(1, 2)
+    rng = np.random.default_rng(seed)
+    for ax in axs:
+        ppyplot.plot(np.cumsum(rng.normal(size=(1000, 3)), axis=0), ax=ax)
+        # mathtext is avoided, because its parser is not thread-safe
+        ax.set_xlabel('time / s')
+    return fig
+
+
+def _gil_enabled():
+    """Return if the GIL is enabled, always True before Python 3.13."""
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def _render_figure():
+    """Render a figure with several axes, labels and a legend to png."""
+    import io
+
+    import numpy as np
+    from matplotlib import pyplot as plt
+
+    fig, axs = plt.subplots(2, 2)
+    xs = np.linspace(0, 2 * np.pi, 50)
+    for idx, ax in enumerate(axs.flatten()):
+        for shift in range(3):
+            ax.plot(
+                xs,
+                (idx + 1) * np.sin(xs + shift),
+                label=r'$\sin(x + {0})$'.format(shift),
+            )
+        ax.set_xlabel(r'time $t$ / s')
+        ax.set_ylabel(r'amplitude $A_{0}$'.format(idx))
+    axs[0, 0].legend()
+    fig.savefig(io.BytesIO(), format='png')
+    plt.close(fig)
+
+
+@contextlib.contextmanager
+def _restore_style():
+    """Restore rcParams and the prettypyplot style after benchmarking."""
+    import matplotlib as mpl
+
+    import prettypyplot as pplt
+
+    style, mode, style_dict = pplt.STYLE, pplt.MODE, pplt.STYLE_DICT.copy()
+    try:
+        with mpl.rc_context():
+            yield
+    finally:
+        pplt.STYLE, pplt.MODE = style, mode
+        pplt.STYLE_DICT = style_dict
+
+
+def _metadata():
+    """Return versions and platform of the current environment."""
+    import matplotlib as mpl
+    import numpy as np
+
+    import prettypyplot as pplt
+
+    return {
+        'prettypyplot': pplt.__version__,
+        'matplotlib': mpl.__version__,
+        'numpy': np.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'gil_enabled': _gil_enabled(),
+        'backend': mpl.get_backend(),
+    }
+
+
+def _run_python(code, *args):
+    """Run code in a fresh interpreter with Agg backend."""
+    env = {**os.environ, 'MPLBACKEND': 'Agg'}
+    return subprocess.run(
+        [sys.executable, *args, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def _time_cold(setup, stmt, *, repeat):
+    """Return the median duration of stmt in fresh interpreters."""
+    code = _TIMER_TEMPLATE.format(setup=setup, stmt=stmt)
+    return statistics.median(float(_run_python(code).stdout) for _ in range(repeat))
+
+
+def _time_warm(func, *, repeat):
+    """Return the median duration of func after a warm-up call."""
+    func()
+    return statistics.median(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def _importtime(stmt, *, repeat):
+    """Return the median import times of prettypyplot and its dependencies.
+
+    Parameters
+    ----------
+    stmt : str
+        The import statement to measure.
+    repeat : int
+        Number of fresh interpreters to measure.
+
+    Returns
+    -------
+    importtimes : dict
+        Total duration and cumulative duration of prettypyplot and its main
+        dependencies in seconds.
+
+    """
+    modules = ('prettypyplot', 'matplotlib', 'matplotlib.pyplot', 'numpy')
+    runs = [
+        _parse_importtime(_run_python(stmt, '-X', 'importtime').stderr)
+        for _ in range(repeat)
+    ]
+    results = {
+        'total': statistics.median(
+            sum(self_time for self_time, _ in run.values()) for run in runs
+        ),
+    }
+    for module in sorted({mod for run in runs for mod in run}):
+        if module in modules or module.startswith('prettypyplot.'):
+            results[module] = statistics.median(
+                run[module][1] if module in run else 0 for run in runs
+            )
+    return results
+
+
+def _parse_importtime(stderr):
+    """Parse output of `python -X importtime`.
+
+    Parameters
+    ----------
+    stderr : str
+        Output of importtime with lines 'import time: self | cumulative | name'.
+
+    Returns
+    -------
+    importtimes : dict
+        Dictionary mapping the module names to their self and cumulative
+        import time in seconds.
+
+    """
+    importtimes = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_time, cumulative_time, module = line[len('import time:') :].split('|')
+        if cumulative_time.strip().isdigit():
+            importtimes[module.strip()] = (
+                int(self_time) * 1e-6,
+                int(cumulative_time) * 1e-6,
+            )
+    return importtimes
+
+
+# available benchmarks of the command line interface
+BENCHMARKS = {
+    'startup': startup,
+    'colors': colors,
+    'latex': latex,
+    'profiles': profiles,
+    'threads': threads,
+}
+
+
+def main(argv=None):
+    """Run benchmarks from the command line and print results as JSON."""
+    parser = argparse.ArgumentParser(
+        prog='python -m prettypyplot.bench',
+        description='Benchmark prettypyplot and print the results as JSON.',
+    )
+    parser.add_argument(
+        'benchmark',
+        choices=list(BENCHMARKS),
+        help='Name of the benchmark to run.',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of repetitions, the median is reported. Default: 5.',
+    )
+    parser.add_argument(
+        '--output',
+        default=None,
+        help='Write JSON to this file instead of stdout.',
+    )
+    args = parser.parse_args(argv)
+
+    import matplotlib as mpl
+
+    mpl.use('Agg')
+
+    results = {
+        'benchmark': args.benchmark,
+        'repeat': args.repeat,
+        'metadata': _metadata(),
+        'results': BENCHMARKS[args.benchmark](repeat=args.repeat),
+    }
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, 'w') as fh:
+            fh.write('{0}\n'.format(output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
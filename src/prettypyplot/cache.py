@@ -0,0 +1,501 @@
+# -*- coding: utf-8 -*-
+# BSD 3-Clause License
+# Copyright (c) 2020-2023, Daniel Nagel
+# All rights reserved.
+"""Content-addressed cache of saved figures.
+
+Passing a [RenderCache][prettypyplot.cache.RenderCache] to
+[savefig][prettypyplot.savefig] skips rendering figures which were saved
+before. The cache key is a hash of the state of all artists, including their
+data, the rcParams, the style and mode of prettypyplot, the savefig options
+and the versions of prettypyplot and matplotlib. The cache directory is
+bounded in size, the least recently used files are evicted first.
+
+!!! example
+    ```python
+    cache = pplt.cache.RenderCache('.pplt_cache', max_size=2**30)
+    pplt.savefig('fig.pdf', cache=cache)
+    print(cache.cache_info())
+    ```
+
+"""
+
+# ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import functools
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import types
+import weakref
+from collections import namedtuple
+from enum import Enum
+from pathlib import Path
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib import artist as martist
+from matplotlib import cbook
+from matplotlib import colors as mcolors
+from matplotlib import transforms as mtransforms
+
+import prettypyplot as _pplt
+from prettypyplot.style import _rc_keys
+
+# attributes which hold callbacks, ids or draw-time caches
+_SKIP_ATTRIBUTES = frozenset((
+    '_button_pick_id',
+    '_callbacks',
+    '_canvas_callbacks',
+    '_mouse_key_ids',
+    '_mouseover',
+    '_number',
+    '_remove_method',
+    '_renderer',
+    '_scroll_pick_id',
+    '_stale',
+    '_transformed_path',
+    'callbacks',
+    'canvas',
+    'stale_callback',
+))
+
+# types which are hashed by their representation
+_SCALAR_TYPES = (type(None), bool, int, str, bytes)
+
+# objects which do not define the appearance, derived transformations are
+# defined by the bounding boxes and affine matrices they are derived of
+_IGNORED_TYPES = (
+    mtransforms.TransformNode,
+    cbook.CallbackRegistry,
+    weakref.ref,
+)
+
+# callables implemented in C, which are hashed by their name and owner
+_BUILTIN_TYPES = (
+    types.BuiltinFunctionType,
+    types.MethodDescriptorType,
+    types.MethodWrapperType,
+    types.WrapperDescriptorType,
+    np.ufunc,
+)
+
+# callables which are hashed by their code or name instead of their state
+_CALLABLE_TYPES = (
+    *_BUILTIN_TYPES,
+    functools.partial,
+    types.FunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.ModuleType,
+    type,
+)
+
+# significant digits of hashed layout floats, to ignore rounding errors
+_FLOAT_DIGITS = 12
+
+# cache used for savefig(..., cache=True), created on first use
+_DEFAULT_CACHE = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+# ~~~ RESULTS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class CacheInfo(namedtuple('CacheInfo', 'hits misses entries size')):
+    """Class holding the statistics of a render cache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of files copied from the cache.
+    misses : int
+        Number of files which needed to be rendered.
+    entries : int
+        Number of files in the cache directory.
+    size : int
+        Total size of the files in the cache directory in bytes.
+
+    """
+
+
+# ~~~ CLASSES ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class _UnhashableError(TypeError):
+    """Raised for objects which cannot be hashed deterministically."""
+
+
+class RenderCache:
+    """Cache of saved figures, addressed by their content.
+
+    !!! note
+        The figure is hashed before it is laid out by
+        [savefig][prettypyplot.savefig]. Drawing a figure, e.g. with
+        `plt.show()` or by saving it without cache, updates its layout. Such
+        a figure has therefore a different key than a freshly created one.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Directory to store the files in, it is created if needed. Default is
+        a subdirectory of the matplotlib cache directory.
+    max_size : int, optional
+        Maximal total size of the cached files in bytes. If exceeded, the
+        least recently used files are deleted. Default is 1 GiB.
+
+    """
+
+    def __init__(self, directory=None, max_size=2**30):
+        """Initialize cache and create its directory."""
+        if directory is None:
+            directory = Path(mpl.get_cachedir()) / 'prettypyplot' / 'render'
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """Return state for pickling, e.g. to use the cache in workers."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore pickled state with new statistics of this process."""
+        self.__dict__.update(state)
+        self._hits = self._misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, fig, **options):
+        """Return hash of figure, global state and savefig options.
+
+        Parameters
+        ----------
+        fig : Figure
+            [matplotlib.figure.Figure][] to hash.
+        options
+            Further options defining the output, e.g. the savefig kwargs.
+
+        Returns
+        -------
+        key : str or None
+            Hexadecimal sha256 hash, or None if the figure holds callables,
+            e.g. tick formatters, which cannot be hashed deterministically.
+
+        """
+        hasher = hashlib.sha256()
+        try:
+            _update_hash(
+                hasher,
+                (
+                    _pplt.__version__,
+                    mpl.__version__,
+                    _pplt.STYLE,
+                    _pplt.MODE,
+                    {key: mpl.rcParams[key] for key in _rc_keys()},
+                    options,
+                ),
+                set(),
+            )
+            for artist in fig.findobj():
+                _update_hash(hasher, type(artist).__qualname__, set())
+                _update_hash(hasher, _artist_state(artist), set())
+        except _UnhashableError:
+            return None
+        return hasher.hexdigest()
+
+    def savefig(self, key, targets, render):
+        """Copy cached files to the targets and render the missing ones.
+
+        Parameters
+        ----------
+        key : str or None
+            Key of the figure, see
+            [key][prettypyplot.cache.RenderCache.key]. If None, the figure
+            is rendered without cache.
+        targets : list of tuple
+            Filenames or file-like objects and their formats.
+        render : callable
+            Function saving the figure to a given list of filenames and
+            formats.
+
+        """
+        if key is None:
+            with self._lock:
+                self._misses += len(targets)
+            render(targets)
+            return
+
+        missing = {}
+        for fname, fmt in targets:
+            if self._load(key, fmt, fname):
+                continue
+            missing.setdefault(fmt, []).append(fname)
+
+        with self._lock:
+            self._hits += len(targets) - sum(map(len, missing.values()))
+            self._misses += sum(map(len, missing.values()))
+
+        if not missing:
+            return
+
+        # render to a temporary directory and move the files atomically, so
+        # that several processes can share the same cache directory
+        with tempfile.TemporaryDirectory(dir=self.directory) as tmpdir:
+            tmp_targets = [
+                (os.path.join(tmpdir, 'render.{0}'.format(fmt)), fmt) for fmt in missing
+            ]
+            render(tmp_targets)
+            for tmp_fname, fmt in tmp_targets:
+                entry = self._entry(key, fmt)
+                os.replace(tmp_fname, entry)
+                for fname in missing[fmt]:
+                    _copy(entry, fname)
+        self._evict()
+
+    def cache_info(self):
+        """Return hit and miss statistics and the size of the cache.
+
+        Returns
+        -------
+        info : CacheInfo
+            Number of hits, misses, cached files and their total size.
+
+        """
+        entries = self._entries()
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                len(entries),
+                sum(stat.st_size for _, stat in entries),
+            )
+
+    def clear(self):
+        """Delete all cached files and reset the statistics."""
+        for entry, _ in self._entries():
+            entry.unlink(missing_ok=True)
+        with self._lock:
+            self._hits = self._misses = 0
+
+    def _entry(self, key, fmt):
+        """Return path of cached file."""
+        return self.directory / '{0}.{1}'.format(key, fmt)
+
+    def _entries(self):
+        """Return paths and stats of all cached files."""
+        entries = []
+        for entry in self.directory.iterdir():
+            if not entry.is_file():
+                continue
+            try:
+                entries.append((entry, entry.stat()))
+            except FileNotFoundError:  # pragma: no cover
+                continue  # evicted by another process
+        return entries
+
+    def _load(self, key, fmt, fname):
+        """Copy cached file to fname, return False if it is missing."""
+        entry = self._entry(key, fmt)
+        try:
+            # mark as recently used
+            os.utime(entry)
+        except FileNotFoundError:
+            return False
+        _copy(entry, fname)
+        return True
+
+    def _evict(self):
+        """Delete least recently used files until the cache fits max_size."""
+        if self.max_size is None:
+            return
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        size = sum(stat.st_size for _, stat in entries)
+        for entry, stat in entries:
+            if size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            size -= stat.st_size
+
+
+# ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def _get_cache(cache):
+    """Return RenderCache of savefig argument, or None if disabled."""
+    global _DEFAULT_CACHE
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        with _DEFAULT_CACHE_LOCK:
+            if _DEFAULT_CACHE is None:
+                _DEFAULT_CACHE = RenderCache()
+            return _DEFAULT_CACHE
+    if isinstance(cache, RenderCache):
+        return cache
+    raise TypeError(
+        'cache needs to be a bool or RenderCache, not {0}.'.format(
+            type(cache).__name__,
+        ),
+    )
+
+
+def _copy(entry, fname):
+    """Copy cached file to filename or file-like object."""
+    if hasattr(fname, 'write'):
+        with open(entry, 'rb') as fh:
+            shutil.copyfileobj(fh, fname)
+    else:
+        shutil.copyfile(entry, fname)
+
+
+def _artist_state(artist):
+    """Return attributes of artist which define its appearance."""
+    return {
+        key: value for key, value in vars(artist).items() if key not in _SKIP_ATTRIBUTES
+    }
+
+
+def _update_hash(hasher, obj, visited):  # noqa: C901
+    """Feed a stable representation of obj into hasher.
+
+    Artists are represented by their type only, as all artists of the figure
+    are hashed one after another. Derived transformations are skipped, as
+    they are defined by the bounding boxes and affine matrices they are
+    derived of. Floats are rounded, as the layout engines introduce rounding
+    errors.
+
+    """
+    if isinstance(obj, _SCALAR_TYPES):
+        hasher.update(repr(obj).encode())
+    elif isinstance(obj, (float, complex)):
+        hasher.update('{0:.{1}g}'.format(obj, _FLOAT_DIGITS).encode())
+    elif isinstance(obj, Enum):
+        hasher.update('{0}.{1}'.format(type(obj).__qualname__, obj.name).encode())
+    elif isinstance(obj, np.ndarray):
+        hasher.update('{0}{1}'.format(obj.dtype.str, obj.shape).encode())
+        if obj.dtype.hasobject:
+            for item in obj.flat:
+                _update_hash(hasher, item, visited)
+        else:
+            hasher.update(np.ascontiguousarray(obj).data)
+    elif isinstance(obj, np.generic):
+        _update_hash(hasher, obj.item(), visited)
+    elif isinstance(obj, (list, tuple)):
+        if all(type(item) in _SCALAR_TYPES for item in obj):
+            hasher.update(repr(obj).encode())
+            return
+        hasher.update('{0}{1}'.format(type(obj).__name__, len(obj)).encode())
+        for item in obj:
+            _update_hash(hasher, item, visited)
+    elif isinstance(obj, (set, frozenset)):
+        hasher.update('set{0}'.format(len(obj)).encode())
+        for item in sorted(obj, key=repr):
+            _update_hash(hasher, item, visited)
+    elif isinstance(obj, dict):
+        _update_hash_dict(hasher, obj, visited)
+    else:
+        _update_hash_object(hasher, obj, visited)
+
+
+def _update_hash_dict(hasher, obj, visited):
+    """Feed a stable representation of a dictionary into hasher."""
+    hasher.update('dict{0}'.format(len(obj)).encode())
+    try:
+        keys = sorted(obj)
+    except TypeError:
+        keys = sorted(obj, key=repr)
+
+    # hash items of scalars at once, which are most of the attributes
+    scalars = []
+    for key in keys:
+        value = obj[key]
+        if type(key) is not str:
+            _update_hash(hasher, key, visited)
+            _update_hash(hasher, value, visited)
+        elif type(value) in _SCALAR_TYPES:
+            scalars.append((key, value))
+        elif type(value) is float:
+            scalars.append((key, '{0:.{1}g}'.format(value, _FLOAT_DIGITS)))
+        else:
+            _update_hash(hasher, key, visited)
+            _update_hash(hasher, value, visited)
+    hasher.update(repr(scalars).encode())
+
+
+def _update_hash_object(hasher, obj, visited):
+    """Feed a stable representation of a general object into hasher."""
+    hasher.update(type(obj).__qualname__.encode())
+    if isinstance(obj, martist.Artist) or id(obj) in visited:
+        return
+    visited.add(id(obj))
+
+    if isinstance(obj, mcolors.Colormap):
+        _update_hash(hasher, (obj.name, obj(np.linspace(0, 1, obj.N))), visited)
+    elif type(obj) is mtransforms.Bbox:
+        # positions are recomputed by the layout engines while drawing
+        _update_hash(hasher, tuple(obj.get_points().flat), visited)
+    elif type(obj) is mtransforms.Affine2D:
+        _update_hash(hasher, obj.get_matrix(), visited)
+    elif isinstance(obj, _IGNORED_TYPES):
+        return
+    elif isinstance(obj, _CALLABLE_TYPES):
+        _update_hash_callable(hasher, obj, visited)
+    elif hasattr(obj, '__dict__'):
+        _update_hash(hasher, _artist_state(obj), visited)
+    elif callable(obj):
+        raise _UnhashableError(
+            'Callable of type {0} cannot be hashed.'.format(type(obj).__name__),
+        )
+
+
+def _update_hash_callable(hasher, obj, visited):
+    """Feed a stable representation of a function, class or module into hasher.
+
+    Functions are hashed by their code, default arguments, the values of
+    their closure and the values of the global variables their code reads,
+    as e.g. lambdas created in a loop differ only in their closure.
+
+    """
+    if isinstance(obj, _BUILTIN_TYPES):
+        state = (obj.__qualname__, getattr(obj, '__self__', None))
+    elif isinstance(obj, type):
+        state = (obj.__module__, obj.__qualname__)
+    elif isinstance(obj, types.ModuleType):
+        state = obj.__name__
+    elif isinstance(obj, functools.partial):
+        state = (obj.func, obj.args, obj.keywords)
+    elif isinstance(obj, types.MethodType):
+        state = (obj.__func__, obj.__self__)
+    elif isinstance(obj, types.CodeType):
+        state = (obj.co_code, obj.co_consts, obj.co_names)
+    else:
+        state = (
+            obj.__module__,
+            obj.__qualname__,
+            obj.__code__,
+            obj.__defaults__,
+            obj.__kwdefaults__,
+            tuple(_cell_contents(cell) for cell in obj.__closure__ or ()),
+            tuple(
+                (name, obj.__globals__[name])
+                for name in sorted(_code_names(obj.__code__))
+                if name in obj.__globals__
+            ),
+        )
+    _update_hash(hasher, state, visited)
+
+
+def _cell_contents(cell):
+    """Return contents of closure cell, wrapped in a tuple if it is set."""
+    try:
+        return (cell.cell_contents,)
+    except ValueError:  # empty cell
+        return ()
+
+
+def _code_names(code):
+    """Return names of globals and attributes used by code and nested code."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(_code_names(const))
+    return names
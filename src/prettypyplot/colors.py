@@ -5,6 +5,8 @@
 """Set-up matplotlib environment."""
 
 # ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import functools
+import threading
 from collections import namedtuple
 
 import matplotlib as mpl
@@ -81,11 +83,19 @@ default_grays_darkmode = GrayTones('#b2b0ac', '#22201a')
 
 
 # ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-def _get_cmap(cmap):
-    """Wrapper for get_cmap with mpl <=3.2 and >=3.4."""
-    if hasattr(mpl, 'colormaps') and hasattr(mpl.colormaps, 'get_cmap'):
-        return mpl.colormaps.get_cmap(cmap)
-    return mpl.cm.get_cmap(cmap)  # pragma: no cover
+# lock guarding the registration of colormaps and named colors in matplotlib
+_REGISTRY_LOCK = threading.RLock()
+
+
+def _is_registered_cmap(name):
+    """Check if cmap name is registered for mpl <=3.2 and >=3.4."""
+    if hasattr(mpl, 'colormaps'):
+        return name in mpl.colormaps
+    try:  # pragma: no cover
+        mpl.cm.get_cmap(name)
+    except ValueError:  # pragma: no cover
+        return False
+    return True  # pragma: no cover
 
 
 def _register_cmap(cmap):
@@ -93,7 +103,110 @@ def _register_cmap(cmap):
     if hasattr(mpl, 'colormaps') and hasattr(mpl.colormaps, 'register'):
         mpl.colormaps.register(cmap)
     else:  # pragma: no cover
-        mpl.cm.register_cmap(cmap=cmap)
+        # old registry returns the registered instance itself
+        mpl.cm.register_cmap(cmap=cmap.build())
+
+
+class _LazyColormap(clr.Colormap):
+    """Placeholder which builds the actual colormap on first lookup.
+
+    The matplotlib registry stores a copy on registration and returns a copy on
+    every lookup. The first copy returns the placeholder itself, so that only
+    the name gets registered. All following copies return a copy of the
+    actual colormap, which is built only once.
+
+    """
+
+    def __init__(self, name, factory, *, reverse=False):
+        super().__init__(name)
+        self._factory = factory
+        self._reverse = reverse
+        self._cmap = None
+        self._registered = False
+
+    def build(self):
+        """Return the actual colormap, build it on first call."""
+        if self._cmap is None:
+            with _REGISTRY_LOCK:
+                if self._cmap is None:
+                    self._cmap = self._build()
+        return self._cmap
+
+    def _build(self):
+        """Create colormap, reversed ones keep the continuous flag."""
+        cmap = self._factory()
+        if not self._reverse:
+            return cmap
+        cmap_r = cmap.reversed()
+        if hasattr(cmap, '_pplt_categorical'):
+            cmap_r._pplt_categorical = cmap._pplt_categorical
+        return cmap_r
+
+    def __copy__(self):
+        with _REGISTRY_LOCK:
+            if not self._registered:
+                self._registered = True
+                return self
+        return self.build().copy()
+
+    def __call__(self, *args, **kwargs):
+        return self.build()(*args, **kwargs)
+
+    def reversed(self, name=None):
+        return self.build().reversed(name=name)
+
+
+# all custom continuous and discrete cmaps, the reversed cmaps will be added
+# with the suffix '_r'
+_COLORMAPS = {
+    'argon': _argon,
+    'pastel5': _pastel5,
+    'pastel6': _pastel6,
+    'cbf4': _cbf4,
+    'cbf5': _cbf5,
+    'cbf8': _cbf8,
+    'gdv:rag': _gdv_rag,
+    'gdv:rag_cvd': _gdv_rag_cvd,
+    'gdv:palette': _gdv_palette,
+    'gdv:6a': _gdv_6a,
+    'gdv:5a': _gdv_5a,
+    'gdv:4a': _gdv_4a,
+    'gdv:4b': _gdv_4b,
+    'gdv:3a': _gdv_3a,
+    'gdv:3b': _gdv_3b,
+    'gdv:2a': _gdv_2a,
+    'gdv:2b': _gdv_2b,
+    'gdv:s1': _gdv_s1,
+    'gdv:s2': _gdv_s2,
+    'gdv:s3': _gdv_s3,
+    'gdv:m1': _gdv_m1,
+    'gdv:m2': _gdv_m2,
+    'gdv:m3': _gdv_m3,
+    'gdv:d1': _gdv_d1,
+    'gdv:d2': _gdv_d2,
+    'gdv:d3': _gdv_d3,
+    'gdv:d4': _gdv_d4,
+    'gdv:mars': _gdv_mars,
+    'gdv:moon': _gdv_moon,
+    'pastel_autumn': _pastel_autumn,
+    'pastel_rainbow': _pastel_rainbow,
+    'pastel_spring': _pastel_spring,
+    'paula': _paula,
+    'paula2': _paula2,
+    'paula_cbf': _paula_cbf,
+    'paula_lime': _paula_lime,
+    'summertimes': _summertimes,
+    'tol:bright': _tol_bright,
+    'tol:high_contrast': _tol_high_contrast,
+    'tol:light': _tol_light,
+    'tol:medium_contrast': _tol_medium_contrast,
+    'tol:muted': _tol_muted,
+    'tol:vibrant': _tol_vibrant,
+    'ufcd': _ufcd,
+    'turbo': _turbo,
+    'macaw': _macaw,
+    'bownair': _bownair,
+}
 
 
 def load_cmaps():
@@ -106,67 +219,23 @@ def load_cmaps():
     Add continuous colormaps macaw, Turbo. The Copyright of those are given on
     top of the data.
 
+    Only the names get registered, the colormaps itself are created on their
+    first lookup, e.g., via `plt.get_cmap` or `mpl.colormaps`. The
+    registration is thread-safe.
+
     !!! see
         Choosing an [cmaps](../../gallery/cmaps).
 
     """
-    colormaps = (
-        _argon(),
-        _pastel5(),
-        _pastel6(),
-        _cbf4(),
-        _cbf5(),
-        _cbf8(),
-        _gdv_rag(),
-        _gdv_rag_cvd(),
-        _gdv_palette(),
-        _gdv_6a(),
-        _gdv_5a(),
-        _gdv_4a(),
-        _gdv_4b(),
-        _gdv_3a(),
-        _gdv_3b(),
-        _gdv_2a(),
-        _gdv_2b(),
-        _gdv_s1(),
-        _gdv_s2(),
-        _gdv_s3(),
-        _gdv_m1(),
-        _gdv_m2(),
-        _gdv_m3(),
-        _gdv_d1(),
-        _gdv_d2(),
-        _gdv_d3(),
-        _gdv_d4(),
-        _gdv_mars(),
-        _gdv_moon(),
-        _pastel_autumn(),
-        _pastel_rainbow(),
-        _pastel_spring(),
-        _paula(),
-        _paula2(),
-        _paula_cbf(),
-        _paula_lime(),
-        _summertimes(),
-        _tol_bright(),
-        _tol_high_contrast(),
-        _tol_light(),
-        _tol_medium_contrast(),
-        _tol_muted(),
-        _tol_vibrant(),
-        _ufcd(),
-        _turbo(),
-        _macaw(),
-        _bownair(),
-    )
     # register own continuous and discrete cmaps
-    for colormap in colormaps:
-        # add cmap and reverse cmap
-        for cmap in (colormap, colormap.reversed()):
-            try:
-                _get_cmap(cmap.name)
-            except ValueError:
-                _register_cmap(cmap=cmap)
+    with _REGISTRY_LOCK:
+        for name, factory in _COLORMAPS.items():
+            # add cmap and reverse cmap
+            for cmap_name, reverse in ((name, False), ('{0}_r'.format(name), True)):
+                if not _is_registered_cmap(cmap_name):
+                    _register_cmap(
+                        cmap=_LazyColormap(cmap_name, factory, reverse=reverse),
+                    )
 
 
 def load_colors():
@@ -175,35 +244,78 @@ def load_colors():
     Add colors of `pastel5` which can be accessed via `pplt:blue`, `pplt:red`,
     `pplt:green`, `pplt:orange`, `pplt:lightblue`, `pplt:gray` and
     `pplt:lightgray`. Further, the current colors will be added `pplt:axes`,
-    `pplt:text`, `pplt:grid`.
+    `pplt:text`, `pplt:grid`. The registration is thread-safe.
 
     !!! see
         Choosing an [cmaps](../../gallery/cmaps).
 
     """
-    # register own colors
-    pplt_colors = {
-        'pplt:blue': _pastel5().colors[0],
-        'pplt:red': _pastel5().colors[1],
-        'pplt:green': _pastel5().colors[2],
-        'pplt:orange': _pastel5().colors[3],
-        'pplt:lightblue': _pastel5().colors[4],
+    _register_colors({
+        **_pplt_palette(),
+        'pplt:axes': plt.rcParams['axes.edgecolor'],
+        'pplt:text': plt.rcParams['text.color'],
+        'pplt:grid': plt.rcParams['grid.color'],
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def _pplt_palette():
+    """Return the static named colors, which are created only once."""
+    blue, red, green, orange, lightblue = _pastel5().colors
+    return {
+        'pplt:blue': blue,
+        'pplt:red': red,
+        'pplt:green': green,
+        'pplt:orange': orange,
+        'pplt:lightblue': lightblue,
         'pplt:gray': default_grays.dark,
         'pplt:grey': default_grays.dark,
         'pplt:lightgray': default_grays.light,
         'pplt:lightgrey': default_grays.light,
-        'pplt:axes': plt.rcParams['axes.edgecolor'],
-        'pplt:text': plt.rcParams['text.color'],
-        'pplt:grid': plt.rcParams['grid.color'],
     }
-    clr._colors_full_map.update(pplt_colors)
+
+
+def _register_colors(colors):
+    """Register named colors which are missing or differ in matplotlib.
+
+    The colors are set item-wise, so that matplotlib invalidates its cache of
+    converted colors.
+
+    Parameters
+    ----------
+    colors : dict
+        Dictionary mapping the names to the colors.
+
+    Returns
+    -------
+    n_changed : int
+        Number of newly registered or changed colors.
+
+    """
+    color_map = clr._colors_full_map
+    with _REGISTRY_LOCK:
+        changed = {
+            name: color
+            for name, color in colors.items()
+            if name not in color_map or not _color_equal(color_map[name], color)
+        }
+        for name, color in changed.items():
+            color_map[name] = color
+    return len(changed)
+
+
+def _color_equal(color, ref):
+    """Return if both color specifications are identical."""
+    return type(color) is type(ref) and bool(np.all(color == ref))
 
 
 def categorical_cmap(nc, nsc, *, cmap=None, return_colors=False):
     """Generate categorical colors of given cmap.
 
     Exract from a predefined colormap colors and generate for each the desired
-    number of shades.
+    number of shades. The colors of a `ListedColormap` are taken one by one,
+    other colormaps and the continuous colormaps of prettypyplot, e.g.
+    `macaw`, are sampled equidistantly.
 
     Parameters
     ----------
@@ -252,11 +364,11 @@ def categorical_cmap(nc, nsc, *, cmap=None, return_colors=False):
     if nc > cmap.N:
         raise ValueError('Too many categories for colormap.')
 
-    # extract colors from cmap
-    if isinstance(cmap, clr.LinearSegmentedColormap):
-        colors = cmap(np.linspace(0, 1, nc))
-    elif isinstance(cmap, clr.ListedColormap):
+    # extract colors from cmap, continuous cmaps are sampled equidistantly
+    if _is_categorical(cmap):
         colors = cmap(np.arange(nc, dtype=int))
+    else:
+        colors = cmap(np.linspace(0, 1, nc))
 
     # get shades of colors
     scolors = np.empty((nc, nsc, 3))
@@ -268,6 +380,20 @@ def categorical_cmap(nc, nsc, *, cmap=None, return_colors=False):
     return clr.ListedColormap(np.concatenate(scolors))
 
 
+def _is_categorical(cmap):
+    """Return if the colors of cmap are taken one by one.
+
+    This holds for all ListedColormaps, except for the continuous colormaps
+    of prettypyplot which are stored as ListedColormap.
+
+    """
+    return isinstance(cmap, clr.ListedColormap) and getattr(
+        cmap,
+        '_pplt_categorical',
+        True,
+    )
+
+
 def categorical_color(nsc, color, *, return_hex=False):
     """Generate categorical shades of given colors.
 
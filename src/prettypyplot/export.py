@@ -0,0 +1,914 @@
+# -*- coding: utf-8 -*-
+# BSD 3-Clause License
+# Copyright (c) 2020-2023, Daniel Nagel
+# All rights reserved.
+"""Save figures in parallel or in the background.
+
+Rendering and encoding a figure runs on a single core. To save many figures,
+e.g. for a report, they can be distributed over a pool of processes with
+[savefig_many][prettypyplot.export.savefig_many]. To continue building the
+next figure while the previous one is written, a snapshot of the figure can
+be saved in a background thread with
+[savefig_async][prettypyplot.export.savefig_async]. Saving PNGs is dominated
+by the zlib compression, which releases the GIL. The
+[PNGPipeline][prettypyplot.export.PNGPipeline] draws each figure in the
+calling thread and compresses it in a pool of encoder threads, so the next
+figure can be drawn while the previous one is compressed. Figures which are
+saved repeatedly with only few changed axes, e.g. dashboards, can be rendered
+incrementally with the
+[IncrementalRenderer][prettypyplot.export.IncrementalRenderer].
+
+"""
+
+# ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import asyncio
+import hashlib
+import math
+import os
+import pickle
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+from matplotlib import pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import prettypyplot as _pplt
+from prettypyplot import colors as pclr
+from prettypyplot import tex as ptex
+from prettypyplot import tools
+from prettypyplot.cache import _artist_state, _UnhashableError, _update_hash
+from prettypyplot.pyplot import (
+    _encode_raster,
+    _raster_dpi,
+    _render_raster,
+    _resize_canvas,
+    _savefig_figure,
+    _savefig_targets,
+)
+from prettypyplot.style import _rc_keys
+
+# executor saving the figures of savefig_async, created on first use
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+# process saving the figures of savefig_async with modes or profile
+_PROCESS_EXECUTOR = None
+
+
+# ~~~ RESULTS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class SaveResult(namedtuple('SaveResult', 'fname duration error')):
+    """Class holding the result of saving a single figure.
+
+    Attributes
+    ----------
+    fname : str or list of str
+        Filename of the job.
+    duration : float
+        Duration of saving the figure in seconds, measured in the worker.
+    error : Exception or None
+        Raised exception or `None` if the figure was saved successfully.
+
+    """
+
+
+class StageTimings(namedtuple('StageTimings', 'render queue encode')):
+    """Class holding the durations of the stages of a pipeline.
+
+    Each attribute holds the durations in seconds of all finished figures in
+    submission order. If the encoders are busy most of the time, i.e. the
+    queue durations are large compared to the render durations, more encoder
+    threads might speed up the pipeline.
+
+    Attributes
+    ----------
+    render : tuple of float
+        Durations of resizing and drawing the figures in the calling thread.
+    queue : tuple of float
+        Durations the rendered images waited for a free encoder thread.
+    encode : tuple of float
+        Durations of compressing and writing the images.
+
+    """
+
+
+class RenderStats(namedtuple('RenderStats', 'full partial unchanged redrawn')):
+    """Class holding the statistics of an incremental renderer.
+
+    Attributes
+    ----------
+    full : int
+        Number of renderings which redrew the whole figure.
+    partial : int
+        Number of renderings which redrew only the changed artists.
+    unchanged : int
+        Number of renderings which reused the previous image.
+    redrawn : int
+        Total number of axes and figure artists redrawn by partial renderings.
+
+    """
+
+
+# ~~~ CLASSES ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class PNGPipeline:
+    """Save PNGs with separate render and encode stages.
+
+    Each figure is resized as by [savefig][prettypyplot.savefig] and drawn
+    with Agg in the calling thread. The rendered pixels are copied and
+    handed to a pool of encoder threads, which compress and write them, so
+    that the figure can be modified, closed or reused right after
+    [submit][prettypyplot.export.PNGPipeline.submit] returns.
+
+    !!! example
+        ```python
+        with pplt.export.PNGPipeline(max_workers=2) as pipeline:
+            fig, ax = plt.subplots()
+            line, = ax.plot(frames[0])
+            for idx, data in enumerate(frames):
+                line.set_ydata(data)
+                pipeline.submit('frame_{0}.png'.format(idx), fig, dpi=384)
+        print(pipeline.timings)
+        ```
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of encoder threads. Default is given by
+        [concurrent.futures.ThreadPoolExecutor][].
+
+    """
+
+    def __init__(self, max_workers=None):
+        """Initialize pipeline and start the encoder pool."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='pplt-png',
+        )
+        self._lock = threading.Lock()
+        self._timings = {}
+        self._n_submitted = 0
+
+    def __enter__(self):
+        """Return pipeline."""
+        return self
+
+    def __exit__(self, *args):
+        """Wait for all images to be written."""
+        self.close()
+
+    def submit(
+        self,
+        fname,
+        fig=None,
+        *,
+        reference_ax=None,
+        use_canvas_size=True,
+        metadata=None,
+        pil_kwargs=None,
+        **kwargs,
+    ):
+        """Draw figure and queue it for encoding.
+
+        Parameters
+        ----------
+        fname : str or Path or file-like object
+            Output filename of the png.
+        fig : Figure, optional
+            [matplotlib.figure.Figure][] to save. If `None` the current
+            figure is used.
+        reference_ax : Axes, optional
+            [matplotlib.axes.Axes][] used for resizing. If `None` first axes
+            of figure is used.
+        use_canvas_size : bool, optional
+            If True the specified figsize will be used as canvas size.
+        metadata : dict, optional
+            Metadata written to the png, see [matplotlib.pyplot.savefig][].
+        pil_kwargs : dict, optional
+            Keyword arguments passed to `PIL.Image.Image.save`, e.g.
+            `{'compress_level': 1}`.
+        kwargs
+            See [matplotlib.pyplot.savefig][].
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future which is done when the png is written.
+
+        """
+        fig = tools.gcf(fig)
+        fileformat = kwargs.pop('format', 'png')
+        if fileformat != 'png':
+            raise ValueError(
+                'PNGPipeline supports only png, not {0}.'.format(fileformat),
+            )
+
+        start = time.perf_counter()
+        image, dpi = _render_png(fig, reference_ax, use_canvas_size, kwargs)
+        rendered = time.perf_counter()
+
+        with self._lock:
+            idx = self._n_submitted
+            self._n_submitted += 1
+        return self._executor.submit(
+            self._encode,
+            idx,
+            (rendered - start, rendered),
+            image,
+            dpi,
+            fname,
+            metadata,
+            pil_kwargs,
+        )
+
+    def _encode(self, idx, render, image, dpi, fname, metadata, pil_kwargs):
+        """Encode image in encoder thread and store timings."""
+        duration, rendered = render
+        start = time.perf_counter()
+        _encode_raster(memoryview(image), dpi, fname, 'png', metadata, pil_kwargs)
+        with self._lock:
+            self._timings[idx] = (
+                duration,
+                start - rendered,
+                time.perf_counter() - start,
+            )
+
+    @property
+    def timings(self):
+        """StageTimings: Durations of the stages of all finished figures."""
+        with self._lock:
+            timings = [self._timings[idx] for idx in sorted(self._timings)]
+        if not timings:
+            return StageTimings((), (), ())
+        return StageTimings(*zip(*timings))
+
+    def close(self, wait=True):
+        """Shut down the encoder pool.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            If True, wait until all queued images are written.
+
+        """
+        self._executor.shutdown(wait=wait)
+
+
+class IncrementalRenderer:
+    """Render a figure repeatedly, redrawing only the changed axes.
+
+    The figure is resized and laid out once as by
+    [savefig][prettypyplot.savefig] and drawn with a persistent Agg canvas.
+    On each further rendering, the axes and figure artists, e.g. a suptitle
+    or a figure legend, which changed since the last rendering are detected.
+    Only their area is reset to the background and redrawn, including all
+    overlapping artists. The cost of a rendering is therefore roughly
+    proportional to the number of changed axes.
+
+    The layout is kept fixed. If the figure size, the dpi, the position of
+    an axes, the figure background or the set of axes changes, the whole
+    figure is redrawn. Call
+    [reset][prettypyplot.export.IncrementalRenderer.reset] to lay out the
+    figure again, e.g. after changing the tick labels considerably.
+
+    !!! example
+        ```python
+        fig, axs = plt.subplots(4, 4)
+        with pplt.export.IncrementalRenderer(fig) as renderer:
+            while True:
+                update_some_panels(axs)
+                renderer.savefig('dashboard.png')
+                time.sleep(60)
+        ```
+
+    !!! note
+        The rendered image covers the whole canvas, as
+        [to_array][prettypyplot.to_array], so `savefig.bbox='tight'` is not
+        applied. While the renderer is open, the figure keeps the size and
+        dpi used for rendering.
+
+    Parameters
+    ----------
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to render. If `None` the current figure
+        is used.
+    dpi : float, optional
+        Resolution in dots per inch. Default is `savefig.dpi`.
+    reference_ax : Axes, optional
+        [matplotlib.axes.Axes][] used for resizing. If `None` first axes of
+        figure is used.
+    use_canvas_size : bool, optional
+        If True the specified figsize will be used as canvas size.
+    detect : str, optional
+        How changed artists are detected. With `'hash'`, the state of all
+        artists including their data is hashed, see
+        [RenderCache][prettypyplot.cache.RenderCache]. With `'stale'`, the
+        stale flags of matplotlib are used, which is faster but misses
+        in-place changes of data arrays and changes of the rcParams.
+
+    """
+
+    def __init__(
+        self,
+        fig=None,
+        *,
+        dpi=None,
+        reference_ax=None,
+        use_canvas_size=True,
+        detect='hash',
+    ):
+        """Initialize renderer, the figure is drawn on the first rendering."""
+        if detect not in {'hash', 'stale'}:
+            raise ValueError(
+                'detect needs to be "hash" or "stale", not "{0}".'.format(detect),
+            )
+        fig = tools.gcf(fig)
+
+        self.fig = fig
+        self.detect = detect
+        self._reference_ax = reference_ax
+        self._use_canvas_size = use_canvas_size
+        self._set_dpi = fig.get_dpi()
+        self._dpi = _raster_dpi(fig, [(None, 'png')], {'dpi': dpi})
+        self._set_figsize = None
+        self._canvas = None
+        self._background = None
+        self._layout = None
+        self._states = {}
+        self._extents = {}
+        self._stats = {'full': 0, 'partial': 0, 'unchanged': 0, 'redrawn': 0}
+
+    def __enter__(self):
+        """Return renderer."""
+        return self
+
+    def __exit__(self, *args):
+        """Restore the figure."""
+        self.close()
+
+    @property
+    def stats(self):
+        """RenderStats: Number of full, partial and skipped renderings."""
+        return RenderStats(**self._stats)
+
+    def render(self):
+        """Render the figure and return its RGBA pixels.
+
+        Returns
+        -------
+        pixels : ndarray
+            RGBA pixels of shape `(height, width, 4)` and dtype uint8. The
+            array is a view onto the buffer of the renderer, which is
+            overwritten by the next rendering.
+
+        """
+        if self._set_figsize is None:
+            self._set_figsize = _resize_canvas(
+                reference_ax=self._reference_ax,
+                use_canvas_size=self._use_canvas_size,
+                fig=self.fig,
+            )
+            self.fig.set_dpi(self._dpi)
+
+        canvas = self.fig.canvas
+        if self._canvas is None:
+            self._canvas = FigureCanvasAgg(self.fig)
+        self.fig.set_canvas(self._canvas)
+        try:
+            if self._layout != self._layout_key():
+                self._draw_full()
+            else:
+                self._draw_changed()
+            return np.asarray(self._canvas.buffer_rgba())
+        finally:
+            self.fig.set_canvas(canvas)
+
+    def savefig(self, fname, *, format=None, metadata=None, pil_kwargs=None):
+        """Render the figure and save it in a raster format.
+
+        Parameters
+        ----------
+        fname : str or Path or file-like object
+            Output filename.
+        format : str, optional
+            Raster format, e.g. `'png'`. By default, it is inferred from the
+            filename.
+        metadata : dict, optional
+            Metadata written to the file, see [matplotlib.pyplot.savefig][].
+        pil_kwargs : dict, optional
+            Keyword arguments passed to `PIL.Image.Image.save`.
+
+        """
+        ((fname, fmt),) = _savefig_targets(fname, format)
+        if fmt not in ptex.RASTER_FORMATS:
+            raise ValueError(
+                'Only raster formats can be rendered incrementally, not {0}.'.format(
+                    fmt,
+                ),
+            )
+        _encode_raster(
+            memoryview(self.render()),
+            self._dpi,
+            fname,
+            fmt,
+            metadata,
+            pil_kwargs,
+        )
+
+    def reset(self):
+        """Lay out and redraw the whole figure on the next rendering."""
+        self._restore_figure()
+        self._layout = None
+
+    def close(self):
+        """Restore the size and dpi of the figure."""
+        self._restore_figure()
+        self._canvas = None
+        self._background = None
+        self._layout = None
+        self._states.clear()
+        self._extents.clear()
+
+    def _restore_figure(self):
+        """Restore the size and dpi the figure had before rendering."""
+        if self._set_figsize is not None:
+            self.fig.set_dpi(self._set_dpi)
+            self.fig.set_size_inches(self._set_figsize)
+            self._set_figsize = None
+
+    def _children(self):
+        """Return all artists of the figure drawn on top of its background."""
+        return [
+            child
+            for child in self.fig.get_children()
+            if child is not self.fig.patch and not child.get_animated()
+        ]
+
+    def _layout_key(self):
+        """Return key of the figure properties which require a full redraw."""
+        return (
+            tuple(self.fig.get_size_inches()),
+            self.fig.dpi,
+            tuple(
+                (id(ax), tuple(ax.get_position(original=True).bounds))
+                for ax in self.fig.axes
+            ),
+            _artist_hash(self.fig.patch),
+        )
+
+    def _draw_full(self):
+        """Draw the background and the whole figure."""
+        children = self._children()
+        visible = [child.get_visible() for child in children]
+        for child in children:
+            child.set_visible(False)
+        try:
+            self._canvas.draw()
+            self._background = np.array(self._canvas.buffer_rgba())
+        finally:
+            for child, child_visible in zip(children, visible):
+                child.set_visible(child_visible)
+
+        self._canvas.draw()
+        renderer = self._canvas.get_renderer()
+        self._states.clear()
+        self._extents.clear()
+        for child in children:
+            self._store(child, renderer)
+        self._layout = self._layout_key()
+        self._stats['full'] += 1
+
+    def _draw_changed(self):
+        """Redraw the changed artists and all artists overlapping them."""
+        children = self._children()
+        if set(children) != set(self._states):
+            self._draw_full()
+            return
+
+        renderer = self._canvas.get_renderer()
+        dirty = self._dirty_extents(children, renderer)
+        if not dirty:
+            self._stats['unchanged'] += 1
+            return
+
+        pixels = np.asarray(renderer.buffer_rgba())
+        for extent in dirty.values():
+            if extent is not None:
+                rows, cols = _extent_slices(extent, pixels.shape)
+                pixels[rows, cols] = self._background[rows, cols]
+
+        # draw in the same order as matplotlib.figure.Figure.draw
+        for child in sorted(children, key=lambda child: child.get_zorder()):
+            if child in dirty:
+                child.draw(renderer)
+                self._store(child, renderer)
+        self._stats['partial'] += 1
+        self._stats['redrawn'] += len(dirty)
+
+    def _dirty_extents(self, children, renderer):
+        """Return extents of changed artists and all artists overlapping them."""
+        dirty = {}
+        for child in children:
+            if self._changed(child):
+                # the old and the new area need to be redrawn
+                dirty[child] = _union(
+                    self._extents[child],
+                    self._extent(child, renderer),
+                )
+
+        added = bool(dirty)
+        while added:
+            added = False
+            for child in children:
+                if child not in dirty and any(
+                    _overlap(self._extents[child], extent) for extent in dirty.values()
+                ):
+                    dirty[child] = self._extents[child]
+                    added = True
+        return dirty
+
+    def _changed(self, artist):
+        """Check if artist changed since it was drawn."""
+        if self.detect == 'stale':
+            return artist.stale
+        return _artist_hash(artist) != self._states[artist]
+
+    def _store(self, artist, renderer):
+        """Store extent and state of drawn artist."""
+        self._extents[artist] = self._extent(artist, renderer)
+        if self.detect == 'stale':
+            # estimating the extent updates the ticks and titles
+            artist.stale = False
+            self._states[artist] = None
+        else:
+            self._states[artist] = _artist_hash(artist)
+
+    def _extent(self, artist, renderer):
+        """Return pixel extent of artist including antialiasing."""
+        if not artist.get_visible():
+            return None
+        bbox = artist.get_tightbbox(renderer)
+        if bbox is None or not np.all(np.isfinite(bbox.extents)):
+            return None
+        x0, y0, x1, y1 = bbox.extents
+        return (
+            math.floor(x0) - 2,
+            math.floor(y0) - 2,
+            math.ceil(x1) + 2,
+            math.ceil(y1) + 2,
+        )
+
+
+# ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def savefig_many(jobs, *, max_workers=None, mp_context=None):
+    """Save many figures in parallel.
+
+    Each figure is pickled and saved by a pool of processes using the Agg
+    backend with the same style, mode and rcParams as this process. The
+    figures are saved as by [savefig][prettypyplot.savefig], including the
+    correction of the canvas size and the reduction of ticks in minimal style.
+    Figures which can not be pickled, e.g. because of lambda functions, are
+    reported as error.
+
+    !!! example
+        ```python
+        jobs = []
+        for idx, data in enumerate(datasets):
+            fig, ax = plt.subplots()
+            pplt.plot(data, ax=ax)
+            jobs.append((fig, 'fig_{0}.png'.format(idx)))
+        results = pplt.export.savefig_many(jobs)
+        failed = [result for result in results if result.error is not None]
+        ```
+
+    Parameters
+    ----------
+    jobs : iterable of tuple
+        Jobs given as `(fig, fname)` or `(fig, fname, kwargs)`, where `kwargs`
+        are passed to [savefig][prettypyplot.savefig].
+    max_workers : int, optional
+        Number of processes. Default is given by
+        [concurrent.futures.ProcessPoolExecutor][].
+    mp_context : multiprocessing.context.BaseContext, optional
+        Context used to start the processes. Default is given by
+        [concurrent.futures.ProcessPoolExecutor][].
+
+    Returns
+    -------
+    results : list of SaveResult
+        For each job in the given order the filename, duration and error.
+
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(_style_state(),),
+    ) as executor:
+        futures = []
+        for job in jobs:
+            fig, fname, kwargs = _parse_job(job)
+            try:
+                data = pickle.dumps((fig, fname, kwargs))
+            except Exception as error:
+                futures.append((fname, SaveResult(fname, 0.0, error)))
+            else:
+                futures.append((fname, executor.submit(_save_job, data)))
+
+        return [_get_result(fname, future) for fname, future in futures]
+
+
+def savefig_async(fname, fig=None, *, executor=None, **kwargs):
+    """Save a snapshot of a figure in the background.
+
+    The figure is copied by pickling it in the calling thread, so the figure
+    can be modified or closed right after this call while the copy is
+    rendered and written in a background thread. The snapshot is saved as by
+    [savefig][prettypyplot.savefig].
+
+    !!! note
+        The style, mode and style settings of the calling context are used
+        for saving, e.g. of an enclosing
+        [style_context][prettypyplot.style_context]. The rcParams, however,
+        are read while saving. If they are changed before the returned future
+        is done, the saved figure may differ.
+
+        Saving with `modes` or `profile` changes the rcParams. Hence, these
+        figures are saved in a background process with the rcParams of the
+        caller, so that figures created meanwhile are not affected. Then,
+        only filenames are supported and a passed executor needs to be a
+        [concurrent.futures.ProcessPoolExecutor][].
+
+    !!! example
+        ```python
+        futures = []
+        for idx, data in enumerate(datasets):
+            fig, ax = plt.subplots()
+            pplt.plot(data, ax=ax)
+            futures.append(pplt.savefig_async('fig_{0}.png'.format(idx), fig))
+            plt.close(fig)
+        for future in futures:
+            future.result()  # raises errors of saving
+        ```
+
+    Parameters
+    ----------
+    fname : str or Path or list of str or file-like object
+        Output filename(s), see [savefig][prettypyplot.savefig].
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to save. If `None` the current figure
+        is used.
+    executor : concurrent.futures.Executor, optional
+        Executor used to save the snapshot. By default a single background
+        thread, or a single process for `modes` and `profile`, is used, so
+        that the figures are written in submission order.
+    kwargs
+        See [savefig][prettypyplot.savefig].
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        Future which is done when the figure is written. Its result is
+        `None`, errors of saving are raised by `future.result()`.
+
+    """
+    fig = tools.gcf(fig)
+    if kwargs.get('modes') is not None or kwargs.get('profile') is not None:
+        return _savefig_process(fname, fig, executor, kwargs)
+    if executor is None:
+        executor = _get_executor()
+
+    snapshot, kwargs = _snapshot(fig, kwargs)
+    return executor.submit(
+        _save_snapshot,
+        snapshot,
+        fname,
+        kwargs,
+        _pplt._copy_state(),
+    )
+
+
+async def asavefig(fname, fig=None, *, executor=None, **kwargs):
+    """Save a snapshot of a figure without blocking the event loop.
+
+    Awaitable variant of [savefig_async][prettypyplot.export.savefig_async],
+    e.g. for serving figures from an [asyncio][] based web server.
+
+    Parameters
+    ----------
+    fname : str or Path or list of str or file-like object
+        Output filename(s), see [savefig][prettypyplot.savefig].
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to save. If `None` the current figure
+        is used.
+    executor : concurrent.futures.Executor, optional
+        Executor used to save the snapshot, see
+        [savefig_async][prettypyplot.export.savefig_async].
+    kwargs
+        See [savefig][prettypyplot.savefig].
+
+    """
+    await asyncio.wrap_future(
+        savefig_async(fname, fig, executor=executor, **kwargs),
+    )
+
+
+def _get_executor():
+    """Return the background executor, create it if needed."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix='pplt-savefig',
+            )
+        return _EXECUTOR
+
+
+def _get_process_executor():
+    """Return the background process, create it if needed."""
+    # imported here, because the pool module imports this module
+    from prettypyplot.pool import _get_mp_context
+
+    global _PROCESS_EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _PROCESS_EXECUTOR is None:
+            _PROCESS_EXECUTOR = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=_get_mp_context(None),
+            )
+        return _PROCESS_EXECUTOR
+
+
+def _savefig_process(fname, fig, executor, kwargs):
+    """Save figure with modes or profile in a process, see savefig_async."""
+    if executor is None:
+        executor = _get_process_executor()
+    elif not isinstance(executor, ProcessPoolExecutor):
+        raise ValueError(
+            'Saving with modes or profile changes the rcParams, so it needs '
+            + 'a ProcessPoolExecutor.',
+        )
+    fnames = fname if isinstance(fname, (list, tuple)) else [fname]
+    if not all(isinstance(name, (str, os.PathLike)) for name in fnames):
+        raise ValueError(
+            'Saving with modes or profile supports only filenames.',
+        )
+    data = _dumps(fig, (fig, fname, kwargs))
+    return executor.submit(_save_process, data, _style_state())
+
+
+def _save_process(data, state):
+    """Save pickled figure with the style state of the caller."""
+    _init_worker(state)
+    fig, fname, kwargs = pickle.loads(data)
+    try:
+        _savefig_figure(fig, fname, **kwargs)
+    finally:
+        plt.close(fig)
+
+
+def _dumps(fig, obj):
+    """Pickle object holding the figure, without registering it to pyplot."""
+    # detach the manager, otherwise the copy is registered to pyplot
+    canvas = fig.canvas
+    manager, canvas.manager = canvas.manager, None
+    try:
+        return pickle.dumps(obj)
+    finally:
+        canvas.manager = manager
+
+
+def _snapshot(fig, kwargs):
+    """Return independent copy of figure and kwargs, e.g. the reference_ax."""
+    return pickle.loads(_dumps(fig, (fig, kwargs)))
+
+
+def _save_snapshot(fig, fname, kwargs, state):
+    """Save the snapshot of a figure with the style state of the caller."""
+    token = _pplt._CONTEXT_STATE.set(state)
+    try:
+        _savefig_figure(fig, fname, **kwargs)
+    finally:
+        _pplt._CONTEXT_STATE.reset(token)
+
+
+def _render_png(fig, reference_ax, use_canvas_size, kwargs):
+    """Resize and render figure, return RGBA image and dpi."""
+    set_figsize = _resize_canvas(
+        reference_ax=reference_ax,
+        use_canvas_size=use_canvas_size,
+        fig=fig,
+    )
+    try:
+        if plt.rcParams['text.usetex']:
+            ptex.warmup_tex(
+                fig,
+                dpi=_raster_dpi(fig, [(None, 'png')], kwargs),
+            )
+        return _render_raster(fig, **kwargs)
+    finally:
+        # reset figsize, if user calls this function multiple times on same figure
+        fig.set_size_inches(set_figsize)
+
+
+def _artist_hash(artist):
+    """Return hash of the state of artist and all its children."""
+    hasher = hashlib.sha256()
+    try:
+        for child in artist.findobj():
+            _update_hash(hasher, type(child).__qualname__, set())
+            _update_hash(hasher, _artist_state(child), set())
+    except _UnhashableError:
+        # unique object, so the artist is always considered as changed
+        return object()
+    return hasher.digest()
+
+
+def _union(extent, other):
+    """Return pixel extent covering both extents, which might be None."""
+    if extent is None or other is None:
+        return other if extent is None else extent
+    return (
+        min(extent[0], other[0]),
+        min(extent[1], other[1]),
+        max(extent[2], other[2]),
+        max(extent[3], other[3]),
+    )
+
+
+def _overlap(extent, other):
+    """Check if two pixel extents, which might be None, overlap."""
+    if extent is None or other is None:
+        return False
+    return (
+        extent[0] < other[2]
+        and other[0] < extent[2]
+        and extent[1] < other[3]
+        and other[1] < extent[3]
+    )
+
+
+def _extent_slices(extent, shape):
+    """Return row and column slices of pixel extent in display coordinates."""
+    height, width = shape[:2]
+    x0, y0, x1, y1 = extent
+    return (
+        slice(max(height - y1, 0), max(height - y0, 0)),
+        slice(max(x0, 0), max(x1, 0)),
+    )
+
+
+def _get_result(fname, future):
+    """Return result of future, including errors of the pool itself."""
+    if isinstance(future, SaveResult):
+        return future
+    try:
+        return future.result()
+    except Exception as error:
+        return SaveResult(fname, 0.0, error)
+
+
+def _parse_job(job):
+    """Return figure, filename and keyword arguments of job."""
+    if len(job) == 2:
+        fig, fname = job
+        return fig, fname, {}
+    fig, fname, kwargs = job
+    return fig, fname, dict(kwargs)
+
+
+def _style_state():
+    """Return style, mode, style settings and rcParams of this process."""
+    return {
+        'style': _pplt.STYLE,
+        'mode': _pplt.MODE,
+        'style_dict': dict(_pplt.STYLE_DICT),
+        'rc': {key: plt.rcParams[key] for key in _rc_keys()},
+    }
+
+
+def _init_worker(state):
+    """Set up headless worker with the style state of the parent process."""
+    plt.switch_backend('Agg')
+    plt.rcParams.update(state['rc'])
+    _pplt.STYLE, _pplt.MODE = state['style'], state['mode']
+    _pplt.STYLE_DICT = dict(state['style_dict'])
+    pclr.load_cmaps()
+    pclr.load_colors()
+
+
+def _save_job(data):
+    """Unpickle and save a single figure, return SaveResult."""
+    start = time.perf_counter()
+    fig, fname, kwargs = None, None, {}
+    try:
+        fig, fname, kwargs = pickle.loads(data)
+        _savefig_figure(fig, fname, **kwargs)
+    except Exception as error:
+        return SaveResult(fname, time.perf_counter() - start, error)
+    finally:
+        if fig is not None:
+            plt.close(fig)
+    return SaveResult(fname, time.perf_counter() - start, None)
@@ -0,0 +1,607 @@
+# -*- coding: utf-8 -*-
+# BSD 3-Clause License
+# Copyright (c) 2020-2023, Daniel Nagel
+# All rights reserved.
+"""Pool of warm worker processes to create and save figures.
+
+A fresh process pays for importing matplotlib, loading the font cache,
+applying the style, registering the colormaps and colors and for the first
+LaTeX invocation before it draws anything. The
+[RenderPool][prettypyplot.pool.RenderPool] performs this warmup once per
+worker, so that each task only pays for creating and saving its figure. The
+tasks are plotting callables, which are executed in the workers and return
+the figure to save. Hence, in contrast to
+[savefig_many][prettypyplot.export.savefig_many], the figures do not need to
+be pickled.
+
+Large arrays, e.g. long trajectories, can be placed in shared memory with
+[share][prettypyplot.pool.RenderPool.share]. Only a lightweight descriptor is
+then passed to the workers, which plot a zero-copy view of the array.
+
+!!! example
+    ```python
+    def plot_dataset(idx):
+        fig, ax = plt.subplots()
+        pplt.plot(load_dataset(idx), ax=ax)
+        return fig
+
+    with pplt.pool.RenderPool() as pool:
+        results = pool.map(
+            plot_dataset,
+            range(100),
+            fnames=['fig_{0}.png'.format(idx) for idx in range(100)],
+        )
+    print(pool.timings)
+    ```
+
+On free-threaded Python builds, e.g. 3.13t, drawing independent figures with
+Agg scales across cores within a single process. Then, a pool of threads
+avoids starting and warming up processes, as well as pickling the arguments.
+
+!!! example
+    ```python
+    with pplt.pool.RenderPool(executor='thread') as pool:
+        results = pool.map(plot_dataset, range(100))
+    ```
+
+!!! example
+    ```python
+    def plot_frames(traj, start):
+        fig, ax = plt.subplots()
+        ax.plot(traj[start:start + 1000])
+        return fig
+
+    with pplt.pool.RenderPool() as pool:
+        traj = pool.share(np.load('traj.npy'))
+        for start in range(0, len(traj), 1000):
+            fname = 'frames_{0}.png'.format(start)
+            pool.submit(plot_frames, traj, start, fname=fname)
+        pool.release(traj)
+    ```
+
+"""
+
+# ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import functools
+import multiprocessing
+import os
+import threading
+import time
+import warnings
+import weakref
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from matplotlib import font_manager
+from matplotlib import pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import prettypyplot as _pplt
+from prettypyplot import colors as pclr
+from prettypyplot.export import _init_worker, _style_state
+from prettypyplot.pyplot import (
+    _PIL_FORMATS,
+    _savefig_targets,
+    savefig,
+    savefig_bytes,
+)
+
+# modules imported once by the fork server and inherited by all workers
+_PRELOAD_MODULES = (
+    'matplotlib.pyplot',
+    'matplotlib.backends.backend_agg',
+    'prettypyplot.pool',
+)
+
+# duration of the warmup of this worker process in seconds
+_WARMUP = None
+
+# shared memory and views of finished tasks of this worker, which are still
+# referenced
+_ATTACHED = []
+_ATTACHED_LOCK = threading.Lock()
+
+
+# ~~~ RESULTS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class TaskResult(namedtuple('TaskResult', 'fname data pid warmup duration error')):
+    """Class holding the result of a single task of a pool.
+
+    Attributes
+    ----------
+    fname : str or list of str or None
+        Filename of the task or `None` if the figure was returned as bytes.
+    data : bytes or None
+        Encoded figure if no filename was given, otherwise `None`.
+    pid : int or None
+        Process id of the worker which executed the task.
+    warmup : float or None
+        Duration of the one-time warmup of the worker in seconds.
+    duration : float
+        Duration of creating and saving the figure in seconds, measured in
+        the worker.
+    error : Exception or None
+        Raised exception or `None` if the task was successful.
+
+    """
+
+
+class SharedArray(namedtuple('SharedArray', 'name shape dtype')):
+    """Class holding the descriptor of an array in shared memory.
+
+    Created by [share][prettypyplot.pool.RenderPool.share]. If passed as
+    argument to [submit][prettypyplot.pool.RenderPool.submit], the worker
+    replaces it by a read-only view of the shared array.
+
+    Attributes
+    ----------
+    name : str
+        Name of the shared memory block.
+    shape : tuple of int
+        Shape of the array.
+    dtype : numpy.dtype
+        Data type of the array.
+
+    """
+
+
+class PoolTimings(namedtuple('PoolTimings', 'warmup tasks')):
+    """Class holding the durations of the warmup and of the tasks of a pool.
+
+    Attributes
+    ----------
+    warmup : tuple of float
+        Duration of the warmup in seconds of each worker which finished a
+        task.
+    tasks : tuple of float
+        Duration in seconds of all finished tasks in order of completion.
+
+    """
+
+
+# ~~~ POOL ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class RenderPool:
+    """Process or thread pool which creates and saves figures in warm workers.
+
+    Each worker process is initialized once with the Agg backend and the
+    style, mode, style settings and rcParams of the creating process. It
+    loads the font cache, registers the colormaps and colors and draws a
+    small figure, which invokes LaTeX if `text.usetex` is enabled. If LaTeX
+    fails, a RuntimeWarning is issued and the tasks using it fail. If
+    available, the workers are started by a fork server or by forking.
+
+    With `executor='thread'`, the warmup is performed once in the creating
+    thread and the tasks are executed by a pool of threads with the style,
+    mode and style settings of the creating context, see
+    [style_context][prettypyplot.style_context]. This scales on free-threaded
+    Python builds only. The rcParams are shared by all threads, so tasks
+    using `profile`, `modes` or jpeg files, which change them while saving,
+    are rejected. The plotting callables should create their figures with
+    [matplotlib.figure.Figure][] instead of pyplot, which is not thread-safe.
+    The mathtext parser of matplotlib is not thread-safe either, so mathtext
+    tick labels, e.g. of `use_style(latex='fast')`, are rejected and other
+    strings with mathtext, e.g. `'$t$ / s'`, should only be used with
+    processes.
+
+    The plotting callables and their arguments need to be picklable, e.g.
+    functions defined at module level. They need to return the
+    [matplotlib.figure.Figure][] to save, which is closed afterwards. Large
+    arrays should be passed via [share][prettypyplot.pool.RenderPool.share]
+    to avoid pickling them for each task.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of processes or threads. Default is given by
+        [concurrent.futures.ProcessPoolExecutor][] and
+        [concurrent.futures.ThreadPoolExecutor][], respectively.
+    executor : str, optional
+        Use a pool of `'process'` or of `'thread'` workers.
+    mp_context : multiprocessing.context.BaseContext or str, optional
+        Context or name of the start method used to start the processes. By
+        default `'forkserver'` is used if available, else `'fork'`.
+    preload : bool, optional
+        If True and the processes are started by a fork server, the fork
+        server imports matplotlib and prettypyplot once, so that the workers
+        inherit them. As the fork server is shared by the whole process, this
+        changes its preloaded modules for all other users and has no effect
+        if it is already running.
+
+    """
+
+    def __init__(
+        self,
+        max_workers=None,
+        *,
+        executor='process',
+        mp_context=None,
+        preload=False,
+    ):
+        """Initialize pool, the workers are started on demand."""
+        self._lock = threading.Lock()
+        self._warmup = {}
+        self._state = None
+        if executor == 'process':
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=_get_mp_context(mp_context, preload=preload),
+                initializer=_warmup,
+                initargs=(_style_state(),),
+            )
+        elif executor == 'thread':
+            start = time.perf_counter()
+            pclr.load_cmaps()
+            pclr.load_colors()
+            _warmup_drawing()
+            self._warmup[os.getpid()] = time.perf_counter() - start
+            self._state = _pplt._copy_state()
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='pplt-render',
+            )
+        else:
+            raise ValueError(
+                'executor needs to be "process" or "thread", not '
+                + '{0!r}.'.format(executor),
+            )
+        self._durations = []
+        self._segments = {}
+        self._pending = Counter()
+        self._released = set()
+
+    def __enter__(self):
+        """Return pool."""
+        return self
+
+    def __exit__(self, *args):
+        """Wait for all tasks to be finished."""
+        self.close()
+
+    def submit(self, func, *args, fname=None, savefig_kwargs=None, **kwargs):
+        """Create and save a figure in a worker.
+
+        Parameters
+        ----------
+        func : callable
+            Plotting function called as `func(*args, **kwargs)` in the worker
+            returning the [matplotlib.figure.Figure][] to save.
+        args, kwargs
+            Arguments passed to `func`. A
+            [SharedArray][prettypyplot.pool.SharedArray] passed directly as
+            argument is replaced by a read-only view of the shared array.
+        fname : str or list of str, optional
+            Output filename(s), see [savefig][prettypyplot.savefig]. If
+            `None`, the encoded figure is returned as bytes, see
+            [savefig_bytes][prettypyplot.savefig_bytes].
+        savefig_kwargs : dict, optional
+            Keyword arguments passed to [savefig][prettypyplot.savefig] or
+            [savefig_bytes][prettypyplot.savefig_bytes], respectively.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future of the [TaskResult][prettypyplot.pool.TaskResult]. Errors
+            of the task are stored in the result, errors of the pool itself,
+            e.g. if `func` can not be pickled, are raised by
+            `future.result()`.
+
+        """
+        names = [
+            arg.name
+            for arg in (*args, *kwargs.values())
+            if isinstance(arg, SharedArray)
+        ]
+        task = (func, args, kwargs, fname, dict(savefig_kwargs or {}))
+        if self._state is not None:
+            _check_thread_task(fname, task[-1])
+
+        with self._lock:
+            self._pending.update(names)
+
+        if self._state is None:
+            future = self._executor.submit(_run_task, *task)
+        else:
+            future = self._executor.submit(_run_task_in_state, self._state, *task)
+        future.add_done_callback(functools.partial(self._finish, names))
+        return future
+
+    def share(self, array):
+        """Copy an array to shared memory.
+
+        The array is copied once and can then be passed to any number of
+        tasks without pickling it. The shared memory is freed after
+        [release][prettypyplot.pool.RenderPool.release] is called and all
+        submitted tasks using it are finished, or on closing the pool.
+
+        Parameters
+        ----------
+        array : array_like
+            Array to share, which may not hold Python objects.
+
+        Returns
+        -------
+        shared : SharedArray
+            Descriptor of the shared array, see
+            [SharedArray][prettypyplot.pool.SharedArray].
+
+        """
+        array = np.asarray(array)
+        if array.dtype.hasobject:
+            raise ValueError('Arrays of Python objects can not be shared.')
+
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        with self._lock:
+            self._segments[shm.name] = shm
+        return SharedArray(shm.name, array.shape, array.dtype)
+
+    def release(self, shared):
+        """Free the shared memory once all submitted tasks are finished.
+
+        Parameters
+        ----------
+        shared : SharedArray
+            Descriptor returned by
+            [share][prettypyplot.pool.RenderPool.share]. It may not be
+            passed to further tasks.
+
+        """
+        with self._lock:
+            if shared.name not in self._segments:
+                raise ValueError(
+                    '{0} is not shared by this pool.'.format(shared.name),
+                )
+            self._released.add(shared.name)
+            self._unlink_released()
+
+    def map(self, func, iterable, *, fnames=None, savefig_kwargs=None):
+        """Create and save a figure for each item in parallel.
+
+        Parameters
+        ----------
+        func : callable
+            Plotting function called as `func(item)` in the worker returning
+            the [matplotlib.figure.Figure][] to save.
+        iterable : iterable
+            Items passed to `func`.
+        fnames : list of str, optional
+            Output filename of each item. If `None`, the encoded figures are
+            returned as bytes.
+        savefig_kwargs : dict, optional
+            Keyword arguments passed to [savefig][prettypyplot.savefig] or
+            [savefig_bytes][prettypyplot.savefig_bytes], respectively.
+
+        Returns
+        -------
+        results : list of TaskResult
+            For each item in the given order the
+            [TaskResult][prettypyplot.pool.TaskResult], including errors of
+            the pool itself.
+
+        """
+        items = list(iterable)
+        if fnames is None:
+            fnames = [None] * len(items)
+        elif len(fnames) != len(items):
+            raise ValueError(
+                'fnames needs to have the same length as iterable, but '
+                + '{0} != {1}.'.format(len(fnames), len(items)),
+            )
+
+        futures = [
+            (
+                fname,
+                self.submit(func, item, fname=fname, savefig_kwargs=savefig_kwargs),
+            )
+            for item, fname in zip(items, fnames)
+        ]
+        return [_get_result(fname, future) for fname, future in futures]
+
+    @property
+    def timings(self):
+        """PoolTimings: Durations of the warmup and of all finished tasks."""
+        with self._lock:
+            return PoolTimings(tuple(self._warmup.values()), tuple(self._durations))
+
+    def close(self, wait=True):
+        """Shut down the worker processes.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            If True, wait until all submitted tasks are finished.
+
+        """
+        self._executor.shutdown(wait=wait)
+        with self._lock:
+            self._released.update(self._segments)
+            self._unlink_released()
+
+    def _finish(self, names, future):
+        """Store timings of a finished task and free released arrays."""
+        with self._lock:
+            self._pending.subtract(names)
+            self._unlink_released()
+            if future.cancelled() or future.exception() is not None:
+                return
+            result = future.result()
+            if result.warmup is not None:
+                self._warmup[result.pid] = result.warmup
+            self._durations.append(result.duration)
+
+    def _unlink_released(self):
+        """Free released shared memory, which is not used by pending tasks."""
+        for name in [name for name in self._released if self._pending[name] <= 0]:
+            shm = self._segments.pop(name)
+            shm.close()
+            shm.unlink()
+            self._released.discard(name)
+            del self._pending[name]
+
+
+# ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def _get_mp_context(mp_context, preload=False):
+    """Return context using fork server or fork, if available."""
+    if isinstance(mp_context, str):
+        mp_context = multiprocessing.get_context(mp_context)
+    elif mp_context is None:
+        methods = multiprocessing.get_all_start_methods()
+        for method in ('forkserver', 'fork'):
+            if method in methods:
+                mp_context = multiprocessing.get_context(method)
+                break
+
+    # the preloaded modules are a setting of the process-wide fork server
+    if preload and mp_context is not None:
+        if mp_context.get_start_method() == 'forkserver':
+            mp_context.set_forkserver_preload(list(_PRELOAD_MODULES))
+    return mp_context
+
+
+def _warmup(state):
+    """Set up worker with the style state and warm up fonts and LaTeX."""
+    global _WARMUP
+    start = time.perf_counter()
+    _init_worker(state)
+    _warmup_drawing()
+    _WARMUP = time.perf_counter() - start
+
+
+def _warmup_drawing():
+    """Load the default font and draw a small figure, invoking LaTeX."""
+    font_manager.findfont(font_manager.FontProperties())
+
+    # draw a small figure to load the glyphs and to invoke LaTeX
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot([0, 1])
+    ax.set_xlabel(r'time $t$ / s')
+    try:
+        FigureCanvasAgg(fig).draw()
+    except RuntimeError as err:
+        # matplotlib raises RuntimeError if LaTeX is missing or fails, which
+        # is raised again by the tasks using it
+        warnings.warn(
+            'Warmup of LaTeX failed: {0}'.format(err),
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+
+def _run_task(func, args, kwargs, fname, savefig_kwargs):
+    """Create and save a figure, return TaskResult."""
+    start = time.perf_counter()
+    data, error = None, None
+    attached = []
+    try:
+        data = _create_figure(func, args, kwargs, fname, savefig_kwargs, attached)
+    except Exception as err:
+        error = err
+    _detach(attached)
+    return TaskResult(
+        fname,
+        data,
+        os.getpid(),
+        _WARMUP,
+        time.perf_counter() - start,
+        error,
+    )
+
+
+def _run_task_in_state(state, *task):
+    """Run task in a thread with the style state of the creating context."""
+    token = _pplt._CONTEXT_STATE.set(state)
+    try:
+        return _run_task(*task)
+    finally:
+        _pplt._CONTEXT_STATE.reset(token)
+
+
+def _check_thread_task(fname, savefig_kwargs):
+    """Raise ValueError if saving the task changes the global rcParams."""
+    for key in ('modes', 'profile'):
+        if savefig_kwargs.get(key) is not None:
+            raise ValueError(
+                '{0} changes the rcParams, so it can be used only with '.format(key)
+                + 'executor="process".',
+            )
+
+    if fname is None:
+        formats = [savefig_kwargs.get('format', 'png')]
+    else:
+        formats = [
+            fmt for _, fmt in _savefig_targets(fname, savefig_kwargs.get('format'))
+        ]
+    if any(_PIL_FORMATS.get(fmt, fmt) == 'jpeg' for fmt in formats):
+        raise ValueError(
+            'jpeg files change the rcParams, so they can be saved only with '
+            + 'executor="process".',
+        )
+
+    if plt.rcParams['axes.formatter.use_mathtext']:
+        raise ValueError(
+            'mathtext is not thread-safe, so mathtext tick labels, e.g. of '
+            + 'latex="fast", can be used only with executor="process".',
+        )
+
+
+def _create_figure(func, args, kwargs, fname, savefig_kwargs, attached):
+    """Create and save a figure, return the encoded figure or None."""
+    args = [_attach(arg, attached) for arg in args]
+    kwargs = {key: _attach(arg, attached) for key, arg in kwargs.items()}
+    fig = func(*args, **kwargs)
+    if not isinstance(fig, Figure):
+        raise TypeError(
+            'func needs to return a matplotlib figure, not '
+            + '{0}.'.format(type(fig).__name__),
+        )
+    try:
+        if fname is None:
+            return savefig_bytes(fig, **savefig_kwargs)
+        savefig(fname, fig=fig, **savefig_kwargs)
+    finally:
+        plt.close(fig)
+    return None
+
+
+def _attach(arg, attached):
+    """Return read-only view of shared array, other arguments unchanged."""
+    if not isinstance(arg, SharedArray):
+        return arg
+    shm = shared_memory.SharedMemory(name=arg.name)
+    view = np.ndarray(arg.shape, dtype=arg.dtype, buffer=shm.buf)
+    view.flags.writeable = False
+    # all arrays derived from the view keep it alive, so the memory may be
+    # closed once the view is freed
+    attached.append((shm, weakref.ref(view)))
+    return view
+
+
+def _detach(attached):
+    """Close shared memory of a finished task, retry referenced ones later.
+
+    The memory of views which are still referenced, e.g. by reference cycles
+    of the closed figure, can not be closed yet, as numpy does not prevent
+    closing it. These are retried after the next task, once the garbage
+    collector freed them.
+
+    """
+    with _ATTACHED_LOCK:
+        _ATTACHED.extend(attached)
+        referenced = []
+        for shm, view in _ATTACHED:
+            if view() is None:
+                shm.close()
+            else:
+                referenced.append((shm, view))
+        _ATTACHED[:] = referenced
+
+
+def _get_result(fname, future):
+    """Return result of future, including errors of the pool itself."""
+    try:
+        return future.result()
+    except Exception as error:
+        return TaskResult(fname, None, None, None, 0.0, error)
@@ -5,23 +5,46 @@
 """Wrapper for matplotlib plotting functions."""
 
 # ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import contextlib
+import functools
 import warnings
-from os import path
+from io import BytesIO
+from os import PathLike, path
 
+import matplotlib as mpl
 import numpy as np
+from matplotlib import collections as mcollections
 from matplotlib import colors as mcolors
+from matplotlib import image as mimage
 from matplotlib import legend as mlegend
 from matplotlib import lines as mlines
 from matplotlib import patches as mpatches
 from matplotlib import pyplot as plt
+from matplotlib import spines as mspines
+from matplotlib import text as mtext
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.collections import PathCollection
 from matplotlib.container import BarContainer, ErrorbarContainer
 from matplotlib import ticker as mticker
 from mpl_toolkits import axes_grid1 as mpl_axes_grid1
 
 import prettypyplot as _pplt
+from prettypyplot import cache as pcache
+from prettypyplot import tex as ptex
 from prettypyplot import tools
-from prettypyplot.style import Mode, Style
+from prettypyplot.style import (
+    Mode,
+    Style,
+    _get_profile,
+    _get_scale,
+    _parse_mode,
+    _parse_profile,
+    style_context,
+)
+
+
+# names of raster formats used by pillow
+_PIL_FORMATS = {'jpg': 'jpeg', 'tif': 'tiff'}
 
 
 # ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -85,43 +108,584 @@ def plot(*args, ax=None, **kwargs):
     return lines
 
 
-def savefig(fname, reference_ax=None, use_canvas_size=True, **kwargs):
+def savefig(
+    fname,
+    reference_ax=None,
+    use_canvas_size=True,
+    modes=None,
+    profile=None,
+    cache=None,
+    fig=None,
+    **kwargs,
+):
     """Save figure as png and pdf.
 
-    This methods corrects figsize for poster/beamer mode.
+    This methods corrects figsize for poster/beamer mode. If `text.usetex` is
+    enabled, all LaTeX strings are precompiled in parallel, see
+    [warmup_tex][prettypyplot.tex.warmup_tex].
+
+    To save the figure in multiple formats, pass a list of filenames or of
+    formats. The figure is then resized and laid out only once and all raster
+    formats are encoded from a single rendering.
+
+    To save the figure in multiple modes, pass a list of modes. For each mode,
+    the line widths, font sizes and tick sizes of all artists are rescaled in
+    place, the figure is laid out again and saved with the mode appended to
+    the filename, e.g. `fig_print.pdf`. Afterwards, the figure is restored.
+    Only the spacing of legends, which is fixed on their creation, is kept.
+
+    To trade quality for speed, pass an export profile. It sets the dpi, the
+    pdf and png compression level and the path simplification for this save
+    only. Explicitly passed `dpi` and `pil_kwargs` take precedence.
+
+    | profile | dpi | pdf compression | png compression | simplify threshold |
+    | ------- | --- | --------------- | --------------- | ------------------ |
+    | draft   | 100 | 1               | 1               | 0.5                |
+    | web     | 150 | 6               | 6               | 0.3                |
+    | print   | 384 | 9               | 9               | 0.2                |
+
+    !!! example
+        ```python
+        pplt.savefig('fig', format=['pdf', 'png', 'svg'])
+        pplt.savefig(['fig.pdf', 'thumbnail.png'])
+        pplt.savefig('fig', modes=['print', 'beamer', 'poster'])
+        pplt.savefig('preview.png', profile='draft')
+        pplt.savefig('fig.pdf', cache=True)
+        ```
+
+    Parameters
+    ----------
+    fname : str, list of str or file-like object
+        Output filename. If no file ending, pdf will be used. If `format` is
+        given, its file ending is appended unless `fname` ends with it
+        already, e.g. `savefig('fig', format='png')` writes `fig.png`. For
+        file-like objects the `format` or otherwise `savefig.format` is used.
+    reference_ax : Axes, optional
+        [matplotlib.axes.Axes][] used for resizing. If `None` first axes of
+        figure is used.
+    use_canvas_size : bool, optional
+        If True the specified figsize will be used as canvas size.
+    modes : list of str or Mode, optional
+        Save a variant of the figure for each of the given modes, see
+        [update_style][prettypyplot.update_style].
+    profile : str or Profile, optional
+        Export profile, one of `'draft'`, `'web'` or `'print'`, see
+        [Profile][prettypyplot.style.Profile].
+    cache : bool or RenderCache, optional
+        If True or a [RenderCache][prettypyplot.cache.RenderCache], the files
+        are copied from the cache if the figure was saved before with the
+        same state and options, instead of rendering it again.
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to save. If `None` the current figure
+        is used. Figures created without pyplot, e.g. by
+        `matplotlib.figure.Figure()`, are saved without touching the pyplot
+        state.
+    kwargs
+        See [matplotlib.pyplot.savefig][]. If `format` is a list of formats,
+        the file endings are appended to `fname`. The `pil_kwargs` are used
+        for the raster formats only.
+
+    """
+    _savefig_figure(
+        tools.gcf(fig),
+        fname,
+        reference_ax=reference_ax,
+        use_canvas_size=use_canvas_size,
+        modes=modes,
+        profile=profile,
+        cache=cache,
+        **kwargs,
+    )
+
+
+def savefig_bytes(
+    fig=None,
+    format='png',
+    reference_ax=None,
+    use_canvas_size=True,
+    profile=None,
+    cache=None,
+    **kwargs,
+):
+    """Save figure in memory and return the encoded bytes.
+
+    The figure is resized as in [savefig][prettypyplot.savefig], but written
+    to memory instead of a file, e.g. to serve it by a web service.
 
     Parameters
     ----------
-    fname : str
-        Output filename. If no file ending, pdf will be used.
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to save. If `None` the current figure is
+        used.
+    format : str, optional
+        File format, e.g. `'png'`, `'svg'` or `'pdf'`.
     reference_ax : Axes, optional
         [matplotlib.axes.Axes][] used for resizing. If `None` first axes of
         figure is used.
     use_canvas_size : bool, optional
         If True the specified figsize will be used as canvas size.
+    profile : str or Profile, optional
+        Export profile, see [savefig][prettypyplot.savefig].
+    cache : bool or RenderCache, optional
+        Use the render cache, see [savefig][prettypyplot.savefig].
     kwargs
         See [matplotlib.pyplot.savefig][].
 
+    Returns
+    -------
+    data : bytes
+        Encoded figure.
+
+    """
+    fig = tools.gcf(fig)
+
+    buffer = BytesIO()
+    _savefig_figure(
+        fig,
+        buffer,
+        reference_ax=reference_ax,
+        use_canvas_size=use_canvas_size,
+        profile=profile,
+        cache=cache,
+        format=format,
+        **kwargs,
+    )
+    return buffer.getvalue()
+
+
+def to_array(
+    fig=None,
+    *,
+    out=None,
+    copy=False,
+    dpi=None,
+    reference_ax=None,
+    use_canvas_size=True,
+):
+    """Render figure with Agg and return its RGBA pixels.
+
+    The figure is resized as in [savefig][prettypyplot.savefig] and drawn
+    once. By default, the returned array is a view onto the buffer of the
+    renderer without copying, which might be overwritten by the next drawing
+    of the figure. To avoid allocating a new array for each frame, pass a
+    preallocated array as `out`.
+
+    !!! example
+        ```python
+        frame = None
+        for data in frames:
+            line.set_ydata(data)
+            frame = pplt.to_array(fig, out=frame, copy=frame is None)
+            writer.append(frame)
+        ```
+
+    Parameters
+    ----------
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to render. If `None` the current figure
+        is used.
+    out : ndarray, optional
+        Preallocated array of shape `(height, width, 4)` and dtype uint8 to
+        copy the pixels into. It is returned instead of a view.
+    copy : bool, optional
+        If True, return a copy instead of a view onto the renderer buffer.
+    dpi : float, optional
+        Resolution in dots per inch. If `None` the dpi of the figure is used.
+    reference_ax : Axes, optional
+        [matplotlib.axes.Axes][] used for resizing. If `None` first axes of
+        figure is used.
+    use_canvas_size : bool, optional
+        If True the specified figsize will be used as canvas size.
+
+    Returns
+    -------
+    pixels : ndarray
+        RGBA pixels of shape `(height, width, 4)` and dtype uint8.
+
     """
+    fig = tools.gcf(fig)
+
     set_figsize = _resize_canvas(
         reference_ax=reference_ax,
         use_canvas_size=use_canvas_size,
+        fig=fig,
     )
+    set_dpi = fig.get_dpi()
+    if dpi is not None:
+        fig.set_dpi(dpi)
+
+    canvas = fig.canvas
+    agg_canvas = canvas if isinstance(canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    try:
+        agg_canvas.draw()
+        pixels = np.asarray(agg_canvas.buffer_rgba())
+    finally:
+        fig.set_canvas(canvas)
+        fig.set_dpi(set_dpi)
+        # reset figsize, if user calls this function multiple times on same figure
+        fig.set_size_inches(set_figsize)
+
+    if out is not None:
+        if out.shape != pixels.shape:
+            raise ValueError(
+                'out has shape {0}, but the figure has shape {1}.'.format(
+                    out.shape,
+                    pixels.shape,
+                ),
+            )
+        np.copyto(out, pixels)
+        return out
+    return pixels.copy() if copy else pixels
+
+
+def _savefig_figure(
+    fig,
+    fname,
+    reference_ax=None,
+    use_canvas_size=True,
+    modes=None,
+    profile=None,
+    cache=None,
+    **kwargs,
+):
+    """Save given figure, see savefig."""
+    targets = _savefig_targets(fname, kwargs.pop('format', None))
+    cache = pcache._get_cache(cache)
+    profile_rc = {}
+    if profile is not None:
+        profile_rc, pil_kwargs = _get_profile(_parse_profile(profile))
+        # pass dpi and compression explicitly, as modes overwrite the rc
+        kwargs.setdefault('dpi', profile_rc['savefig.dpi'])
+        kwargs['pil_kwargs'] = {**pil_kwargs, **(kwargs.get('pil_kwargs') or {})}
+
+    with _rc_context(profile_rc):
+        # hash the figure before it is laid out, as the layout depends on the
+        # layout of previous drawings
+        key = None
+        if cache is not None:
+            key = cache.key(
+                fig,
+                reference_ax=(
+                    None if reference_ax is None else fig.axes.index(reference_ax)
+                ),
+                use_canvas_size=use_canvas_size,
+                kwargs=kwargs,
+            )
+
+        if modes is None:
+            _savefig_cached(
+                cache,
+                key,
+                targets,
+                functools.partial(
+                    _savefig,
+                    fig,
+                    reference_ax=reference_ax,
+                    use_canvas_size=use_canvas_size,
+                    kwargs=kwargs,
+                ),
+            )
+            return
+
+        for mode in modes:
+            mode = _parse_mode(mode)
+            _savefig_cached(
+                cache,
+                None if key is None else '{0}-{1}'.format(key, mode.name.lower()),
+                [(_mode_fname(fname, fmt, mode), fmt) for fname, fmt in targets],
+                functools.partial(
+                    _savefig_mode,
+                    fig,
+                    mode=mode,
+                    profile_rc=profile_rc,
+                    reference_ax=reference_ax,
+                    use_canvas_size=use_canvas_size,
+                    kwargs=kwargs,
+                ),
+            )
+
+
+def _savefig_cached(cache, key, targets, render):
+    """Save targets with render function, reusing cached files if possible."""
+    if cache is None:
+        render(targets)
+    else:
+        cache.savefig(key, targets, render)
+
+
+def _rc_context(rc):
+    """Return context setting the rc parameters, if any are given."""
+    if not rc:
+        return contextlib.nullcontext()
+    return mpl.rc_context(rc)
+
+
+def _savefig_mode(
+    fig,
+    targets,
+    *,
+    mode,
+    profile_rc,
+    reference_ax,
+    use_canvas_size,
+    kwargs,
+):
+    """Rescale figure to the given mode and save it to all targets."""
+    # the profile needs to be applied after the mode to overwrite its rc
+    with _mode_context(fig, mode), _rc_context(profile_rc):
+        _savefig(fig, targets, reference_ax, use_canvas_size, kwargs)
+
+
+def _mode_fname(fname, fmt, mode):
+    """Append mode to filename, keeping its file ending."""
+    if hasattr(fname, 'write'):
+        raise ValueError('Multiple modes can not be written to a file object.')
+    root, ext = path.splitext(fname)
+    if ext[1:].lower() != fmt:
+        root, ext = fname, ''
+    return '{0}_{1}{2}'.format(root, mode.name.lower(), ext)
+
+
+def _savefig(fig, targets, reference_ax, use_canvas_size, kwargs):
+    """Resize and lay out figure once and save it to all targets."""
+    set_figsize = _resize_canvas(
+        reference_ax=reference_ax,
+        use_canvas_size=use_canvas_size,
+        fig=fig,
+    )
+
+    # compile all latex strings at once instead of while drawing
+    if plt.rcParams['text.usetex']:
+        ptex.warmup_tex(fig, dpi=_raster_dpi(fig, targets, kwargs))
 
-    # save as pdf if not specified
-    if 'format' not in kwargs:
-        if path.splitext(fname)[1][1:] == '':
-            fname = '{0}.pdf'.format(fname)
+    # encode all raster formats from a single rendering
+    rasters = [(fname, fmt) for fname, fmt in targets if fmt in ptex.RASTER_FORMATS]
+    share_raster = len(rasters) > 1
+    if share_raster:
+        _savefig_rasters(fig, rasters, **kwargs)
 
     # save fig
-    plt.savefig(fname, **kwargs)
+    for fname, fmt in targets:
+        if fmt in ptex.RASTER_FORMATS:
+            if not share_raster:
+                fig.savefig(fname, format=fmt, **kwargs)
+        else:
+            # options of pillow are not supported by the vector backends
+            fig.savefig(
+                fname,
+                format=fmt,
+                **{key: val for key, val in kwargs.items() if key != 'pil_kwargs'},
+            )
 
     # reset figsize, if user calls this function multiple times on same figure
-    fig = plt.gcf()
     fig.set_size_inches(set_figsize)
 
 
-def show(reference_ax=None, use_canvas_size=True, **kwargs):
+def _savefig_targets(fname, fileformat):
+    """Return list of filenames and formats to save the figure to."""
+    if hasattr(fname, 'write'):
+        if not (fileformat is None or isinstance(fileformat, str)):
+            raise ValueError('Only a single format can be written to a file object.')
+        fileformat = fileformat or plt.rcParams['savefig.format']
+        return [(fname, fileformat.lower())]
+
+    if isinstance(fname, (str, PathLike)):
+        fnames = [fname]
+    else:
+        fnames = list(fname)
+
+    if fileformat is None:
+        formats = [None] * len(fnames)
+    elif isinstance(fileformat, str):
+        # append file ending, as for lists of formats
+        formats = [fileformat.lower()] * len(fnames)
+        fnames = [
+            '{0}.{1}'.format(_strip_ending(fname, formats), fmt)
+            for fname, fmt in zip(fnames, formats)
+        ]
+    elif len(fnames) == 1:
+        formats = [fmt.lower() for fmt in fileformat]
+        root = _strip_ending(fnames[0], formats)
+        fnames = ['{0}.{1}'.format(root, fmt) for fmt in formats]
+    else:
+        raise ValueError('Only one of fname and format can be a list.')
+
+    targets = []
+    for fname, fmt in zip(fnames, formats):
+        # save as pdf if not specified
+        if fmt is None:
+            fmt = path.splitext(fname)[1][1:].lower()
+            if fmt == '':
+                fname, fmt = '{0}.pdf'.format(fname), 'pdf'
+        targets.append((fname, fmt))
+    return targets
+
+
+def _strip_ending(fname, formats):
+    """Return fname without its file ending, if it is one of the formats."""
+    root, ext = path.splitext(fname)
+    if ext[1:].lower() in formats:
+        return root
+    return fname
+
+
+def _raster_dpi(fig, targets, kwargs):
+    """Return dpi of savefig if a raster format is used, else None."""
+    if all(fmt not in ptex.RASTER_FORMATS for _, fmt in targets):
+        return None
+    dpi = kwargs.get('dpi') or plt.rcParams['savefig.dpi']
+    return fig.dpi if dpi == 'figure' else dpi
+
+
+class _RasterCanvas(FigureCanvasAgg):
+    """Agg canvas keeping the rendered image instead of writing a png."""
+
+    def print_png(self, filename_or_obj, **kwargs):
+        FigureCanvasAgg.draw(self)
+        self.image = np.array(self.buffer_rgba())
+        self.image_dpi = self.figure.dpi
+
+
+def _savefig_rasters(fig, targets, *, metadata=None, pil_kwargs=None, **kwargs):
+    """Render figure once with Agg and encode it in all raster formats."""
+    image, dpi = _render_raster(fig, **kwargs)
+    image = memoryview(image)
+    for fname, fmt in targets:
+        _encode_raster(image, dpi, fname, fmt, metadata, pil_kwargs)
+
+
+def _render_raster(fig, **kwargs):
+    """Render figure with Agg, return copy of RGBA image and its dpi."""
+    canvas = fig.canvas
+    raster_canvas = _RasterCanvas(fig)
+    try:
+        fig.savefig(BytesIO(), format='png', **kwargs)
+    finally:
+        fig.set_canvas(canvas)
+    return raster_canvas.image, raster_canvas.image_dpi
+
+
+def _encode_raster(image, dpi, fname, fmt, metadata=None, pil_kwargs=None):
+    """Encode rendered RGBA image in given raster format."""
+    fmt = _PIL_FORMATS.get(fmt, fmt)
+    # blend semi-transparent figures against white, as matplotlib does. The
+    # rcParams are global, so they are changed only if needed.
+    if fmt == 'jpeg':
+        context = mpl.rc_context({'savefig.facecolor': 'white'})
+    else:
+        context = contextlib.nullcontext()
+    with context:
+        mimage.imsave(
+            fname,
+            image,
+            format=fmt,
+            origin='upper',
+            dpi=dpi,
+            metadata=metadata,
+            pil_kwargs=pil_kwargs,
+        )
+
+
+@contextlib.contextmanager
+def _mode_context(fig, mode):
+    """Temporarily rescale the figure and rcParams to the given mode.
+
+    All widths and font sizes are scaled by the ratio of the scales of the
+    given and the current mode, see `prettypyplot.style._set_rc_widths`.
+
+    """
+    scales = _get_scale(mode)
+    ratios = {key: scales[key] / scale for key, scale in _get_scale(_pplt.MODE).items()}
+    undo = []
+    with style_context(mode=mode):
+        try:
+            _rescale_artists(fig, ratios, undo)
+            yield
+        finally:
+            for func in reversed(undo):
+                func()
+
+
+def _rescale_artists(fig, ratios, undo):
+    """Rescale artists of figure in place and append the undo steps."""
+    # collecting all artists creates the ticks for the current tick locations
+    artists = fig.findobj()
+
+    tick_artists = set()
+    for ax in fig.get_axes():
+        for axis in (ax.xaxis, ax.yaxis):
+            for which, ticks in (
+                ('major', axis.majorTicks),
+                ('minor', axis.minorTicks),
+            ):
+                tick_artists.update(_rescale_ticks(axis, which, ticks, ratios, undo))
+
+    for artist in artists:
+        if artist not in tick_artists:
+            _rescale_artist(artist, ratios, undo)
+
+
+def _rescale_artist(artist, ratios, undo):
+    """Rescale font size and widths of a single artist."""
+    if isinstance(artist, mtext.Text):
+        _rescale_property(artist, 'fontsize', ratios['fontsize'], undo)
+    elif isinstance(artist, mlines.Line2D):
+        _rescale_property(artist, 'linewidth', ratios['large_scale'], undo)
+        _rescale_property(artist, 'markersize', ratios['large_scale'], undo)
+        _rescale_property(artist, 'markeredgewidth', ratios['medium_scale'], undo)
+    elif isinstance(artist, mspines.Spine):
+        _rescale_property(artist, 'linewidth', ratios['small_scale'], undo)
+    elif isinstance(artist, mpatches.Patch):
+        _rescale_property(artist, 'linewidth', ratios['medium_scale'], undo)
+    elif isinstance(artist, mcollections.Collection):
+        _rescale_property(artist, 'linewidth', ratios['medium_scale'], undo)
+        if isinstance(artist, PathCollection):
+            # sizes are given as area
+            _rescale_property(artist, 'sizes', ratios['large_scale'] ** 2, undo)
+
+
+def _rescale_ticks(axis, which, ticks, ratios, undo):
+    """Rescale ticks of axis and return all artists of the ticks."""
+    if not ticks:
+        return []
+
+    tick = ticks[0]
+    params = {
+        'size': tick.tick1line.get_markersize(),
+        'width': tick.tick1line.get_markeredgewidth(),
+        'pad': tick.get_pad(),
+        'labelsize': tick.label1.get_fontsize(),
+        'grid_linewidth': tick.gridline.get_linewidth(),
+    }
+    tick_kw = '_{0}_tick_kw'.format(which)
+    undo.append(
+        functools.partial(setattr, axis, tick_kw, dict(getattr(axis, tick_kw))),
+    )
+    undo.append(functools.partial(axis.set_tick_params, which=which, **params))
+
+    scales = {
+        'size': ratios['tick_scale'],
+        'width': ratios['small_scale'],
+        'pad': ratios['tick_scale'],
+        'labelsize': ratios['fontsize'],
+        'grid_linewidth': ratios['small_scale'],
+    }
+    axis.set_tick_params(
+        which=which,
+        **{key: val * scales[key] for key, val in params.items()},
+    )
+    return [child for tick in ticks for child in tick.get_children()]
+
+
+def _rescale_property(artist, prop, scale, undo):
+    """Multiply property of artist by scale and append the undo step."""
+    val = getattr(artist, 'get_{0}'.format(prop))()
+    setter = getattr(artist, 'set_{0}'.format(prop))
+    undo.append(functools.partial(setter, val))
+    setter(np.multiply(val, scale))
+
+
+def show(reference_ax=None, use_canvas_size=True, *, fig=None, **kwargs):
     """Show figure and rescale similar to pplt.savefig.
 
     Parameters
@@ -131,24 +695,28 @@ def show(reference_ax=None, use_canvas_size=True, **kwargs):
         figure is used.
     use_canvas_size : bool, optional
         If True the specified figsize will be used as canvas size.
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to rescale. If `None` the current figure
+        is used.
     kwargs
         See [matplotlib.pyplot.show][].
 
     """
+    fig = tools.gcf(fig)
     set_figsize = _resize_canvas(
         reference_ax=reference_ax,
         use_canvas_size=use_canvas_size,
+        fig=fig,
     )
 
     # save fig
     plt.show(**kwargs)
 
     # reset figsize, if user calls this function multiple times on same figure
-    fig = plt.gcf()
     fig.set_size_inches(set_figsize)
 
 
-def _resize_canvas(reference_ax=None, use_canvas_size=True):
+def _resize_canvas(reference_ax=None, use_canvas_size=True, fig=None):
     """Resize canvas size.
 
     Parameters
@@ -158,13 +726,16 @@ def _resize_canvas(reference_ax=None, use_canvas_size=True):
         figure is used.
     use_canvas_size : bool, optional
         If True the specified figsize will be used as canvas size.
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to resize. If `None` the current figure
+        is used.
 
     Returns
     -------
     figsize : Tuple(float)
         Original fig size to restore size.
     """
-    fig = plt.gcf()
+    fig = tools.gcf(fig)
     if reference_ax is None:
         reference_ax = fig.get_axes()[0]
     figsize = fig.get_size_inches()
@@ -316,7 +887,7 @@ def legend(*args, outside=False, ax=None, axs=None, deduplicate=True, **kwargs):
 
     # shift axis to opposite side.
     if outside:
-        activate_axis(_opposite_side(outside))
+        activate_axis(_opposite_side(outside), ax=ax)
 
     # set anchor, mode and location
     kwargs = {**default_kwargs.get(outside, {}), **kwargs}
@@ -620,7 +1191,16 @@ def activate_axis(position, ax=None):
         axis.set_label_position(pos)
 
 
-def colorbar(im, width='7%', pad='0%', position='right', label=None, **kwargs):
+def colorbar(
+    im,
+    width='7%',
+    pad='0%',
+    position='right',
+    label=None,
+    *,
+    ax=None,
+    **kwargs,
+):
     """Generate colorbar of same height as image.
 
     Wrapper around pyplot.colorbar which corrects the height.
@@ -644,6 +1224,9 @@ def colorbar(im, width='7%', pad='0%', position='right', label=None, **kwargs):
         plotted, choose one of ['left', 'top', 'right', 'bottom']
     label : str, optional
         Specify the colorbar label.
+    ax : Axes, optional
+        [matplotlib.axes.Axes][] of the image. If `None` the axes of `im` is
+        used or, if not available, the current axes.
     kwargs
         Colorbar properties of, [matplotlib.pyplot.colorbar][].
 
@@ -658,18 +1241,15 @@ def colorbar(im, width='7%', pad='0%', position='right', label=None, **kwargs):
         orientation = 'horizontal'
 
     # get axes
-    if hasattr(im, 'axes'):
-        ax = im.axes
-    elif hasattr(im, 'ax'):
-        ax = im.ax
-    else:
-        ax = plt.gca()
+    if ax is None:
+        ax = getattr(im, 'axes', None) or getattr(im, 'ax', None)
+    ax = tools.gca(ax)
 
     # generate divider
     divider = mpl_axes_grid1.make_axes_locatable(ax)
     cax = divider.append_axes(position, width, pad=pad)
 
-    cbar = plt.colorbar(im, cax=cax, orientation=orientation, **kwargs)
+    cbar = cax.figure.colorbar(im, cax=cax, orientation=orientation, **kwargs)
     if label:
         cbar.set_label(label)
 
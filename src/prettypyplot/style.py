@@ -5,14 +5,23 @@
 """Set-up matplotlib environment."""
 
 # ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import contextlib
+import functools
 import shutil
+import threading
 from enum import Enum, auto
 from os import path as ospath
 
+import matplotlib as mpl
 import numpy as np
 from matplotlib import pyplot as plt
 from decorit import copy_doc_params
 
+try:  # mpl >= 3.11
+    from matplotlib.style import _STYLE_BLACKLIST
+except ImportError:  # pragma: no cover
+    from matplotlib.style.core import STYLE_BLACKLIST as _STYLE_BLACKLIST
+
 import prettypyplot as _pplt
 from prettypyplot import tools
 from prettypyplot import colors as pclr
@@ -53,6 +62,47 @@ class Mode(Enum):
         return list(cls.__members__.keys())
 
 
+class Profile(Enum):
+    """Enum for all export profiles of savefig."""
+
+    DRAFT = auto()
+    # low resolution and fast compression, good for drafts and CI previews
+    WEB = auto()
+    # medium resolution and compression, good for websites
+    PRINT = auto()
+    # high resolution and maximal compression, good for publications
+
+    @classmethod
+    def keys_list(cls):
+        """Return list of available Profile names."""
+        return list(cls.__members__.keys())
+
+
+# settings of use_style stored in STYLE_DICT, which define the rcParams
+_STYLE_SETTINGS = (
+    'colors',
+    'cmap',
+    'ncs',
+    'figsize',
+    'figratio',
+    'ipython',
+    'true_black',
+    'latex',
+    'sf',
+)
+
+# cache of compiled rcParams used by style_context
+_RC_SNAPSHOTS = {}
+
+# cache of the rcParams differing between two snapshots
+_RC_DIFFS = {}
+
+# lock serializing updates of the style, mode and style settings
+_STYLE_LOCK = threading.RLock()
+
+# rcParams to restore on exit of the active style contexts, oldest first
+_RC_STACK = []
+
 # set default mode and style
 if _pplt.MODE is None:
     _pplt.MODE = Mode.DEFAULT
@@ -61,7 +111,7 @@ if _pplt.STYLE is None:
 
 
 # ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-def update_style(  # noqa: C901
+def update_style(
     interactive=None,
     colors=None,
     cmap=None,
@@ -115,68 +165,186 @@ def update_style(  # noqa: C901
         jupyter notebook/lab.
     true_black : bool, optional
         If true black will be used for labels and co., else a dark grey.
-    latex : bool, optional
-        If true LaTeX font will be used.
+    latex : bool or str, optional
+        If true LaTeX font will be used. Rendering every text with LaTeX is
+        slow, so use `'fast'` to mimic the LaTeX font with matplotlib's
+        mathtext instead. This needs no LaTeX installation.
     sf : bool, optional
         Use sans-serif font for text and latex math environment.
 
+    Returns
+    -------
+    n_changed : int
+        Number of rcParams which were changed. Only parameters differing from
+        the current state are written.
+
     """
-    # set selected mode and style
-    if style is not None:
-        if isinstance(style, Style):
-            pass
-        elif isinstance(style, str) and style.upper() in Style.keys_list():
-            style = Style[style.upper()]
-        else:
-            raise ValueError(
-                'Style "{st}" is not supported, use one of {sts}.'.format(
-                    st=style,
-                    sts=Style.keys_list(),
-                ),
-            )
-        _pplt.STYLE = style
+    return _update_style(
+        interactive=interactive,
+        colors=colors,
+        cmap=cmap,
+        ncs=ncs,
+        figsize=figsize,
+        figratio=figratio,
+        mode=mode,
+        style=style,
+        ipython=ipython,
+        true_black=true_black,
+        latex=latex,
+        sf=sf,
+        reset=False,
+    )
 
-    if mode is not None:
-        if isinstance(mode, Mode):
-            pass
-        elif isinstance(mode, str) and mode.upper() in Mode.keys_list():
-            mode = Mode[mode.upper()]
-        else:
-            raise ValueError(
-                'Mode "{mode}" is not supported, use one of {modes}.'.format(
-                    mode=mode,
-                    modes=Mode.keys_list(),
-                ),
-            )
 
-        _pplt.MODE = mode
-
-    # set style variables in dictionary
-    for key, val in (
-        ('interactive', interactive),
-        ('colors', colors),
-        ('cmap', cmap),
-        ('ncs', ncs),
-        ('figsize', figsize),
-        ('figratio', figratio),
-        ('ipython', ipython),
-        ('true_black', true_black),
-        ('latex', latex),
-        ('sf', sf),
-    ):
-        if val is not None:
-            _pplt.STYLE_DICT[key] = val
-
-    if _pplt.STYLE is Style.NONE:
-        _reset_style()
-    else:
+def _update_style(
+    *,
+    interactive,
+    colors,
+    cmap,
+    ncs,
+    figsize,
+    figratio,
+    mode,
+    style,
+    ipython,
+    true_black,
+    latex,
+    sf,
+    reset,
+):
+    """Update style, see update_style, and start from mpl defaults if reset."""
+    if isinstance(latex, str) and latex != 'fast':
+        raise ValueError(
+            'Latex "{latex}" is not supported, use a bool or "fast".'.format(
+                latex=latex,
+            ),
+        )
+
+    with _STYLE_LOCK:
+        # set selected mode and style
+        if style is not None:
+            style = _parse_style(style)
+            _pplt.STYLE = style
+
+        if mode is not None:
+            mode = _parse_mode(mode)
+            _pplt.MODE = mode
+
+        # set style variables in a copy of the dictionary, so that concurrent
+        # readers never see a partially updated dictionary
+        style_dict = dict(_pplt.STYLE_DICT)
+        for key, val in (
+            ('interactive', interactive),
+            ('colors', colors),
+            ('cmap', cmap),
+            ('ncs', ncs),
+            ('figsize', figsize),
+            ('figratio', figratio),
+            ('ipython', ipython),
+            ('true_black', true_black),
+            ('latex', latex),
+            ('sf', sf),
+        ):
+            if val is not None:
+                style_dict[key] = val
+        _pplt.STYLE_DICT = style_dict
+
+        if _pplt.STYLE is not Style.NONE:
+            # set interactive mode
+            _set_ineractive_mode(interactive=interactive)
+
+        rc = _compile_rc(
+            style=_pplt.STYLE,
+            mode=mode,
+            reset=reset,
+            colors=colors,
+            cmap=cmap,
+            ncs=ncs,
+            figsize=figsize,
+            figratio=figratio,
+            ipython=ipython,
+            true_black=true_black,
+            latex=latex,
+            sf=sf,
+        )
+        return _apply_rc(rc)
+
+
+def _parse_style(style):
+    """Parse style to Style."""
+    if isinstance(style, Style):
+        return style
+    elif isinstance(style, str) and style.upper() in Style.keys_list():
+        return Style[style.upper()]
+    raise ValueError(
+        'Style "{st}" is not supported, use one of {sts}.'.format(
+            st=style,
+            sts=Style.keys_list(),
+        ),
+    )
+
+
+def _parse_mode(mode):
+    """Parse mode to Mode."""
+    if isinstance(mode, Mode):
+        return mode
+    elif isinstance(mode, str) and mode.upper() in Mode.keys_list():
+        return Mode[mode.upper()]
+    raise ValueError(
+        'Mode "{mode}" is not supported, use one of {modes}.'.format(
+            mode=mode,
+            modes=Mode.keys_list(),
+        ),
+    )
+
+
+def _parse_profile(profile):
+    """Parse profile to Profile."""
+    if isinstance(profile, Profile):
+        return profile
+    elif isinstance(profile, str) and profile.upper() in Profile.keys_list():
+        return Profile[profile.upper()]
+    raise ValueError(
+        'Profile "{profile}" is not supported, use one of {profiles}.'.format(
+            profile=profile,
+            profiles=Profile.keys_list(),
+        ),
+    )
+
+
+def _compile_rc(
+    *,
+    style,
+    mode,
+    reset,
+    colors,
+    cmap,
+    ncs,
+    figsize,
+    figratio,
+    ipython,
+    true_black,
+    latex,
+    sf,
+):
+    """Return target rcParams of style without changing the current ones.
+
+    The target falls back to the current rcParams or, if reset or style is
+    `Style.NONE`, to the matplotlib defaults.
+
+    """
+    reset = reset or style is Style.NONE
+    rc = _RcTarget(mpl.rcParamsDefault if reset else plt.rcParams)
+
+    if style is not Style.NONE:
         # load static rcParams
-        _apply_style('stylelib/default.mplstyle')
-        if _pplt.STYLE is Style.MINIMAL:
-            _apply_style('stylelib/minimal.mplstyle')
+        _apply_style('stylelib/default.mplstyle', rc)
+        if style is Style.MINIMAL:
+            _apply_style('stylelib/minimal.mplstyle', rc)
 
         # set color cycle and cmap
         _set_rc_colors(
+            rc,
             colors=colors,
             cmap=cmap,
             ncs=ncs,
@@ -185,25 +353,26 @@ def update_style(  # noqa: C901
 
         # set figsize
         if figsize is not None:
-            _set_rc_figsize(figratio=figratio, figsize=figsize)
+            _set_rc_figsize(rc, figratio=figratio, figsize=figsize)
 
         # increase dpi if not in iypthon
-        _set_rc_dpi(ipython)
-
-        # set interactive mode
-        _set_ineractive_mode(interactive=interactive)
+        _set_rc_dpi(rc, ipython)
 
         # setup LaTeX font if latex is available
         # plt.style.use can not be used.
-        if latex and shutil.which('latex'):
-            _apply_style('stylelib/latex.mplstyle')
+        if latex == 'fast':
+            _apply_style('stylelib/mathtext.mplstyle', rc)
+        elif latex and shutil.which('latex'):
+            _apply_style('stylelib/latex.mplstyle', rc)
 
         if sf:
-            _set_rc_sansserif()
+            _set_rc_sansserif(rc, mathtext=latex == 'fast')
 
     if mode is not None:
         # change widths and fontsize depending on MODE
-        _set_rc_widths(mode)
+        _set_rc_widths(rc, mode)
+
+    return rc
 
 
 @copy_doc_params(update_style)
@@ -229,15 +398,18 @@ def use_style(
 
     See [update_style][prettypyplot.update_style] for parameters.
 
-    """
-    # restore matplotlib defaults
-    _reset_style()
+    Returns
+    -------
+    n_changed : int
+        Number of rcParams which were changed. Only parameters differing from
+        the current state are written.
 
+    """
     # register own continuous and discrete cmaps
     pclr.load_cmaps()
 
-    # update style
-    update_style(
+    # restore matplotlib defaults and update style
+    n_changed = _update_style(
         interactive=interactive,
         colors=colors,
         cmap=cmap,
@@ -250,13 +422,175 @@ def use_style(
         true_black=true_black,
         latex=latex,
         sf=sf,
+        reset=True,
     )
 
     # register used colors
     pclr.load_colors()
 
+    return n_changed
+
+
+@contextlib.contextmanager
+def style_context(style=None, mode=None):
+    """Context manager to temporarily use a different style and mode.
+
+    The rcParams of each combination of style, mode and the current settings
+    of [use_style][prettypyplot.use_style] are compiled only once and cached.
+    Only the rcParams which differ between the current and the new style and
+    mode are written on top of the current rcParams. Hence, switching is cheap
+    and rcParams changed after [use_style][prettypyplot.use_style], e.g.
+    `savefig.dpi`, are kept unless the new style or mode sets them. On exit,
+    the previous rcParams, style, mode and style settings are restored.
+
+    The style, mode and style settings are local to the current thread or
+    asyncio task, see [contextvars][]. The rcParams of matplotlib, however,
+    are shared by the whole process, so this context manager is not
+    concurrency-safe: concurrent tasks rendering figures overwrite each
+    other's rcParams. If the contexts of interleaved tasks exit in a
+    different order than they were entered, the rcParams are still restored
+    in last-in-first-out order, so that the rcParams before the first context
+    are restored once all contexts are exited.
+
+    !!! example
+        ```python
+        pplt.use_style(mode='print')
+        for mode in ('print', 'beamer'):
+            with pplt.style_context(mode=mode):
+                fig, ax = plt.subplots()
+                ...
+                pplt.savefig('fig_{0}.pdf'.format(mode))
+        ```
+
+    Parameters
+    ----------
+    style : str or Style, optional
+        Style to use, see [update_style][prettypyplot.update_style]. If `None`
+        the current style is used.
+    mode : str or Mode, optional
+        Mode to use, see [update_style][prettypyplot.update_style]. If `None`
+        the current mode is used.
+
+    """
+    style = _pplt.STYLE if style is None else _parse_style(style)
+    mode = _pplt.MODE if mode is None else _parse_mode(mode)
+
+    # store current rcParams to restore them later
+    with _STYLE_LOCK:
+        entry = {'previous': {key: plt.rcParams[key] for key in _rc_keys()}}
+        _RC_STACK.append(entry)
+        _write_rc(_rc_diff(style, mode, _pplt.STYLE_DICT))
+    token = _pplt._CONTEXT_STATE.set({
+        'STYLE': style,
+        'MODE': mode,
+        'STYLE_DICT': _pplt.STYLE_DICT.copy(),
+    })
+    try:
+        yield
+    finally:
+        _restore_rc(entry)
+        _pplt._CONTEXT_STATE.reset(token)
+
 
-def _set_rc_colors(colors, cmap, true_black, ncs):
+def _restore_rc(entry):
+    """Remove style context from stack and restore the rcParams in LIFO order.
+
+    If a context exits before the contexts entered after it, e.g. in
+    interleaved asyncio tasks, its previous rcParams are handed to the next
+    context on the stack instead of being written.
+
+    """
+    with _STYLE_LOCK:
+        idx = next(idx for idx, other in enumerate(_RC_STACK) if other is entry)
+        del _RC_STACK[idx]
+        if idx == len(_RC_STACK):
+            _write_rc(entry['previous'])
+        else:
+            _RC_STACK[idx]['previous'] = entry['previous']
+
+
+def _rc_snapshot(style, mode, style_dict):
+    """Return cached rcParams of use_style with given style, mode, and settings.
+
+    Parameters
+    ----------
+    style : Style
+        Style to use.
+    mode : Mode
+        Mode to use.
+    style_dict : dict
+        Settings of use_style, the interactive mode is ignored.
+
+    Returns
+    -------
+    rc : dict
+        Dictionary of all validated rcParams, which must not be modified.
+
+    """
+    cache_key = _snapshot_key(style, mode, style_dict)
+    if cache_key not in _RC_SNAPSHOTS:
+        rc = _compile_rc(
+            style=style,
+            mode=mode,
+            reset=True,
+            **{key: style_dict.get(key) for key in _STYLE_SETTINGS},
+        )
+        # concurrent threads share the first compiled snapshot
+        _RC_SNAPSHOTS.setdefault(cache_key, {key: rc[key] for key in _rc_keys()})
+    return _RC_SNAPSHOTS[cache_key]
+
+
+def _rc_diff(style, mode, style_dict):
+    """Return cached rcParams which differ from the snapshot of the current style.
+
+    Only these parameters are written by switching the style, so that
+    rcParams changed by the user after [use_style][prettypyplot.use_style]
+    are kept.
+
+    Parameters
+    ----------
+    style : Style
+        Style to switch to.
+    mode : Mode
+        Mode to switch to.
+    style_dict : dict
+        Settings of use_style to switch to.
+
+    Returns
+    -------
+    rc : dict
+        Dictionary of the differing validated rcParams, which must not be
+        modified.
+
+    """
+    current_key = _snapshot_key(_pplt.STYLE, _pplt.MODE, _pplt.STYLE_DICT)
+    cache_key = (current_key, _snapshot_key(style, mode, style_dict))
+    if cache_key not in _RC_DIFFS:
+        current = _rc_snapshot(_pplt.STYLE, _pplt.MODE, _pplt.STYLE_DICT)
+        target = _rc_snapshot(style, mode, style_dict)
+        _RC_DIFFS.setdefault(
+            cache_key,
+            {
+                key: val
+                for key, val in target.items()
+                if not _rc_equal(val, current[key])
+            },
+        )
+    return _RC_DIFFS[cache_key]
+
+
+def _snapshot_key(style, mode, style_dict):
+    """Return hashable key of style, mode and settings, ignoring interactive."""
+    settings = {key: val for key, val in style_dict.items() if key != 'interactive'}
+    return (style, mode, repr(sorted(settings.items())))
+
+
+def _rc_keys():
+    """Return all rcParams names which can be changed by styles."""
+    return mpl.rcParamsDefault.keys() - _STYLE_BLACKLIST
+
+
+def _set_rc_colors(rc, colors, cmap, true_black, ncs):
     """Set rcParams colors."""
     # set color cycle and cmap
     if colors is not None or ncs is not None:
@@ -265,7 +599,7 @@ def _set_rc_colors(colors, cmap, true_black, ncs):
         ncs = ncs if ncs is not None else _pplt.STYLE_DICT['ncs']
 
         clrs = plt.get_cmap(colors)
-        plt.rcParams['axes.prop_cycle'] = plt.cycler(
+        rc['axes.prop_cycle'] = plt.cycler(
             color=(
                 clrs.colors
                 if tools.is_discrete_cmap(colors)
@@ -274,7 +608,7 @@ def _set_rc_colors(colors, cmap, true_black, ncs):
         )
 
     if cmap is not None:
-        plt.rcParams['image.cmap'] = cmap
+        rc['image.cmap'] = cmap
 
     if true_black is not None:
         # change default colors
@@ -283,7 +617,7 @@ def _set_rc_colors(colors, cmap, true_black, ncs):
         else:
             grays = pclr.default_grays
 
-        plt.rcParams.update({
+        rc.update({
             'axes.edgecolor': grays.dark,
             'axes.labelcolor': grays.dark,
             'text.color': grays.dark,
@@ -294,16 +628,16 @@ def _set_rc_colors(colors, cmap, true_black, ncs):
         })
 
 
-def _set_rc_figsize(figratio, figsize):
+def _set_rc_figsize(rc, figratio, figsize):
     """Set rcParams figsize."""
     # setup figsize
     figsize = _parse_figsize(figsize, figratio)
 
     if figsize is not None:
-        plt.rcParams['figure.figsize'] = figsize
+        rc['figure.figsize'] = figsize
 
 
-def _set_rc_widths(mode):
+def _set_rc_widths(rc, mode):
     """Set rcParams widths and fontsizes according to mode."""
     scales = _get_scale(mode)
     if scales is not None:
@@ -353,25 +687,28 @@ def _set_rc_widths(mode):
         ]:
             scale = scales[scale]
             for rcParam, val in rcParamsVal:
-                plt.rcParams[rcParam] = scale * val
+                rc[rcParam] = scale * val
                 # apply all changes to yticks as well
                 if rcParam.startswith('xtick'):
-                    plt.rcParams['y{0}'.format(rcParam[1:])] = plt.rcParams[rcParam]
+                    rc['y{0}'.format(rcParam[1:])] = rc[rcParam]
 
 
-def _set_rc_dpi(ipython, dpi=384):
+def _set_rc_dpi(rc, ipython, dpi=384):
     """Set rcParams dpi."""
     if ipython is not None and not ipython:
-        plt.rcParams['figure.dpi'] = dpi
+        rc['figure.dpi'] = dpi
 
 
-def _set_rc_sansserif():
+def _set_rc_sansserif(rc, mathtext=False):
     """Set sans serif font."""
-    plt.rcParams.update({
+    rc.update({
         'font.family': 'sans-serif',
         'font.sans-serif': 'Helvetica',
     })
-    plt.rcParams['text.latex.preamble'] += r'\usepackage[helvet]{sfmath}'
+    if mathtext:
+        rc['mathtext.fontset'] = 'stixsans'
+    else:
+        rc['text.latex.preamble'] += r'\usepackage[helvet]{sfmath}'
 
 
 def _set_ineractive_mode(interactive):
@@ -418,18 +755,133 @@ def _get_scale(mode: Mode):
     return scale_dict.get(mode, scale_dict[Mode.DEFAULT])
 
 
-def _reset_style():
-    """Restore default matplotlib style."""
-    plt.rcdefaults()
+def _get_profile(profile: Profile):
+    """Get the rcParams and png options of the export profile."""
+    profile_dict = {
+        Profile.DRAFT: (
+            {
+                'savefig.dpi': 100,
+                'pdf.compression': 1,
+                'path.simplify_threshold': 0.5,
+            },
+            {'compress_level': 1},
+        ),
+        Profile.WEB: (
+            {
+                'savefig.dpi': 150,
+                'pdf.compression': 6,
+                'path.simplify_threshold': 0.3,
+            },
+            {'compress_level': 6},
+        ),
+        Profile.PRINT: (
+            {
+                'savefig.dpi': 384,
+                'pdf.compression': 9,
+                'path.simplify_threshold': 0.2,
+            },
+            {'compress_level': 9},
+        ),
+    }
+    return profile_dict[profile]
+
 
+class _RcTarget:
+    """Target rcParams, which fall back to the base for unset parameters.
 
-def _apply_style(path):
-    """Load mplstyle file at given relative path to this file."""
+    All set parameters are validated, so that they can be compared to the
+    current rcParams.
+
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.params = {}
+
+    def __getitem__(self, key):
+        if key in self.params:
+            return self.params[key]
+        return self.base[key]
+
+    def __setitem__(self, key, val):
+        self.params[key] = mpl.RcParams.validate[key](val)
+
+    def update(self, *args, **kwargs):
+        for key, val in dict(*args, **kwargs).items():
+            self[key] = val
+
+
+def _apply_rc(rc):
+    """Write target rcParams which differ from the current ones.
+
+    If the target falls back to the current rcParams, only the parameters set
+    in the target are compared, otherwise all parameters. Parameters which are
+    ignored by matplotlib styles, e.g. the backend, are skipped.
+
+    Parameters
+    ----------
+    rc : _RcTarget
+        Target rcParams.
+
+    Returns
+    -------
+    n_changed : int
+        Number of changed rcParams.
+
+    """
+    keys = set(rc.params)
+    if rc.base is not plt.rcParams:
+        keys.update(rc.base.keys())
+
+    return _write_rc({key: rc[key] for key in keys - _STYLE_BLACKLIST})
+
+
+def _write_rc(params):
+    """Write parameters which differ from the current rcParams.
+
+    Parameters
+    ----------
+    params : dict
+        Dictionary of validated rcParams.
+
+    Returns
+    -------
+    n_changed : int
+        Number of changed rcParams.
+
+    """
+    changed = {
+        key: val for key, val in params.items() if not _rc_equal(val, plt.rcParams[key])
+    }
+    plt.rcParams.update(changed)
+    return len(changed)
+
+
+def _rc_equal(val, ref):
+    """Check if two rcParams values are equal."""
+    try:
+        return bool(val == ref)
+    except ValueError:
+        # comparing numpy arrays, e.g. in color cycles, is ambiguous
+        return repr(val) == repr(ref)
+
+
+def _apply_style(path, rc):
+    """Apply mplstyle file at given relative path to this file to rc."""
+    rc.update(_load_style(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_style(path):
+    """Load mplstyle file at given relative path to this file.
+
+    The file is parsed only once per process and the resulting rcParams are
+    cached. The returned object must not be modified.
+
+    """
     module_dir = ospath.dirname(__file__)
     path = ospath.join(module_dir, path)
-
-    # load and apply style
-    plt.style.use(path)
+    return mpl.rc_params_from_file(path, use_default_template=False)
 
 
 def _parse_figratio(figratio):
@@ -7,13 +7,12 @@
 # ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 import matplotlib as mpl  # mpl = dm.tryImport('matplotlib')
 import numpy as np
-from matplotlib import pyplot as plt
 
 from prettypyplot import tools
 
 
 # ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-def hide_empty_axes(axs=None):
+def hide_empty_axes(axs=None, *, fig=None):
     """Hide empty axes.
 
     Loop over all axes and hide empty ones.
@@ -22,11 +21,14 @@ def hide_empty_axes(axs=None):
     ----------
     axs : mpl.axes.Axes or list of
         Specify [matplotlib.axes.Axes][] to check for empty state. Default use
-        all of current figure.
+        all of `fig`.
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] used if `axs` is `None`. If `None` the
+        current figure is used.
 
     """
     # check for single axes
-    axs = tools.get_axes(axs)
+    axs = tools.get_axes(axs, fig=fig)
 
     # loop over all axes and hide empty ones
     for ax in axs:
@@ -47,7 +49,7 @@ def _activate_outer_ticks(axs):
             ax.tick_params(axis='x', reset=True)
 
 
-def label_outer(axs=None):
+def label_outer(axs=None, *, fig=None):
     """Only show outer labels and tick labels.
 
     This checks for outest visible axes only. Works only with single Gridspec.
@@ -56,7 +58,10 @@ def label_outer(axs=None):
     ----------
     axs : mpl.axes.AxesSubplot or list of
         Specify [matplotlib.axes.Axes][] to check for labeling only outer.
-        Default use all of current figure.
+        Default use all of `fig`.
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] used if `axs` is `None`. If `None` the
+        current figure is used.
 
     """
     # check for single axes
@@ -67,7 +72,7 @@ def label_outer(axs=None):
                 'axs needs to be of type matplotlib.axes.AxesSuplot.',
             )
     else:
-        axs = [ax for ax in plt.gcf().get_axes() if _is_subplot_axes(ax)]
+        axs = [ax for ax in tools.get_axes(None, fig=fig) if _is_subplot_axes(ax)]
 
     for ax in axs:
         ss = ax.get_subplotspec()
@@ -170,16 +175,15 @@ def subplot_labels(*, fig=None, xlabel=None, ylabel=None):
     if xlabel is None and ylabel is None:
         return
 
-    # get active axes to restore it later on
-    ca = plt.gca()
+    fig = tools.gcf(fig)
 
-    if fig is None:
-        fig = plt.gcf()
+    # get active axes to restore it later on
+    ca = fig.gca()
 
     _subplot_labels(fig, xlabel, ylabel)
 
     # reset current axes
-    plt.sca(ca)
+    fig.sca(ca)
 
 
 def _subplot_labels(fig, xlabel, ylabel):
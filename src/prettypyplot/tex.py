@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# BSD 3-Clause License
+# Copyright (c) 2020-2023, Daniel Nagel
+# All rights reserved.
+"""Precompile the LaTeX strings of figures rendered with `text.usetex`.
+
+With `text.usetex`, matplotlib runs latex (and dvipng for raster formats) for
+every unique string one after another while drawing. The results are stored
+in a content-addressed cache, where each file is named by the hash of its TeX
+source including the preamble, font size and dpi. New files are compiled in a
+temporary directory and moved atomically, so that several processes on the
+same host can share the same cache directory.
+
+"""
+
+# ~~~ IMPORT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+from pathlib import Path
+
+from matplotlib import text as mtext
+from matplotlib.texmanager import TexManager
+
+from prettypyplot import tools
+
+# file formats which are rendered from the png files of the tex cache
+RASTER_FORMATS = frozenset(('png', 'jpg', 'jpeg', 'tif', 'tiff', 'webp'))
+
+
+# ~~~ FUNCTIONS ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def set_tex_cache(directory):
+    """Set the directory of the LaTeX cache.
+
+    The cache can be shared by several processes, e.g. to reuse the labels
+    compiled by all workers of a batch job.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory to store the compiled strings in, it is created if needed.
+
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    if hasattr(TexManager, '_cache_dir'):
+        TexManager._cache_dir = directory
+    else:  # pragma: no cover
+        TexManager.texcache = str(directory)
+
+
+def get_tex_cache():
+    """Return the directory of the LaTeX cache.
+
+    Returns
+    -------
+    directory : Path
+        Directory the compiled strings are stored in.
+
+    """
+    if hasattr(TexManager, '_cache_dir'):
+        return Path(TexManager._cache_dir)
+    return Path(TexManager.texcache)  # pragma: no cover
+
+
+def warmup_tex(fig=None, *, dpi=None, max_workers=None):
+    """Precompile all LaTeX strings of a figure before drawing it.
+
+    Collects the strings of all visible texts with `usetex`, including the
+    tick labels, and compiles the ones missing in the cache in parallel.
+    Drawing the figure afterwards only reads from the cache. This function is
+    called by [savefig][prettypyplot.savefig] if `text.usetex` is enabled.
+
+    !!! note
+        The strings need to be compiled with the same rcParams as used for
+        drawing, because the font and preamble are part of the TeX source.
+
+    Parameters
+    ----------
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to warm up. If `None` the current figure
+        is used.
+    dpi : float, optional
+        If given, the raster images used for raster formats, e.g. png, are
+        precompiled for this dpi as well.
+    max_workers : int, optional
+        Maximal number of parallel latex processes. Default is given by
+        [concurrent.futures.ThreadPoolExecutor][].
+
+    Returns
+    -------
+    n_compiled : int
+        Number of strings which were missing in the cache.
+
+    """
+    fig = tools.gcf(fig)
+
+    texmanager = TexManager()
+    missing = [
+        (tex, fontsize)
+        for tex, fontsize in _collect_tex(fig)
+        if not _is_cached(texmanager, tex, fontsize, dpi)
+    ]
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # consume iterator to raise latex errors
+            list(
+                executor.map(
+                    lambda job: _compile(texmanager, *job, dpi),
+                    missing,
+                )
+            )
+    return len(missing)
+
+
+def _collect_tex(fig):
+    """Return set of TeX strings and font sizes of all texts using usetex."""
+    # tick labels are updated only while drawing
+    for ax in fig.get_axes():
+        for axis in (ax.xaxis, ax.yaxis):
+            axis.get_majorticklabels()
+            axis.get_minorticklabels()
+
+    sources = set()
+    for text in fig.findobj(mtext.Text):
+        if not (text.get_visible() and text.get_usetex()):
+            continue
+        fontsize = text.get_fontsize()
+        # string used by matplotlib to estimate the line height
+        sources.add(('lp', fontsize))
+        sources.update(
+            (line, fontsize) for line in text.get_text().split('\n') if line.strip()
+        )
+    return sources
+
+
+def _is_cached(texmanager, tex, fontsize, dpi):
+    """Check if TeX string is compiled already."""
+    basefile = texmanager.get_basefile(tex, fontsize)
+    if not path.exists('{0}.dvi'.format(basefile)):
+        return False
+    if dpi is None:
+        return True
+    return path.exists(
+        '{0}.png'.format(texmanager.get_basefile(tex, fontsize, dpi)),
+    )
+
+
+def _compile(texmanager, tex, fontsize, dpi):
+    """Compile TeX string to dvi and if dpi is given to png."""
+    texmanager.make_dvi(tex, fontsize)
+    if dpi is not None:
+        texmanager.make_png(tex, fontsize, dpi)
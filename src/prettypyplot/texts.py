@@ -57,7 +57,7 @@ def text(x, y, s, *, contour=None, ax=None, **kwargs):
     return txt
 
 
-def figtext(x, y, s, *, contour=None, **kwargs):
+def figtext(x, y, s, *, contour=None, fig=None, **kwargs):
     """Generate text object at figure position (x,y).
 
     Wrapper around pyplot.figtext. The default alignment is changed to
@@ -74,8 +74,9 @@ def figtext(x, y, s, *, contour=None, **kwargs):
     contour : bool or tuple(scalar, color)
         Add a contour to the text. Either use a boolean for default values,
         or give a tuple with linewidth and linecolor.
-    ax : matplotlib axes
-        Matplotlib axes to plot in.
+    fig : Figure, optional
+        [matplotlib.figure.Figure][] to place the text in. If `None` the
+        current figure is used.
     kwargs
         Text properties of [matplotlib.pyplot.figtext][]
 
@@ -87,7 +88,7 @@ def figtext(x, y, s, *, contour=None, **kwargs):
         kwargs['ha'] = 'center'
 
     # plot text
-    txt = plt.figtext(x=x, y=y, s=s, **kwargs)
+    txt = tools.gcf(fig).text(x=x, y=y, s=s, **kwargs)
 
     # generate contour
     if contour is not None:
@@ -59,17 +59,38 @@ def parse_axes(*args, ax):
     return args, ax
 
 
-def gca(ax):
-    """Return ax if it is axes instance, else the current active axes."""
+def gcf(fig):
+    """Return fig if it is a figure instance, or the current figure if None."""
+    if fig is None:
+        return plt.gcf()
+    if not isinstance(fig, mpl.figure.FigureBase):
+        raise TypeError(
+            'fig needs to be of type matplotlib.figure.Figure, not {0}.'.format(
+                type(fig).__name__,
+            ),
+        )
+    return fig
+
+
+def gca(ax, *, fig=None):
+    """Return ax if it is axes instance, else the active axes of fig.
+
+    If no figure is given, the current active axes of pyplot is returned.
+
+    """
     if isinstance(ax, mpl.axes.Axes):
         return ax
-    return plt.gca()
+    return gcf(fig).gca()
+
 
+def get_axes(axs, *, fig=None):
+    """Return axs if it is all axes instances, else the all axes of fig.
 
-def get_axes(axs):
-    """Return axs if it is all axes instances, else the all current axes."""
+    If no figure is given, all axes of the current figure are returned.
+
+    """
     if axs is None:
-        return plt.gcf().get_axes()
+        return gcf(fig).get_axes()
 
     axs = np.ravel(axs)
     if not all((isinstance(arg, mpl.axes.Axes) for arg in axs)):
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Tests for the bench module.
+
+BSD 3-Clause License
+Copyright (c) 2020-2021, Daniel Nagel
+All rights reserved.
+
+"""
+
+import json
+
+import pytest
+
+from prettypyplot import bench
+
+
+def test__parse_importtime():
+    """Test parsing the output of python -X importtime."""
+    stderr = '\n'.join((
+        'import time: self [us] | cumulative | imported package',
+        'import time:       100 |        100 |   numpy',
+        'import time:      2000 |       2100 | prettypyplot',
+        'some other output',
+    ))
+    importtimes = bench._parse_importtime(stderr)
+    assert importtimes == {
+        'numpy': (pytest.approx(1e-4), pytest.approx(1e-4)),
+        'prettypyplot': (pytest.approx(2e-3), pytest.approx(2.1e-3)),
+    }
+
+
+def test_main_startup(tmp_path):
+    """Test the startup benchmark from the command line interface."""
+    output = tmp_path / 'startup.json'
+    assert bench.main(['startup', '--repeat', '1', '--output', str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    assert results['benchmark'] == 'startup'
+    assert set(results['metadata']) >= {'prettypyplot', 'matplotlib', 'python'}
+
+    timings = results['results']
+    assert timings['import']['prettypyplot'] > 0
+    assert set(timings['cold']) == {'use_style', 'load_cmaps', 'load_colors'}
+    assert len(timings['warm']['use_style']) == 12
+
+
+def test_colors():
+    """Test the colors benchmark."""
+    timings = bench.colors(repeat=1)
+    assert set(timings) == {'load_colors', 'use_style_lookup', 'lookup'}
+    assert all(timing > 0 for timing in timings.values())
+
+
+def test_latex():
+    """Test the latex benchmark."""
+    timings = bench.latex(repeat=1)
+    assert set(timings) == {'usetex', 'mathtext'}
+    assert set(timings['mathtext']) == {'first', 'warm'}
+
+
+def test_main_unknown_benchmark():
+    """Test that unknown benchmarks are rejected."""
+    with pytest.raises(SystemExit):
+        bench.main(['unknown'])
+
+
+def test_threads():
+    """Test the threads benchmark."""
+    results = bench.threads(repeat=1, max_threads=2)
+    assert set(results) == {'gil_enabled', 'n_figures', 'threads'}
+    assert set(results['threads']) == {'1', '2'}
+    assert results['threads']['1']['speedup'] == 1
+
+
+def test_profiles():
+    """Test the profiles benchmark."""
+    results = bench.profiles(repeat=1)
+    assert len(results) == 6
+    assert all(set(result) == {'time', 'size'} for result in results.values())
+    # draft is saved with lower resolution and compression than print
+    assert results['draft-png']['size'] < results['print-png']['size']
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""Tests for the cache module.
+
+BSD 3-Clause License
+Copyright (c) 2020-2021, Daniel Nagel
+All rights reserved.
+
+"""
+
+import functools
+import os
+import pickle
+import sys
+from io import BytesIO
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+from matplotlib import ticker
+
+import prettypyplot
+from prettypyplot import cache as pcache
+
+
+def _figure(data):
+    """Create a simple figure."""
+    fig, ax = plt.subplots()
+    ax.plot(data)
+    ax.set_xlabel('x')
+    return fig
+
+
+def test_key():
+    """Test that the key depends on the content of the figure."""
+    render_cache = pcache.RenderCache.__new__(pcache.RenderCache)
+    figs = [_figure(np.arange(10)) for _ in range(2)]
+    key = render_cache.key(figs[0])
+    assert key == render_cache.key(figs[1])
+    assert key != render_cache.key(figs[0], dpi=50)
+
+    figs[1].axes[0].lines[0].set_ydata(np.arange(10)[::-1])
+    assert key != render_cache.key(figs[1])
+
+    with plt.rc_context({'lines.linewidth': 10}):
+        assert key != render_cache.key(figs[0])
+    for fig in figs:
+        plt.close(fig)
+
+
+def _formatter(fmt):
+    """Return tick formatter which differs only in its closure."""
+    return ticker.FuncFormatter(lambda x, p: fmt.format(x))
+
+
+def _scaled(x, p, scale=1):
+    """Format tick with a default argument."""
+    return str(x * scale)
+
+
+# global read by _scaled_global
+_SCALE = 1
+
+
+def _scaled_global(x, p):
+    """Format tick with a global scale."""
+    return str(x * _SCALE)
+
+
+class _SlotsFormatter:
+    """Callable without state which could be hashed."""
+
+    __slots__ = ()
+
+    def __call__(self, x, p):
+        return str(x)
+
+
+def test_key_callables(monkeypatch):
+    """Test that the key depends on closures and arguments of callables."""
+    render_cache = pcache.RenderCache.__new__(pcache.RenderCache)
+    fig = _figure(np.arange(10))
+    ax = fig.axes[0]
+
+    keys = []
+    for formatter in (
+        _formatter('{0:.1f}'),
+        _formatter('{0:.2f}'),
+        ticker.FuncFormatter(functools.partial(_scaled, scale=2)),
+        ticker.FuncFormatter(functools.partial(_scaled, scale=3)),
+        ticker.FuncFormatter(functools.partial(_scaled, scale=3)),
+        ticker.FuncFormatter('{0:.1f}'.format),
+        ticker.FuncFormatter('{0:.2f}'.format),
+    ):
+        ax.xaxis.set_major_formatter(formatter)
+        keys.append(render_cache.key(fig))
+    assert keys[3] == keys[4]
+    assert len(set(keys)) == len(keys) - 1
+
+    _scaled.__defaults__ = (2,)
+    ax.xaxis.set_major_formatter(_scaled)
+    key = render_cache.key(fig)
+    _scaled.__defaults__ = (1,)
+    assert key != render_cache.key(fig)
+
+    # globals read by the code are part of the key
+    ax.xaxis.set_major_formatter(_scaled_global)
+    key = render_cache.key(fig)
+    monkeypatch.setattr(sys.modules[__name__], '_SCALE', 2)
+    assert key != render_cache.key(fig)
+
+    # callables which cannot be hashed are not cached
+    ax.xaxis.set_major_formatter(ticker.FuncFormatter(_SlotsFormatter()))
+    assert render_cache.key(fig) is None
+    plt.close(fig)
+
+
+def test_savefig_cache_unhashable(tmp_path):
+    """Test that figures with unhashable callables are always rendered."""
+    render_cache = pcache.RenderCache(tmp_path / 'cache')
+    fig = _figure(np.arange(10))
+    fig.axes[0].xaxis.set_major_formatter(
+        ticker.FuncFormatter(_SlotsFormatter()),
+    )
+    for _ in range(2):
+        prettypyplot.savefig(str(tmp_path / 'fig.png'), cache=render_cache)
+    assert render_cache.cache_info()[:3] == (0, 2, 0)
+    plt.close(fig)
+
+
+def test_savefig_cache(tmp_path):
+    """Test that cached figures are copied instead of rendered."""
+    render_cache = pcache.RenderCache(tmp_path / 'cache')
+    fig = _figure(np.arange(10))
+    prettypyplot.savefig(str(tmp_path / 'ref.png'))
+    prettypyplot.savefig(str(tmp_path / 'fig1.png'), cache=render_cache)
+    assert render_cache.cache_info()[:3] == (0, 1, 1)
+
+    # cached file is reused for other filenames and file objects
+    prettypyplot.savefig(str(tmp_path / 'fig2.png'), cache=render_cache)
+    data = prettypyplot.savefig_bytes(fig, cache=render_cache)
+    assert render_cache.cache_info()[:3] == (2, 1, 1)
+    ref = (tmp_path / 'ref.png').read_bytes()
+    assert (tmp_path / 'fig1.png').read_bytes() == ref
+    assert (tmp_path / 'fig2.png').read_bytes() == ref
+    assert data == ref
+
+    # modified figures are rendered again
+    fig.axes[0].set_xlabel('y')
+    buffer = BytesIO()
+    prettypyplot.savefig(buffer, format='png', cache=render_cache)
+    assert buffer.getvalue() != ref
+    assert render_cache.cache_info()[:3] == (2, 2, 2)
+
+    render_cache.clear()
+    assert render_cache.cache_info() == (0, 0, 0, 0)
+    plt.close(fig)
+
+
+def test_savefig_cache_modes(tmp_path):
+    """Test that the variants of all modes are cached."""
+    render_cache = pcache.RenderCache(tmp_path / 'cache')
+    for idx in range(2):
+        fig = _figure(np.arange(10))
+        prettypyplot.savefig(
+            str(tmp_path / 'fig{0}'.format(idx)),
+            format=['pdf', 'png'],
+            modes=['print', 'beamer'],
+            cache=render_cache,
+        )
+        plt.close(fig)
+    assert render_cache.cache_info()[:3] == (4, 4, 4)
+    assert (tmp_path / 'fig1_beamer.png').read_bytes() == (
+        tmp_path / 'fig0_beamer.png'
+    ).read_bytes()
+
+
+def test_pickle(tmp_path):
+    """Test that caches can be passed to worker processes."""
+    render_cache = pcache.RenderCache(tmp_path)
+    render_cache._hits = 1
+    copy = pickle.loads(pickle.dumps(render_cache))
+    assert copy.directory == render_cache.directory
+    assert copy.cache_info().hits == 0
+
+
+def test_evict(tmp_path):
+    """Test that the least recently used files are evicted."""
+    render_cache = pcache.RenderCache(tmp_path, max_size=None)
+    for idx, key in enumerate(('a', 'b', 'c')):
+        entry = render_cache._entry(key, 'png')
+        entry.write_bytes(b'x' * 10)
+        os.utime(entry, (idx, idx))
+    render_cache._load('a', 'png', BytesIO())
+
+    render_cache.max_size = 20
+    render_cache._evict()
+    assert sorted(entry.name for entry, _ in render_cache._entries()) == [
+        'a.png',
+        'c.png',
+    ]
+
+
+@pytest.mark.parametrize(
+    'cache, error',
+    [(None, None), (False, None), (True, None), ('cache', TypeError)],
+)
+def test__get_cache(cache, error):
+    """Test parsing the cache argument of savefig."""
+    if error is not None:
+        with pytest.raises(error):
+            pcache._get_cache(cache)
+    elif cache:
+        assert isinstance(pcache._get_cache(cache), pcache.RenderCache)
+        assert pcache._get_cache(cache) is pcache._get_cache(cache)
+    else:
+        assert pcache._get_cache(cache) is None
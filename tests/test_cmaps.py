@@ -7,16 +7,19 @@ All rights reserved.
 
 """
 
-from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+import numpy as np
+import pytest
+from matplotlib.colors import ListedColormap
 
 from prettypyplot import _cmaps as cmaps
+from prettypyplot._cmaps import bownair, macaw, paula2, turbo  # noqa: F401
 
 
 def test_bownair():
     """Test bownair cmap."""
     assert isinstance(
         cmaps.bownair._bownair(),
-        LinearSegmentedColormap,
+        ListedColormap,
     )
 
 
@@ -24,7 +27,7 @@ def test_macaw():
     """Test macaw cmap."""
     assert isinstance(
         cmaps.macaw._macaw(),
-        LinearSegmentedColormap,
+        ListedColormap,
     )
 
 
@@ -32,10 +35,27 @@ def test_turbo():
     """Test turbo cmap."""
     assert isinstance(
         cmaps.turbo._turbo(),
-        LinearSegmentedColormap,
+        ListedColormap,
     )
 
 
+def test_paula2():
+    """Test paula2 cmap."""
+    assert isinstance(
+        cmaps.paula2._paula2(),
+        ListedColormap,
+    )
+
+
+@pytest.mark.parametrize('name', ('bownair', 'macaw', 'paula2', 'turbo'))
+def test__load_cmap_data(name):
+    """Test loading binary colormap tables."""
+    data = cmaps._load_cmap_data(name)
+    assert data.shape == (256, 3)
+    assert data.dtype == np.float32
+    assert np.all((data >= 0) & (data <= 1))
+
+
 def test_discrete():
     """Test discrete cmaps."""
     for cmap in (
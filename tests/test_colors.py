@@ -10,6 +10,7 @@ All rights reserved.
 import numpy as np
 import pytest
 from matplotlib import colors as clr
+from matplotlib import pyplot as plt
 
 import prettypyplot
 
@@ -178,6 +179,20 @@ def test_categorical_color(nsc, color, kwargs, refcolors, error):
             [[0.0, 0.0, 0.5], [0.75, 0.75, 1.0]],
             None,
         ),
+        (
+            2,
+            1,
+            {'cmap': prettypyplot.colors._macaw()},
+            [[0.19, 0.05, 0.5], [1.0, 0.96, 0.07]],
+            None,
+        ),
+        (
+            2,
+            1,
+            {'cmap': clr.ListedColormap(['#ff0000', '#00ff00', '#0000ff', '#000000'])},
+            [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+            None,
+        ),
         (2, 2, {'cmap': 'NoColorMap'}, None, ValueError),
         (20, 2, {'cmap': 'tab10'}, None, ValueError),
         (-2, 2, {}, None, ValueError),
@@ -200,12 +215,93 @@ def test_categorical_cmap(nc, nsc, kwargs, ref, error):
             prettypyplot.colors.categorical_cmap(nc, nsc, **kwargs)
 
 
+@pytest.mark.parametrize(
+    'cmap, categorical',
+    [
+        ('pastel5', True),
+        ('pastel5_r', True),
+        ('tol:bright', True),
+        ('tab10', True),
+        ('viridis', True),
+        ('jet', False),
+        ('macaw', False),
+        ('paula2_r', False),
+        (clr.ListedColormap(['r', 'g', 'b']), True),
+    ],
+)
+def test__is_categorical(cmap, categorical):
+    """Test that all ListedColormaps but the continuous ones are categorical."""
+    prettypyplot.load_cmaps()
+    assert prettypyplot.colors._is_categorical(plt.get_cmap(cmap)) is categorical
+
+
 # dummy coverage tests
 def test_load_colors():
     """Check that no error get raised."""
     prettypyplot.colors.load_colors()
 
 
+def test_load_colors_update():
+    """Check that changed colors are not resolved from matplotlib's cache."""
+    with plt.rc_context():
+        plt.rcParams['text.color'] = '#ff0000'
+        prettypyplot.colors.load_colors()
+        assert clr.to_hex('pplt:text') == '#ff0000'
+        assert clr.to_hex('pplt:blue') == '#3362b0'
+
+        plt.rcParams['text.color'] = '#00ff00'
+        prettypyplot.colors.load_colors()
+        assert clr.to_hex('pplt:text') == '#00ff00'
+    prettypyplot.colors.load_colors()
+
+
+def test__register_colors():
+    """Check that only missing or differing colors are registered."""
+    colors = {'pplt:test': '#123456', 'pplt:test2': (0.1, 0.2, 0.3)}
+    assert prettypyplot.colors._register_colors(colors) == 2
+    assert prettypyplot.colors._register_colors(colors) == 0
+    assert prettypyplot.colors._register_colors({'pplt:test': '#000000'}) == 1
+    assert clr.to_hex('pplt:test') == '#000000'
+    assert clr.to_hex('pplt:test2') == '#1a334c'
+
+
 def test_load_cmaps():
     """Check that no error get raised."""
     prettypyplot.colors.load_cmaps()
+
+
+@pytest.mark.parametrize('name', prettypyplot.colors._COLORMAPS)
+def test_load_cmaps_lazy(name):
+    """Check that registered names resolve to the correct colormaps."""
+    if name == 'turbo':
+        pytest.skip('turbo is shipped with matplotlib and not registered')
+    prettypyplot.colors.load_cmaps()
+    factory = prettypyplot.colors._COLORMAPS[name]
+    for cmap_name, ref_cmap in (
+        (name, factory()),
+        ('{0}_r'.format(name), factory().reversed()),
+    ):
+        cmap = plt.get_cmap(cmap_name)
+        assert type(cmap) is type(ref_cmap)
+        assert cmap.name == cmap_name
+        np.testing.assert_array_almost_equal(
+            cmap(np.linspace(0, 1, 10)),
+            ref_cmap(np.linspace(0, 1, 10)),
+        )
+
+
+def test__lazy_colormap():
+    """Check that the colormap is built only on lookup."""
+    calls = []
+
+    def factory():
+        calls.append(None)
+        return clr.ListedColormap(['r', 'g'], name='pplt_test_lazy')
+
+    cmap = prettypyplot.colors._LazyColormap('pplt_test_lazy', factory)
+    assert cmap.copy() is cmap
+    assert not calls
+
+    assert isinstance(cmap.copy(), clr.ListedColormap)
+    assert isinstance(cmap.copy(), clr.ListedColormap)
+    assert len(calls) == 1
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Tests for the export module.
+
+BSD 3-Clause License
+Copyright (c) 2020-2021, Daniel Nagel
+All rights reserved.
+
+"""
+
+import asyncio
+import multiprocessing
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+from matplotlib import ticker as mticker
+
+import prettypyplot
+from prettypyplot import export
+
+
+def _figure(data):
+    """Create a simple figure."""
+    fig, ax = plt.subplots()
+    ax.plot(data)
+    ax.set_xlabel('x')
+    return fig
+
+
+@pytest.mark.parametrize('mp_context', (None, 'spawn'))
+def test_savefig_many(tmp_path, mp_context):
+    """Test that the figures match saving them one by one."""
+    if mp_context is not None:
+        mp_context = multiprocessing.get_context(mp_context)
+
+    with plt.rc_context():
+        prettypyplot.use_style(style='minimal')
+        figs = [_figure(np.arange(10) * idx) for idx in range(3)]
+        fnames = [str(tmp_path / 'fig{0}.png'.format(idx)) for idx in range(3)]
+        results = export.savefig_many(
+            [
+                (figs[0], fnames[0]),
+                (figs[1], fnames[1], {'dpi': 50}),
+                (figs[2], fnames[2], {'format': 'unknown'}),
+            ],
+            max_workers=2,
+            mp_context=mp_context,
+        )
+
+        assert [result.fname for result in results] == fnames
+        assert results[0].error is None
+        assert results[0].duration > 0
+        assert isinstance(results[2].error, ValueError)
+
+        for idx, dpi in ((0, None), (1, 50)):
+            ref_fname = str(tmp_path / 'ref{0}.png'.format(idx))
+            plt.figure(figs[idx].number)
+            prettypyplot.savefig(ref_fname, dpi=dpi)
+            np.testing.assert_array_equal(
+                plt.imread(fnames[idx]),
+                plt.imread(ref_fname),
+            )
+        for fig in figs:
+            plt.close(fig)
+        prettypyplot.use_style()
+
+
+def test_savefig_many_unpicklable(tmp_path):
+    """Test that figures which can not be pickled are reported."""
+    fig = _figure(np.arange(10))
+    fig.axes[0].xaxis.set_major_formatter(
+        mticker.FuncFormatter(lambda x, pos: 'x'),
+    )
+    (result,) = export.savefig_many([(fig, str(tmp_path / 'fig.png'))])
+    assert result.error is not None
+    assert not (tmp_path / 'fig.png').exists()
+    plt.close(fig)
+
+
+def test_savefig_async(tmp_path):
+    """Test that a snapshot of the figure is saved in the background."""
+    fig = _figure(np.arange(10))
+    ref = prettypyplot.savefig_bytes(fig)
+
+    n_figs = len(plt.get_fignums())
+    future = export.savefig_async(str(tmp_path / 'fig.png'), fig)
+    # modifying the figure does not change the snapshot
+    fig.axes[0].plot(np.arange(10)[::-1])
+    assert future.result() is None
+    assert len(plt.get_fignums()) == n_figs
+    assert (tmp_path / 'fig.png').read_bytes() == ref
+
+    future = export.savefig_async(str(tmp_path / 'fig.png'), fig, dpi='unknown')
+    with pytest.raises(Exception):
+        future.result()
+
+    with pytest.raises(TypeError):
+        export.savefig_async(str(tmp_path / 'fig.png'), fig.axes[0])
+    plt.close(fig)
+
+
+def test_savefig_async_modes(tmp_path):
+    """Test that async saves with modes do not change the rcParams."""
+    from concurrent.futures import ThreadPoolExecutor
+    from io import BytesIO
+
+    fig = _figure(np.arange(10))
+    with plt.rc_context():
+        prettypyplot.use_style()
+        fontsize = plt.rcParams['font.size']
+        future = export.savefig_async(
+            str(tmp_path / 'fig.png'),
+            fig,
+            modes=['print', 'beamer', 'poster'],
+        )
+        # build figures on the main thread while the modes are saved
+        sizes = set()
+        done = False
+        while not done:
+            done = future.done()
+            new_fig, new_ax = plt.subplots()
+            new_ax.set_xlabel('x')
+            sizes.add(new_ax.xaxis.label.get_size())
+            plt.close(new_fig)
+        assert future.result() is None
+        assert sizes == {fontsize}
+        assert plt.rcParams['font.size'] == fontsize
+        prettypyplot.use_style()
+
+    for mode in ('print', 'beamer', 'poster'):
+        assert (tmp_path / 'fig_{0}.png'.format(mode)).exists()
+
+    with pytest.raises(ValueError):
+        export.savefig_async(BytesIO(), fig, format='png', profile='draft')
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(ValueError):
+            export.savefig_async(
+                str(tmp_path / 'fig.png'),
+                fig,
+                executor=executor,
+                modes=['beamer'],
+            )
+    plt.close(fig)
+
+
+def test_asavefig(tmp_path):
+    """Test awaitable saving of a figure."""
+    fig = _figure(np.arange(10))
+    fname = tmp_path / 'fig.pdf'
+    asyncio.run(export.asavefig(str(fname), fig))
+    assert fname.read_bytes().startswith(b'%PDF')
+    plt.close(fig)
+
+
+def test_png_pipeline(tmp_path):
+    """Test that the pipeline matches saving the figures one by one."""
+    fig = _figure(np.arange(10))
+    with export.PNGPipeline(max_workers=2) as pipeline:
+        assert pipeline.timings == export.StageTimings((), (), ())
+        futures = []
+        for idx in range(3):
+            fig.axes[0].lines[0].set_ydata(np.arange(10) * idx)
+            fname = str(tmp_path / 'fig{0}.png'.format(idx))
+            futures.append(pipeline.submit(fname, fig, dpi=50))
+            plt.figure(fig.number)
+            prettypyplot.savefig(str(tmp_path / 'ref{0}.png'.format(idx)), dpi=50)
+        with pytest.raises(ValueError):
+            pipeline.submit(str(tmp_path / 'fig.pdf'), fig, format='pdf')
+
+    for idx, future in enumerate(futures):
+        assert future.result() is None
+        np.testing.assert_array_equal(
+            plt.imread(str(tmp_path / 'fig{0}.png'.format(idx))),
+            plt.imread(str(tmp_path / 'ref{0}.png'.format(idx))),
+        )
+
+    timings = pipeline.timings
+    assert all(len(stage) == 3 for stage in timings)
+    assert all(duration >= 0 for stage in timings for duration in stage)
+    plt.close(fig)
+
+
+@pytest.mark.parametrize('detect', ('hash', 'stale'))
+def test_incremental_renderer(tmp_path, detect):
+    """Test that incremental renderings match full renderings."""
+    fig, axs = plt.subplots(2, 2)
+    lines = [ax.plot(np.arange(10))[0] for ax in axs.flat]
+    fig.suptitle('title')
+
+    renderer = export.IncrementalRenderer(fig, dpi=50, detect=detect)
+    renderer.render()
+    renderer.render()
+    assert renderer.stats == export.RenderStats(1, 0, 1, 0)
+
+    lines[1].set_ydata(np.arange(10)[::-1])
+    pixels = renderer.render().copy()
+    assert renderer.stats.partial == 1
+    assert 0 < renderer.stats.redrawn < len(fig.axes)
+
+    renderer.reset()
+    np.testing.assert_array_equal(renderer.render(), pixels)
+    assert renderer.stats.full == 2
+
+    # changing the layout requires a full rendering
+    axs[0, 0].set_position([0.1, 0.1, 0.3, 0.3])
+    renderer.render()
+    assert renderer.stats.full == 3
+
+    renderer.savefig(str(tmp_path / 'fig.png'))
+    np.testing.assert_array_equal(
+        np.round(plt.imread(str(tmp_path / 'fig.png')) * 255),
+        renderer.render(),
+    )
+    with pytest.raises(ValueError):
+        renderer.savefig(str(tmp_path / 'fig.pdf'))
+
+    figsize = renderer.fig.get_size_inches()
+    renderer.close()
+    assert not np.array_equal(fig.get_size_inches(), figsize)
+    plt.close(fig)
+
+
+def test_incremental_renderer_detect():
+    """Test that unknown detection methods are rejected."""
+    with pytest.raises(ValueError):
+        export.IncrementalRenderer(plt.gcf(), detect='unknown')
+
+
+def test__init_worker():
+    """Test that the style settings are replaced instead of modified."""
+    with plt.rc_context():
+        prettypyplot.use_style()
+        style_dict = prettypyplot.STYLE_DICT
+        reference = dict(style_dict)
+        state = export._style_state()
+        state['style_dict'] = {**state['style_dict'], 'ncs': 3}
+        export._init_worker(state)
+        assert prettypyplot.STYLE_DICT['ncs'] == 3
+        assert style_dict == reference
+        prettypyplot.STYLE_DICT = style_dict
+        prettypyplot.use_style()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Tests for the lazy loading of the package.
+
+BSD 3-Clause License
+Copyright (c) 2020-2021, Daniel Nagel
+All rights reserved.
+
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import prettypyplot
+
+# budget of the cumulative import time of prettypyplot itself in microseconds
+IMPORT_TIME_BUDGET = 50_000
+
+
+def _run_python(code, *args):
+    """Run code in a fresh interpreter and return its stdout and stderr."""
+    process = subprocess.run(
+        [sys.executable, *args, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return process.stdout, process.stderr
+
+
+def test_import_is_lazy():
+    """Check that importing the package does not import its dependencies."""
+    stdout, _ = _run_python(
+        'import sys, prettypyplot; '
+        'print(",".join(sorted(mod for mod in sys.modules if mod.startswith('
+        '("matplotlib", "decorit", "prettypyplot.")))))',
+    )
+    assert stdout.strip() == ''
+
+
+def test_import_time_budget():
+    """Check that importing the package stays within the time budget."""
+    _, stderr = _run_python('import prettypyplot', '-X', 'importtime')
+    # lines have the format 'import time: self | cumulative | module'
+    cumulative = {}
+    for line in stderr.splitlines():
+        _, cumulative_time, module = line.split('|')
+        if cumulative_time.strip().isdigit():
+            cumulative[module.strip()] = int(cumulative_time)
+    assert cumulative['prettypyplot'] < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize('name', prettypyplot.__all__)
+def test_lazy_attributes(name):
+    """Check that all public names can be resolved."""
+    assert callable(getattr(prettypyplot, name))
+    assert name in dir(prettypyplot)
+
+
+def test_version():
+    """Check that the version is available."""
+    assert isinstance(prettypyplot.__version__, str)
+
+
+def test_unknown_attribute():
+    """Check that unknown attributes raise an AttributeError."""
+    with pytest.raises(AttributeError):
+        prettypyplot.not_existing_attribute  # noqa: B018
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""Tests for the pool module.
+
+BSD 3-Clause License
+Copyright (c) 2020-2021, Daniel Nagel
+All rights reserved.
+
+"""
+
+import multiprocessing
+from io import BytesIO
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+import prettypyplot
+from prettypyplot import pool as ppool
+
+
+def _plot(n_points):
+    """Create a simple figure."""
+    fig = Figure()
+    ax = fig.subplots()
+    prettypyplot.plot(np.arange(n_points), ax=ax)
+    return fig
+
+
+def _plot_shared(data, start, *, stop):
+    """Create a figure of a slice of a shared array."""
+    return _plot_data(data[start:stop])
+
+
+def _plot_data(data):
+    """Create a figure of the given data."""
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot(data)
+    return fig
+
+
+def _write(data):
+    """Modify the passed data."""
+    data[0] = 0
+    return _plot_data(data)
+
+
+# modes seen by the tasks of thread pools
+_MODES = []
+
+
+def _plot_mode(n_points):
+    """Create a simple figure and store the current mode."""
+    _MODES.append(prettypyplot.MODE)
+    return _plot(n_points)
+
+
+def _no_figure(arg):
+    """Return no figure."""
+    return arg
+
+
+def test_render_pool(tmp_path):
+    """Test creating and saving figures in warm workers."""
+    fnames = [str(tmp_path / 'fig{0}.png'.format(idx)) for idx in range(3)]
+    with ppool.RenderPool(max_workers=2) as render_pool:
+        results = render_pool.map(_plot, [5, 10, 15], fnames=fnames)
+        data = render_pool.submit(_plot, 10, savefig_kwargs={'dpi': 50}).result()
+        errors = render_pool.map(_no_figure, [None, lambda: None])
+    assert all(result.error is None for result in results)
+    assert [result.fname for result in results] == fnames
+    assert all(result.warmup > 0 for result in results)
+
+    ref = BytesIO()
+    prettypyplot.savefig(ref, fig=_plot(10), format='png', dpi=50)
+    assert data.data == ref.getvalue()
+    assert (tmp_path / 'fig2.png').exists()
+
+    assert isinstance(errors[0].error, TypeError)
+    assert errors[1].error is not None and errors[1].pid is None
+
+    timings = render_pool.timings
+    assert 1 <= len(timings.warmup) <= 2
+    assert len(timings.tasks) == 5
+
+
+def test_render_pool_share():
+    """Test passing arrays via shared memory."""
+    data = np.cumsum(np.random.default_rng(42).normal(size=(1000, 2)), axis=0)
+    with ppool.RenderPool(max_workers=2) as render_pool:
+        shared = render_pool.share(data)
+        assert shared.shape == data.shape
+        futures = [
+            render_pool.submit(_plot_shared, shared, start, stop=start + 500)
+            for start in (0, 500)
+        ]
+        error = render_pool.submit(_write, shared).result().error
+        render_pool.release(shared)
+        results = [future.result() for future in futures]
+
+        with pytest.raises(ValueError):
+            render_pool.release(shared)
+        with pytest.raises(ValueError):
+            render_pool.share(np.array([None]))
+
+    # shared memory is freed after the tasks finished
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=shared.name)
+
+    # views are read-only and identical to the data
+    assert isinstance(error, ValueError)
+    for result, start in zip(results, (0, 500)):
+        ref = BytesIO()
+        prettypyplot.savefig(
+            ref,
+            fig=_plot_data(data[start : start + 500]),
+            format='png',
+        )
+        assert result.data == ref.getvalue()
+
+
+def test_render_pool_threads():
+    """Test creating and saving figures in a pool of threads."""
+    with prettypyplot.style_context(mode='print'):
+        render_pool = ppool.RenderPool(max_workers=2, executor='thread')
+    with render_pool:
+        results = render_pool.map(_plot_mode, [5, 10, 10])
+        shared = render_pool.share(np.arange(10))
+        shared_result = render_pool.submit(_plot_shared, shared, 0, stop=10)
+        render_pool.release(shared)
+    assert all(result.error is None for result in results)
+    assert results[1].data == results[2].data
+    assert shared_result.result().data == results[1].data
+
+    # tasks use the style state of the creating context
+    assert _MODES == [prettypyplot.style.Mode.PRINT] * 3
+    timings = render_pool.timings
+    assert len(timings.warmup) == 1
+    assert len(timings.tasks) == 4
+
+    with pytest.raises(ValueError):
+        ppool.RenderPool(executor='unknown')
+
+
+@pytest.mark.parametrize(
+    'fname, savefig_kwargs',
+    [
+        (None, {'profile': 'draft'}),
+        (None, {'modes': ['print']}),
+        (None, {'format': 'jpeg'}),
+        ('fig.jpg', {}),
+        (['fig.png', 'fig.jpg'], {}),
+    ],
+)
+def test_render_pool_threads_rc(fname, savefig_kwargs):
+    """Test that thread pools reject tasks changing the rcParams."""
+    with ppool.RenderPool(max_workers=1, executor='thread') as render_pool:
+        with pytest.raises(ValueError):
+            render_pool.submit(_plot, 5, fname=fname, savefig_kwargs=savefig_kwargs)
+
+
+def test_render_pool_threads_mathtext():
+    """Test that thread pools reject the mathtext tick labels of latex='fast'."""
+    with plt.rc_context():
+        prettypyplot.use_style(latex='fast')
+        with ppool.RenderPool(max_workers=1, executor='thread') as render_pool:
+            with pytest.raises(ValueError):
+                render_pool.submit(_plot, 5)
+        prettypyplot.use_style()
+
+    # processes are not affected
+    with plt.rc_context():
+        prettypyplot.use_style(latex='fast')
+        with ppool.RenderPool(max_workers=1) as render_pool:
+            assert render_pool.submit(_plot, 5).result().error is None
+        prettypyplot.use_style()
+
+
+def test_render_pool_fnames():
+    """Test that the number of filenames is checked."""
+    with ppool.RenderPool(max_workers=1) as render_pool:
+        with pytest.raises(ValueError):
+            render_pool.map(_plot, [5, 10], fnames=['fig.png'])
+
+
+@pytest.mark.parametrize('error, warns', [(RuntimeError, True), (ValueError, False)])
+def test__warmup_drawing(monkeypatch, error, warns):
+    """Test that only errors of LaTeX are ignored while warming up."""
+
+    def draw(canvas):
+        raise error('failed')
+
+    monkeypatch.setattr(ppool.FigureCanvasAgg, 'draw', draw)
+    if warns:
+        with pytest.warns(RuntimeWarning, match='failed'):
+            ppool._warmup_drawing()
+    else:
+        with pytest.raises(error):
+            ppool._warmup_drawing()
+
+
+@pytest.mark.parametrize('mp_context', [None, 'spawn'])
+def test__get_mp_context(mp_context):
+    """Test selecting the start method."""
+    context = ppool._get_mp_context(mp_context)
+    if mp_context is None:
+        assert context.get_start_method() in {'forkserver', 'fork'}
+    else:
+        assert context.get_start_method() == mp_context
+
+
+def test__get_mp_context_preload(monkeypatch):
+    """Test that the fork server preload is changed only on request."""
+    calls = []
+    monkeypatch.setattr(
+        multiprocessing.context.ForkServerContext,
+        'set_forkserver_preload',
+        lambda context, modules: calls.append(modules),
+    )
+    ppool._get_mp_context('forkserver')
+    ppool._get_mp_context(None)
+    assert not calls
+
+    ppool._get_mp_context('forkserver', preload=True)
+    ppool._get_mp_context('spawn', preload=True)
+    assert calls == [list(ppool._PRELOAD_MODULES)]
+
+
+def test__detach():
+    """Test that shared memory is closed once all views are freed."""
+    shm = shared_memory.SharedMemory(create=True, size=80)
+    try:
+        attached = []
+        view = ppool._attach(
+            ppool.SharedArray(shm.name, (10,), np.dtype(float)),
+            attached,
+        )
+        part = view[2:5]
+        del view
+        ppool._detach(attached)
+        assert len(ppool._ATTACHED) == 1
+        assert part.sum() == 0
+
+        del part
+        ppool._detach([])
+        assert not ppool._ATTACHED
+        assert attached[0][0].buf is None
+    finally:
+        shm.close()
+        shm.unlink()
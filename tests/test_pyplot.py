@@ -7,6 +7,8 @@ All rights reserved.
 
 """
 
+from io import BytesIO
+
 import matplotlib as mpl
 import numpy as np
 import pytest
@@ -44,6 +46,338 @@ def test__reduce_ticks(data, ticks):
         assert nticks == len(ax.get_xticks())
 
 
+@pytest.mark.parametrize(
+    'fname, kwargs, refdpi',
+    (
+        ('fig.pdf', {}, None),
+        ('fig', {'format': 'png'}, 50),
+        ('fig.png', {}, 50),
+        ('fig.png', {'dpi': 200}, 200),
+        ('fig.jpg', {'dpi': 'figure'}, 50),
+        ('fig', {'format': ['pdf', 'png']}, 50),
+    ),
+)
+def test__raster_dpi(fname, kwargs, refdpi):
+    """Test dpi of raster formats used to precompile latex strings."""
+    fig = plt.figure(dpi=50)
+    with plt.rc_context({'savefig.dpi': 'figure'}):
+        targets = prettypyplot.pyplot._savefig_targets(fname, kwargs.get('format'))
+        assert prettypyplot.pyplot._raster_dpi(fig, targets, kwargs) == refdpi
+    plt.close(fig)
+
+
+@pytest.mark.parametrize(
+    'fname, fileformat, reftargets, error',
+    (
+        ('fig', None, [('fig.pdf', 'pdf')], None),
+        ('fig.PNG', None, [('fig.PNG', 'png')], None),
+        ('fig', 'png', [('fig.png', 'png')], None),
+        ('fig.png', 'PNG', [('fig.png', 'png')], None),
+        ('fig.pdf', 'png', [('fig.pdf.png', 'png')], None),
+        (['fig1', 'fig2.png'], 'png', [('fig1.png', 'png'), ('fig2.png', 'png')], None),
+        ('fig.pdf', ['png'], [('fig.pdf.png', 'png')], None),
+        (
+            'fig',
+            ['pdf', 'png'],
+            [('fig.pdf', 'pdf'), ('fig.png', 'png')],
+            None,
+        ),
+        (
+            'fig.pdf',
+            ['pdf', 'png'],
+            [('fig.pdf', 'pdf'), ('fig.png', 'png')],
+            None,
+        ),
+        (
+            ['fig.svg', 'fig'],
+            None,
+            [('fig.svg', 'svg'), ('fig.pdf', 'pdf')],
+            None,
+        ),
+        (['fig1', 'fig2'], ['pdf', 'png'], None, ValueError),
+    ),
+)
+def test__savefig_targets(fname, fileformat, reftargets, error):
+    """Test parsing filenames and formats of savefig."""
+    if error is None:
+        targets = prettypyplot.pyplot._savefig_targets(fname, fileformat)
+        assert targets == reftargets
+    else:
+        with pytest.raises(error):
+            prettypyplot.pyplot._savefig_targets(fname, fileformat)
+
+
+@pytest.mark.parametrize('kwargs', ({}, {'transparent': True, 'dpi': 50}))
+def test_savefig_multiple_formats(tmp_path, kwargs):
+    """Test that all formats match saving them one by one."""
+    fig, ax = plt.subplots()
+    ax.plot(np.arange(10), alpha=0.5)
+    ax.set_xlabel('x')
+
+    fname = str(tmp_path / 'fig')
+    prettypyplot.savefig(fname, format=['pdf', 'png', 'jpg'], **kwargs)
+    assert (tmp_path / 'fig.pdf').exists()
+    for fileformat in ('png', 'jpg'):
+        ref_fname = str(tmp_path / 'ref.{0}'.format(fileformat))
+        prettypyplot.savefig(ref_fname, **kwargs)
+        np.testing.assert_array_equal(
+            plt.imread('{0}.{1}'.format(fname, fileformat)),
+            plt.imread(ref_fname),
+        )
+    plt.close(fig)
+
+
+@pytest.mark.parametrize('fileformat', ('png', 'pdf'))
+def test_savefig_bytes(tmp_path, fileformat):
+    """Test that the encoded bytes match saving the figure to a file."""
+    fig, ax = plt.subplots()
+    ax.plot(np.arange(10))
+    # remove timestamp
+    kwargs = {'metadata': {'CreationDate': None}} if fileformat == 'pdf' else {}
+
+    fname = tmp_path / 'fig.{0}'.format(fileformat)
+    data = prettypyplot.savefig_bytes(fig, format=fileformat, **kwargs)
+    prettypyplot.savefig(str(fname), **kwargs)
+    assert data == fname.read_bytes()
+
+    assert prettypyplot.savefig_bytes(format='svg').startswith(b'<?xml')
+    plt.close(fig)
+
+
+@pytest.mark.parametrize(
+    'func',
+    (
+        prettypyplot.savefig_bytes,
+        prettypyplot.to_array,
+        prettypyplot.show,
+        prettypyplot.hide_empty_axes,
+    ),
+)
+def test_wrong_figure(func):
+    """Test that passing an axes instead of a figure raises a TypeError."""
+    fig, ax = plt.subplots()
+    with pytest.raises(TypeError):
+        func(fig=ax)
+    plt.close(fig)
+
+
+def test_savefig_profile(tmp_path):
+    """Test saving figures with export profiles."""
+    fig, ax = plt.subplots()
+    ax.plot(np.arange(10))
+    draft = prettypyplot.savefig_bytes(fig, profile='draft')
+    assert draft == prettypyplot.savefig_bytes(
+        fig,
+        dpi=100,
+        pil_kwargs={'compress_level': 1},
+    )
+
+    # dpi and pil_kwargs take precedence
+    data = prettypyplot.savefig_bytes(
+        fig,
+        profile='draft',
+        dpi=50,
+        pil_kwargs={'compress_level': 9},
+    )
+    ref = prettypyplot.savefig_bytes(fig, dpi=50, pil_kwargs={'compress_level': 9})
+    assert data == ref
+
+    # png compression is not passed to vector formats
+    plt.figure(fig.number)
+    prettypyplot.savefig(str(tmp_path / 'fig'), format=['pdf', 'png'], profile='web')
+    assert (tmp_path / 'fig.pdf').exists()
+    assert (tmp_path / 'fig.png').exists()
+
+    with pytest.raises(ValueError):
+        prettypyplot.savefig_bytes(fig, profile='unknown')
+    plt.close(fig)
+
+
+def test_savefig_profile_modes(tmp_path):
+    """Test that export profiles are applied to all modes."""
+    with plt.rc_context():
+        prettypyplot.use_style(mode='print')
+        fig, ax = plt.subplots()
+        ax.plot(np.arange(10))
+
+        modes = ['print', 'beamer']
+        prettypyplot.savefig(str(tmp_path / 'a.png'), modes=modes, profile='draft')
+        prettypyplot.savefig(str(tmp_path / 'b.png'), modes=modes, dpi=100)
+        prettypyplot.savefig(str(tmp_path / 'c.png'), modes=modes)
+        for mode in modes:
+            shape = plt.imread(str(tmp_path / 'a_{0}.png'.format(mode))).shape
+            assert shape == plt.imread(str(tmp_path / 'b_{0}.png'.format(mode))).shape
+            assert shape != plt.imread(str(tmp_path / 'c_{0}.png'.format(mode))).shape
+        plt.close(fig)
+
+
+def test_savefig_modes_user_rc(tmp_path):
+    """Test that rcParams changed after use_style are used for all modes."""
+    with plt.rc_context():
+        prettypyplot.use_style(mode='print')
+        plt.rcParams['savefig.dpi'] = 50
+        fig, ax = plt.subplots()
+        ax.plot(np.arange(10))
+
+        prettypyplot.savefig(str(tmp_path / 'a.png'), modes=['print'])
+        prettypyplot.savefig(str(tmp_path / 'b.png'), modes=['print'], dpi=50)
+        assert (
+            plt.imread(str(tmp_path / 'a_print.png')).shape
+            == plt.imread(str(tmp_path / 'b_print.png')).shape
+        )
+        plt.close(fig)
+        prettypyplot.use_style()
+
+
+def test_savefig_without_pyplot(tmp_path):
+    """Test rendering figures created without pyplot on several threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from matplotlib.figure import Figure
+
+    def render(idx):
+        fig = Figure()
+        axs = fig.subplots(2, 2)
+        prettypyplot.plot(np.arange(10), ax=axs[0, 0], label='line')
+        prettypyplot.legend(ax=axs[0, 0], outside='top')
+        prettypyplot.hide_empty_axes(fig=fig)
+        prettypyplot.label_outer(fig=fig)
+        im = prettypyplot.imshow(np.eye(4), ax=axs[0, 1])
+        prettypyplot.colorbar(im, label='value')
+        prettypyplot.grid(ax=axs[0, 0])
+        prettypyplot.figtext(0.5, 0.5, 'text', fig=fig, contour=True)
+        prettypyplot.subplot_labels(fig=fig, xlabel='x', ylabel='y')
+        prettypyplot.savefig(str(tmp_path / 'fig{0}.png'.format(idx)), fig=fig)
+        return prettypyplot.savefig_bytes(fig)
+
+    plt.close('all')
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        images = list(executor.map(render, range(4)))
+    assert not plt.get_fignums()
+    assert len(set(images)) == 1
+    assert (tmp_path / 'fig3.png').exists()
+
+
+def test_savefig_file_object():
+    """Test saving figures to file-like objects."""
+    fig, ax = plt.subplots()
+    ax.plot(np.arange(10))
+    buffer = BytesIO()
+    with plt.rc_context({'savefig.format': 'png'}):
+        prettypyplot.savefig(buffer)
+    assert buffer.getvalue().startswith(b'\x89PNG')
+
+    with pytest.raises(ValueError):
+        prettypyplot.savefig(BytesIO(), format=['png', 'pdf'])
+    with pytest.raises(ValueError):
+        prettypyplot.savefig(BytesIO(), format='png', modes=['print'])
+    plt.close(fig)
+
+
+def test_to_array(tmp_path):
+    """Test rendering the figure into arrays."""
+    fig, ax = plt.subplots(dpi=50)
+    ax.plot(np.arange(10))
+
+    pixels = prettypyplot.to_array(fig)
+    assert pixels.dtype == np.uint8
+    assert pixels.shape[2] == 4
+    with plt.rc_context({'savefig.dpi': 'figure'}):
+        prettypyplot.savefig(str(tmp_path / 'fig.png'))
+    np.testing.assert_array_equal(
+        pixels,
+        (plt.imread(str(tmp_path / 'fig.png')) * 255).round(),
+    )
+
+    # view on the renderer buffer
+    assert not pixels.flags.owndata
+    assert prettypyplot.to_array(fig, copy=True).flags.owndata
+
+    out = np.empty_like(pixels)
+    assert prettypyplot.to_array(fig, out=out) is out
+    np.testing.assert_array_equal(out, pixels)
+
+    assert prettypyplot.to_array(fig, dpi=100).shape[0] == 2 * pixels.shape[0]
+    with pytest.raises(ValueError):
+        prettypyplot.to_array(fig, out=out[1:])
+    plt.close(fig)
+
+
+def test_savefig_modes(tmp_path):
+    """Test saving variants of a figure in multiple modes."""
+    with plt.rc_context():
+        prettypyplot.use_style(mode='print')
+        fig, ax = plt.subplots()
+        (line,) = ax.plot(np.arange(10), marker='o')
+        scatter = ax.scatter(np.arange(10), np.arange(10))
+        label = ax.set_xlabel('x')
+        tick = ax.xaxis.majorTicks[0]
+
+        params = (
+            line.get_linewidth(),
+            line.get_markersize(),
+            scatter.get_sizes()[0],
+            label.get_fontsize(),
+            tick.tick1line.get_markersize(),
+            tick.label1.get_fontsize(),
+            ax.spines['left'].get_linewidth(),
+        )
+        rc = {key: plt.rcParams[key] for key in ('font.size', 'lines.linewidth')}
+
+        with prettypyplot.pyplot._mode_context(fig, prettypyplot.style.Mode.BEAMER):
+            assert line.get_linewidth() == pytest.approx(params[0] * 4 / 1.5)
+            assert scatter.get_sizes()[0] == pytest.approx(params[2] * (4 / 1.5) ** 2)
+            assert label.get_fontsize() == pytest.approx(params[3] * 28 / 12)
+            assert tick.tick1line.get_markersize() == pytest.approx(params[4] * 4 / 1.7)
+            assert plt.rcParams['font.size'] == 28
+
+            # all ticks are scaled only once
+            fig.canvas.draw()
+            fontsizes = [tick.label1.get_fontsize() for tick in ax.xaxis.majorTicks]
+            assert fontsizes == pytest.approx([params[5] * 28 / 12] * len(fontsizes))
+
+        prettypyplot.savefig(
+            str(tmp_path / 'fig'),
+            format=['pdf', 'png'],
+            modes=['print', 'beamer'],
+        )
+        for fname in ('fig_print.pdf', 'fig_print.png', 'fig_beamer.pdf'):
+            assert (tmp_path / fname).exists()
+        assert (
+            plt.imread(str(tmp_path / 'fig_beamer.png')).shape[0]
+            > plt.imread(str(tmp_path / 'fig_print.png')).shape[0]
+        )
+
+        # figure and rcParams are restored
+        assert params == (
+            line.get_linewidth(),
+            line.get_markersize(),
+            scatter.get_sizes()[0],
+            label.get_fontsize(),
+            tick.tick1line.get_markersize(),
+            tick.label1.get_fontsize(),
+            ax.spines['left'].get_linewidth(),
+        )
+        assert rc == {key: plt.rcParams[key] for key in rc}
+        assert prettypyplot.MODE is prettypyplot.style.Mode.PRINT
+        plt.close(fig)
+        prettypyplot.use_style()
+
+
+@pytest.mark.parametrize(
+    'fname, fmt, reffname',
+    (
+        ('fig.pdf', 'pdf', 'fig_print.pdf'),
+        ('fig.v1.png', 'png', 'fig.v1_print.png'),
+        ('fig', 'png', 'fig_print'),
+    ),
+)
+def test__mode_fname(fname, fmt, reffname):
+    """Test appending the mode to filenames."""
+    mode = prettypyplot.style.Mode.PRINT
+    assert prettypyplot.pyplot._mode_fname(fname, fmt, mode) == reffname
+
+
 @pytest.mark.mpl_image_compare(remove_text=True)
 @pytest.mark.parametrize(
     'data, style, kwargs',
@@ -7,8 +7,13 @@ All rights reserved.
 
 """
 
+import asyncio
+import os
+import threading
+
 import numpy as np
 import pytest
+from matplotlib import pyplot as plt
 
 import prettypyplot
 
@@ -33,6 +38,25 @@ def test_parse__figratio(figratio, refratio, error):
             prettypyplot.style._parse_figratio(figratio)
 
 
+@pytest.mark.parametrize(
+    'profile, refprofile, error',
+    [
+        ('draft', prettypyplot.style.Profile.DRAFT, None),
+        ('WEB', prettypyplot.style.Profile.WEB, None),
+        (prettypyplot.style.Profile.PRINT, prettypyplot.style.Profile.PRINT, None),
+        ('error', None, ValueError),
+        (None, None, ValueError),
+    ],
+)
+def test_parse__profile(profile, refprofile, error):
+    """Test parsing export profile."""
+    if error is None:
+        assert prettypyplot.style._parse_profile(profile) is refprofile
+    else:
+        with pytest.raises(error):
+            prettypyplot.style._parse_profile(profile)
+
+
 @pytest.mark.parametrize(
     'figsize, figratio, refsize, error',
     [
@@ -85,3 +109,286 @@ def test_use_stlyle(kwargs, error):
     else:
         with pytest.raises(error):
             prettypyplot.use_style(**kwargs)
+
+
+@pytest.mark.parametrize(
+    'path',
+    (
+        'stylelib/default.mplstyle',
+        'stylelib/minimal.mplstyle',
+        'stylelib/latex.mplstyle',
+        'stylelib/mathtext.mplstyle',
+    ),
+)
+def test__load_style(path):
+    """Test that style files are parsed once and match matplotlib."""
+    rc = prettypyplot.style._load_style(path)
+    assert rc is prettypyplot.style._load_style(path)
+
+    with plt.rc_context():
+        plt.style.use(os.path.join(os.path.dirname(prettypyplot.style.__file__), path))
+        assert all(plt.rcParams[key] == val for key, val in rc.items())
+
+
+@pytest.mark.parametrize(
+    'kwargs, refparams, error',
+    (
+        (
+            {'latex': 'fast'},
+            {'text.usetex': False, 'mathtext.fontset': 'cm', 'font.family': ['serif']},
+            None,
+        ),
+        (
+            {'latex': 'fast', 'sf': True},
+            {'mathtext.fontset': 'stixsans', 'font.family': ['sans-serif']},
+            None,
+        ),
+        ({'latex': 'slow'}, None, ValueError),
+    ),
+)
+def test_use_style_latex(kwargs, refparams, error):
+    """Test the mathtext based LaTeX look-alike."""
+    with plt.rc_context():
+        if error is None:
+            prettypyplot.use_style(**kwargs)
+            for key, val in refparams.items():
+                assert plt.rcParams[key] == val
+        else:
+            with pytest.raises(error):
+                prettypyplot.use_style(**kwargs)
+        prettypyplot.use_style()
+
+
+def test_use_style_changed_params():
+    """Test that only differing rcParams are written."""
+    with plt.rc_context():
+        prettypyplot.use_style(colors='macaw')
+        assert prettypyplot.use_style(colors='macaw') == 0
+
+        n_changed = prettypyplot.update_style(mode='print')
+        assert n_changed > 0
+        assert prettypyplot.update_style(mode='print') == 0
+
+        assert prettypyplot.use_style(style='none') > 0
+        assert prettypyplot.use_style(style='none') == 0
+        prettypyplot.use_style()
+
+
+@pytest.mark.parametrize(
+    'val, ref, refequal',
+    (
+        (1, 1, True),
+        ('a', 'b', False),
+        (np.arange(3), np.arange(3), True),
+        (np.arange(3), np.arange(1, 4), False),
+        (
+            plt.cycler(color=np.ones((2, 3))),
+            plt.cycler(color=np.ones((2, 3))),
+            True,
+        ),
+        (
+            plt.cycler(color=np.ones((2, 3))),
+            plt.cycler(color=np.zeros((2, 3))),
+            False,
+        ),
+    ),
+)
+def test__rc_equal(val, ref, refequal):
+    """Test comparing rcParams values."""
+    assert prettypyplot.style._rc_equal(val, ref) == refequal
+
+
+def test_style_context():
+    """Test switching style and mode temporarily."""
+    with plt.rc_context():
+        prettypyplot.use_style(mode='print', colors='macaw')
+        rc_before = plt.rcParams.copy()
+        style_dict = prettypyplot.STYLE_DICT.copy()
+        assert plt.rcParams['font.size'] == 12
+
+        with prettypyplot.style_context(mode='beamer'):
+            assert prettypyplot.MODE is prettypyplot.style.Mode.BEAMER
+            assert plt.rcParams['font.size'] == 28
+            assert plt.rcParams['image.cmap'] == 'macaw'
+        with prettypyplot.style_context(style='none'):
+            assert prettypyplot.STYLE is prettypyplot.style.Style.NONE
+            assert plt.rcParams['font.size'] == 12
+
+        assert prettypyplot.MODE is prettypyplot.style.Mode.PRINT
+        assert prettypyplot.STYLE is prettypyplot.style.Style.DEFAULT
+        assert prettypyplot.STYLE_DICT == style_dict
+        assert all(
+            prettypyplot.style._rc_equal(plt.rcParams[key], rc_before[key])
+            for key in prettypyplot.style._rc_keys()
+        )
+
+        # snapshots are compiled only once
+        snapshot = prettypyplot.style._rc_snapshot(
+            prettypyplot.style.Style.DEFAULT,
+            prettypyplot.style.Mode.BEAMER,
+            prettypyplot.STYLE_DICT,
+        )
+        with prettypyplot.style_context(mode='beamer'):
+            assert snapshot is prettypyplot.style._rc_snapshot(
+                prettypyplot.style.Style.DEFAULT,
+                prettypyplot.style.Mode.BEAMER,
+                prettypyplot.STYLE_DICT,
+            )
+
+        with pytest.raises(ValueError):
+            with prettypyplot.style_context(mode='beamer'):
+                raise ValueError
+        assert prettypyplot.MODE is prettypyplot.style.Mode.PRINT
+        assert plt.rcParams['font.size'] == 12
+        prettypyplot.use_style()
+
+
+def test_style_context_user_rc():
+    """Test that rcParams changed after use_style are kept."""
+    with plt.rc_context():
+        prettypyplot.use_style(mode='print')
+        plt.rcParams['savefig.dpi'] = 50
+        plt.rcParams['lines.linewidth'] = 5
+        with prettypyplot.style_context(mode='beamer'):
+            assert plt.rcParams['savefig.dpi'] == 50
+            assert plt.rcParams['font.size'] == 28
+            # parameters set by the mode are overwritten
+            assert plt.rcParams['lines.linewidth'] == 6
+        assert plt.rcParams['savefig.dpi'] == 50
+        assert plt.rcParams['lines.linewidth'] == 5
+        prettypyplot.use_style()
+
+
+def test_style_context_local():
+    """Test that style_context is local to threads and asyncio tasks."""
+    Mode = prettypyplot.style.Mode
+    barrier = threading.Barrier(2)
+    modes = {}
+
+    def worker(mode):
+        with prettypyplot.style_context(mode=mode):
+            barrier.wait()
+            modes[mode] = prettypyplot.MODE
+            barrier.wait()
+
+    with plt.rc_context():
+        prettypyplot.use_style()
+        threads = [
+            threading.Thread(target=worker, args=(mode,))
+            for mode in ('print', 'beamer')
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert modes == {'print': Mode.PRINT, 'beamer': Mode.BEAMER}
+        assert prettypyplot.MODE is Mode.DEFAULT
+
+        async def task(mode):
+            with prettypyplot.style_context(mode=mode):
+                await asyncio.sleep(0)
+                return prettypyplot.MODE
+
+        async def main():
+            return await asyncio.gather(task('print'), task('beamer'))
+
+        assert asyncio.run(main()) == [Mode.PRINT, Mode.BEAMER]
+
+        # threads outside of style_context share the global state
+        prettypyplot.use_style(mode='poster')
+        thread = threading.Thread(
+            target=lambda: modes.update(thread=prettypyplot.MODE),
+        )
+        thread.start()
+        thread.join()
+        assert modes['thread'] is Mode.POSTER
+        prettypyplot.use_style()
+
+
+def test_style_context_tasks():
+    """Test that tasks of the same context do not share style updates."""
+    Mode = prettypyplot.style.Mode
+
+    async def update(updated):
+        prettypyplot.update_style(mode='poster')
+        updated.set()
+        return prettypyplot.MODE
+
+    async def read(updated):
+        await updated.wait()
+        return prettypyplot.MODE
+
+    async def main():
+        updated = asyncio.Event()
+        return await asyncio.gather(update(updated), read(updated))
+
+    with plt.rc_context():
+        prettypyplot.use_style()
+        with prettypyplot.style_context(mode='print'):
+            assert asyncio.run(main()) == [Mode.POSTER, Mode.PRINT]
+            assert prettypyplot.MODE is Mode.PRINT
+        assert prettypyplot.MODE is Mode.DEFAULT
+
+
+def test_style_context_interleaved():
+    """Test that rcParams are restored if tasks exit in a different order."""
+    with plt.rc_context():
+        prettypyplot.use_style()
+        rc = dict(plt.rcParams)
+        fontsizes = {}
+
+        async def task(mode, entered, exit_event):
+            with prettypyplot.style_context(mode=mode):
+                entered.set()
+                await exit_event.wait()
+            fontsizes[mode] = plt.rcParams['font.size']
+
+        async def main():
+            events = [asyncio.Event() for _ in range(4)]
+            tasks = [
+                asyncio.create_task(task('print', events[0], events[2])),
+                asyncio.create_task(task('beamer', events[1], events[3])),
+            ]
+            await events[0].wait()
+            await events[1].wait()
+
+            # first task exits while the second one is still active
+            events[2].set()
+            await tasks[0]
+            events[3].set()
+            await tasks[1]
+
+        asyncio.run(main())
+        assert fontsizes['print'] == 28
+        assert dict(plt.rcParams) == rc
+        assert not prettypyplot.style._RC_STACK
+
+
+def test_style_thread_safety():
+    """Test updating the style and registering colors from many threads."""
+    n_threads = 8
+    barrier = threading.Barrier(n_threads)
+    errors = []
+
+    def worker(idx):
+        barrier.wait()
+        try:
+            prettypyplot.load_cmaps()
+            prettypyplot.load_colors()
+            prettypyplot.update_style(ncs=idx + 1)
+            plt.get_cmap('macaw_r')
+        except Exception as error:
+            errors.append(error)
+
+    with plt.rc_context():
+        prettypyplot.use_style()
+        threads = [
+            threading.Thread(target=worker, args=(idx,)) for idx in range(n_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert prettypyplot.STYLE_DICT['ncs'] in range(1, n_threads + 1)
+        prettypyplot.use_style()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Tests for the tex module.
+
+BSD 3-Clause License
+Copyright (c) 2020-2021, Daniel Nagel
+All rights reserved.
+
+"""
+
+import shutil
+
+import pytest
+from matplotlib import pyplot as plt
+
+from prettypyplot import tex
+
+has_latex = shutil.which('latex') is not None and shutil.which('dvipng') is not None
+
+
+@pytest.fixture
+def tex_cache(tmp_path):
+    """Use temporary LaTeX cache."""
+    directory = tex.get_tex_cache()
+    tex.set_tex_cache(tmp_path / 'tex.cache')
+    yield tmp_path / 'tex.cache'
+    tex.set_tex_cache(directory)
+
+
+def test_set_tex_cache(tex_cache):
+    """Test setting the cache directory."""
+    assert tex_cache.is_dir()
+    assert tex.get_tex_cache() == tex_cache
+
+
+def test__collect_tex():
+    """Test collecting all strings of a figure using usetex."""
+    with plt.rc_context({'text.usetex': True}):
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [0, 1])
+        ax.set_xlabel('time $t$\nin s')
+        ax.set_title('invisible').set_visible(False)
+        ax.text(0, 0, 'no tex', usetex=False)
+        sources = tex._collect_tex(fig)
+
+    texts = {source for source, _ in sources}
+    assert {'time $t$', 'in s', 'lp'} <= texts
+    assert not {'invisible', 'no tex'} & texts
+    # tick labels are included
+    assert len(texts) > 4
+    plt.close(fig)
+
+
+def test_warmup_tex_no_usetex(tex_cache):
+    """Test that figures without usetex are skipped."""
+    fig, ax = plt.subplots()
+    ax.set_xlabel('label')
+    assert tex.warmup_tex(fig) == 0
+    plt.close(fig)
+
+
+@pytest.mark.skipif(not has_latex, reason='requires latex and dvipng')
+def test_warmup_tex(tex_cache):
+    """Test that strings are compiled only once."""
+    with plt.rc_context({'text.usetex': True}):
+        fig, ax = plt.subplots()
+        ax.set_xlabel('time $t$')
+        assert tex.warmup_tex(fig, dpi=100) > 0
+        assert tex.warmup_tex(fig, dpi=100) == 0
+        plt.close(fig)
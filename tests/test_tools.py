@@ -77,6 +77,19 @@ def test_parse_axes():
     assert ax is argsax[1]
 
 
+def test_gcf():
+    """Ensure, that gcf returns the given or the current figure."""
+    fig, ax = plt.subplots()
+    assert prettypyplot.tools.gcf(None) is plt.gcf()
+    assert prettypyplot.tools.gcf(fig) is fig
+    for arg in (ax, 'fig', 1):
+        with pytest.raises(TypeError):
+            prettypyplot.tools.gcf(arg)
+        with pytest.raises(TypeError):
+            prettypyplot.tools.gca(None, fig=arg)
+    plt.close(fig)
+
+
 def test_gca():
     """Ensure, that gca returns always an axes instance."""
     fig, ax = plt.subplots()
@@ -95,6 +108,17 @@ def test_get_axes():
         prettypyplot.tools.get_axes(fig)
 
 
+def test_figure_without_pyplot():
+    """Ensure, that explicit figures do not touch the pyplot state."""
+    plt.close('all')
+    fig = mpl.figure.Figure()
+    axs = fig.subplots(2)
+    assert prettypyplot.tools.gcf(fig) is fig
+    assert prettypyplot.tools.gca(None, fig=fig) is fig.gca()
+    assert list(prettypyplot.tools.get_axes(None, fig=fig)) == list(axs)
+    assert not plt.get_fignums()
+
+
 @pytest.mark.parametrize(
     'cmap, is_discrete',
     [